@@ -149,6 +149,11 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
         self.add(CmdBoonFulfill)
         self.add(CmdBoonAdmin)
 
+        # Add Roll Log commands
+        from rolls.commands import CmdRollLog
+
+        self.add(CmdRollLog)
+
         # Add V5 Social commands (Coteries)
         from commands.v5.social import CmdCoterie, CmdSocial
 
@@ -87,11 +87,12 @@ class CmdFeed(default_cmds.MuxCommand):
             hunger_reduction = 1 + (result.total_successes - 2) // 2  # 1-3 based on margin
             hunger_reduction = min(hunger_reduction, 3)  # Cap at 3
 
-            new_hunger = blood_utils.reduce_hunger(self.caller, hunger_reduction)
+            with self.caller.batch():
+                new_hunger = blood_utils.reduce_hunger(self.caller, hunger_reduction)
 
-            # Set resonance
-            if resonance:
-                blood_utils.set_resonance(self.caller, resonance.capitalize(), intensity=1)
+                # Set resonance
+                if resonance:
+                    blood_utils.set_resonance(self.caller, resonance.capitalize(), intensity=1)
 
             # Format message
             message = f"|gFeeding successful!|n\n\n"
@@ -8,6 +8,7 @@ Commands for combat resolution:
 """
 
 from evennia import Command
+from world.character_state import character_batch
 from .utils.combat_utils import (
     calculate_attack,
     apply_damage,
@@ -223,7 +224,8 @@ class CmdDamage(Command):
             return
 
         # Apply damage
-        result = apply_damage(target, damage_amount, damage_type.lower())
+        with character_batch(target):
+            result = apply_damage(target, damage_amount, damage_type.lower())
 
         if not result['success']:
             caller.msg(f"{BLOOD_RED}Error:{RESET} {result['message']}")
@@ -336,7 +338,8 @@ class CmdHeal(Command):
             return
 
         # Apply healing
-        result = heal_damage(target, heal_amount, damage_type.lower())
+        with character_batch(target):
+            result = heal_damage(target, heal_amount, damage_type.lower())
 
         if not result['success']:
             caller.msg(f"{BLOOD_RED}Error:{RESET} {result['message']}")
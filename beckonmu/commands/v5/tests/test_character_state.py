@@ -0,0 +1,285 @@
+"""
+Tests for the Compact Character State
+
+Validates that CharacterState rebuilds the legacy db dictionaries exactly,
+that character.db views write back into it, that legacy characters
+convert (and revert) cleanly, and that character.batch() saves once.
+"""
+
+import unittest
+from unittest.mock import patch
+from evennia.typeclasses.attributes import Attribute
+from evennia.utils.test_resources import EvenniaTest
+from commands.v5.utils.xp_utils import spend_xp_on_willpower
+from world.character_state import (
+    MISSING, STATE_ATTRIBUTE, CharacterState, StateConversionError, convert_character, revert_character,
+)
+
+
+def make_legacy_sections():
+    """Legacy db dictionaries, including data outside the compact layout."""
+    return {
+        'stats': {
+            'attributes': {
+                'physical': {'strength': 3, 'dexterity': 2, 'stamina': 3},
+                'social': {'charisma': 2, 'manipulation': 2, 'composure': 3},
+                'mental': {'intelligence': 4, 'wits': 3, 'resolve': 3},
+            },
+            'skills': {'brawl': 3, 'occult': 1},
+            'disciplines': {'auspex': {'level': 2, 'powers': ['Heightened Senses']}},
+            'specialties': {'occult': ['Ghosts']},
+        },
+        'vampire': {
+            'clan': 'Tremere', 'generation': 12, 'blood_potency': 1, 'hunger': 2, 'humanity': 7,
+            'predator_type': None, 'bane': 'Blood Bond', 'sire': 'Unknown',
+        },
+        'pools': {'health': 6, 'willpower': 5, 'superficial_damage': 0, 'aggravated_damage': 1},
+        'humanity_data': {'convictions': ['Never harm a child'], 'touchstones': [], 'stains': 0},
+        'advantages': {'backgrounds': {'herd': 2}, 'merits': {}, 'flaws': {}},
+        'experience': {'total_earned': 10, 'current': 4, 'history': [{'type': 'earned', 'amount': 10}]},
+        'effects': [],
+        'active_effects': [{'name': 'Heightened Senses', 'expires': 1700000000.5}],
+    }
+
+
+class TestCharacterState(unittest.TestCase):
+    """Test packing legacy dictionaries into a state and back."""
+
+    def test_round_trip(self):
+        """Test every section survives from_legacy, dumps and loads."""
+        sections = make_legacy_sections()
+        state = CharacterState.loads(CharacterState.from_legacy(sections).dumps())
+        self.assertEqual(state.to_legacy(), sections)
+
+    def test_typed_fields(self):
+        """Test ratings and vitals are read without rebuilding dictionaries."""
+        state = CharacterState.loads(CharacterState.from_legacy(make_legacy_sections()).dumps())
+        self.assertEqual(state.rating('intelligence'), 4)
+        self.assertEqual(state.rating('brawl'), 3)
+        self.assertIsNone(state.rating('athletics'))
+        self.assertEqual(state.hunger, 2)
+        self.assertEqual(state.clan, 'Tremere')
+        self.assertIsNone(state.predator_type)
+        self.assertIs(state.compulsion, MISSING)
+        self.assertEqual(state.aggravated_damage, 1)
+
+    def test_unusual_data_kept_as_is(self):
+        """Test data that doesn't fit the compact layout still round-trips."""
+        sections = {
+            'stats': {'attributes': {'physical': {'strength': 300, 'luck': 2}}, 'skills': {}},
+            'vampire': {'hunger': '2', 'generation': 2 ** 40},
+            'pools': ['not', 'a', 'dict'],
+        }
+        state = CharacterState.loads(CharacterState.from_legacy(sections).dumps())
+        self.assertEqual(state.to_legacy(), sections)
+        self.assertIsNone(state.rating('strength'))
+
+    def test_smaller_than_legacy(self):
+        """Test the state stores smaller than the separate dictionaries."""
+        import pickle
+        sections = make_legacy_sections()
+        legacy_size = sum(len(pickle.dumps(value)) for value in sections.values())
+        self.assertLess(len(CharacterState.from_legacy(sections).dumps()), legacy_size)
+
+
+class TestCharacterStateViews(EvenniaTest):
+    """Test character.db serves and saves the legacy sections through the state."""
+
+    def test_new_character_uses_state(self):
+        """Test new characters store their V5 data in the state attribute."""
+        self.assertTrue(self.char1.attributes.has(STATE_ATTRIBUTE))
+        self.assertFalse(self.char1.attributes.has('stats'))
+        self.assertEqual(self.char1.db.stats['attributes']['physical']['strength'], 1)
+        self.assertEqual(self.char1.get_state().rating('strength'), 1)
+
+    def test_in_place_edit_saves(self):
+        """Test nested edits to a view are written back into the state."""
+        self.char1.db.stats['attributes']['physical']['strength'] = 4
+        self.char1.db.vampire['hunger'] = 3
+        self.char1.db.experience['history'].append({'type': 'earned', 'amount': 2})
+
+        self.assertEqual(self.char1.get_state().rating('strength'), 4)
+        self.assertEqual(self.char1.get_state().hunger, 3)
+        self.assertEqual(len(self.char1.db.experience['history']), 1)
+
+    def test_assign_and_delete(self):
+        """Test assigning and deleting sections go through the state."""
+        self.char1.db.pools = {'health': 8, 'willpower': 4}
+        self.assertEqual(self.char1.get_state().health, 8)
+        self.assertFalse(self.char1.attributes.has('pools'))
+
+        del self.char1.db.effects
+        self.assertIsNone(self.char1.db.effects)
+        self.assertNotIn('effects', self.char1.get_state().to_legacy())
+
+    def test_vital_write_keeps_section_pickles(self):
+        """Test a typed vital write doesn't re-pickle the untyped sections."""
+        self.char1.db.experience['history'].extend([{'type': 'earned', 'amount': 1}] * 50)
+        self.char1.db.vampire['sire'] = 'Unknown'
+        state = self.char1.get_state()
+        pickled = dict(state._pickled)
+
+        self.char1.db.pools['current_health'] = 1
+        self.char1.db.vampire['hunger'] = 4
+        self.assertIs(self.char1.get_state(), state)
+        for section, blob in pickled.items():
+            self.assertIs(state._pickled[section], blob)
+
+        self.char1.db.vampire['sire'] = 'Lodin'
+        self.assertIsNot(state._pickled.get('vampire'), pickled['vampire'])
+        loaded = CharacterState.loads(self.char1.attributes.get(STATE_ATTRIBUTE))
+        self.assertEqual((loaded.current_health, loaded.hunger), (1, 4))
+        self.assertEqual(loaded.get_section('vampire')['sire'], 'Lodin')
+
+    def test_reads_format_version_1(self):
+        """Test states saved in the first format still load."""
+        import pickle
+        import struct
+        from evennia.utils.dbserialize import to_pickle
+        from world import character_state
+
+        state = CharacterState.from_legacy(make_legacy_sections())
+        data = state.dumps()
+        # Rebuild the version 1 layout: one pickle of (strs, extras, raw)
+        strs = {name: getattr(state, name) for name in character_state.STR_VITALS
+                if getattr(state, name) is not MISSING}
+        fixed = character_state._HEADER.size + len(state.attributes) + len(state.skills) \
+            + character_state._VITALS.size
+        old = struct.pack('>B', 1) + data[1:fixed] + pickle.dumps(to_pickle((strs, state.extras, state.raw)))
+        self.assertEqual(CharacterState.loads(old).to_legacy(), make_legacy_sections())
+
+    def test_state_reloads_from_database(self):
+        """Test a fresh load of the attribute decodes the saved state."""
+        self.char1.db.vampire['clan'] = 'Brujah'
+        data = self.char1.attributes.get(STATE_ATTRIBUTE)
+        self.assertEqual(CharacterState.loads(data).clan, 'Brujah')
+
+
+class TestCharacterStateConversion(EvenniaTest):
+    """Test moving legacy characters onto the state and back."""
+
+    def setUp(self):
+        super().setUp()
+        # Put char1 back on the legacy dictionaries
+        revert_character(self.char1)
+        self.char1.attributes.remove('hunger')
+        self.sections = make_legacy_sections()
+        for section, value in self.sections.items():
+            self.char1.attributes.add(section, value)
+
+    def test_convert(self):
+        """Test conversion replaces the legacy attributes with the state."""
+        before, after = convert_character(self.char1)
+
+        self.assertLess(after, before)
+        self.assertFalse(self.char1.attributes.has('stats'))
+        self.assertEqual(self.char1.get_state().to_legacy(), self.sections)
+        self.assertEqual(self.char1.db.vampire['sire'], 'Unknown')
+
+    def test_dry_run_changes_nothing(self):
+        """Test a dry run leaves the legacy attributes in place."""
+        convert_character(self.char1, dry_run=True)
+        self.assertIsNone(self.char1.get_state())
+        self.assertEqual(self.char1.db.stats['skills']['brawl'], 3)
+
+    def test_convert_twice_refused(self):
+        """Test an already converted character is reported, not reconverted."""
+        convert_character(self.char1)
+        with self.assertRaises(StateConversionError):
+            convert_character(self.char1)
+
+    def test_revert(self):
+        """Test reverting restores the legacy attributes."""
+        convert_character(self.char1)
+        revert_character(self.char1)
+
+        self.assertIsNone(self.char1.get_state())
+        self.assertEqual(self.char1.attributes.get('vampire'), self.sections['vampire'])
+        self.assertEqual(self.char1.db.stats['skills']['brawl'], 3)
+
+
+def count_saves():
+    """Patch Attribute.save; the mock's calls give the saved Attributes."""
+    return patch.object(Attribute, 'save', autospec=True, side_effect=Attribute.save)
+
+
+def saved_keys(save):
+    return sorted(call.args[0].db_key for call in save.call_args_list)
+
+
+class TestCharacterBatch(EvenniaTest):
+    """Test character.batch() holds writes back and saves them once."""
+
+    def test_writes_deferred_until_exit(self):
+        """Test several changes are visible inside the batch but stored on exit."""
+        stored = self.char1.attributes.get(STATE_ATTRIBUTE)
+        with self.char1.batch():
+            self.char1.db.pools['superficial_damage'] = 2
+            self.char1.db.pools['current_health'] = 1
+            self.char1.db.vampire['hunger'] = 3
+            self.char1.db.last_fed = 3
+            self.assertEqual(self.char1.db.pools['superficial_damage'], 2)
+            self.assertEqual(self.char1.db.last_fed, 3)
+            self.assertIs(self.char1.attributes.get(STATE_ATTRIBUTE), stored)
+            self.assertIsNone(self.char1.attributes.get('last_fed'))
+
+        state = CharacterState.loads(self.char1.attributes.get(STATE_ATTRIBUTE))
+        self.assertEqual((state.superficial_damage, state.current_health, state.hunger), (2, 1, 3))
+        self.assertEqual(self.char1.attributes.get('last_fed'), 3)
+
+    def test_one_write_per_attribute(self):
+        """Test each touched Attribute is saved once."""
+        with count_saves() as save:
+            with self.char1.batch():
+                for _ in range(5):
+                    self.char1.db.pools['aggravated_damage'] += 1
+                self.char1.db.experience['current'] = 10
+                self.char1.db.last_fed = 2
+                self.char1.db.last_fed = 4
+        self.assertEqual(saved_keys(save), ['last_fed', STATE_ATTRIBUTE])
+        self.assertEqual(self.char1.db.pools['aggravated_damage'], 5)
+        self.assertEqual(self.char1.db.last_fed, 4)
+
+    def test_nested_batches_write_once(self):
+        """Test an inner batch leaves the writing to the outer one."""
+        with count_saves() as save:
+            with self.char1.batch():
+                with self.char1.batch():
+                    self.char1.db.pools['willpower'] = 6
+                self.assertEqual(save.call_count, 0)
+        self.assertEqual(saved_keys(save), [STATE_ATTRIBUTE])
+        self.assertEqual(self.char1.get_state().willpower, 6)
+
+    def test_error_discards_changes(self):
+        """Test a failing block leaves the stored data as it was."""
+        with self.assertRaises(ValueError):
+            with self.char1.batch():
+                self.char1.db.pools['current_health'] = 0
+                self.char1.db.last_fed = 5
+                raise ValueError
+
+        self.assertNotEqual(self.char1.db.pools['current_health'], 0)
+        self.assertIsNone(self.char1.attributes.get('last_fed'))
+
+    def test_legacy_character_batched(self):
+        """Test characters still on the legacy dictionaries are batched too."""
+        revert_character(self.char1)
+        with patch.object(self.char1.attributes, 'add', wraps=self.char1.attributes.add) as add:
+            with self.char1.batch():
+                self.char1.db.pools['superficial_damage'] = 1
+                self.char1.db.pools['aggravated_damage'] = 1
+        self.assertEqual([call.args[0] for call in add.call_args_list], ['pools'])
+        self.assertEqual(self.char1.attributes.get('pools')['aggravated_damage'], 1)
+
+    def test_xp_spend_batched(self):
+        """Test an XP spend touching pools and experience saves the state once."""
+        self.char1.db.experience['current'] = 50
+        with count_saves() as save:
+            success, _ = spend_xp_on_willpower(self.char1)
+        self.assertTrue(success)
+        self.assertEqual(saved_keys(save), [STATE_ATTRIBUTE])
+        self.assertEqual(self.char1.get_state().current_willpower, self.char1.db.pools['willpower'])
+
+
+if __name__ == '__main__':
+    unittest.main()
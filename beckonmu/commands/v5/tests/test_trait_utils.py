@@ -6,8 +6,10 @@ Validates that the internal bridge functions work correctly.
 """
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from evennia.utils.test_resources import EvenniaTest
 from commands.v5.utils import trait_utils
+from commands.v5.utils.xp_utils import spend_xp_on_discipline
 
 
 class TestTraitUtilsBridgeFunctions(unittest.TestCase):
@@ -159,5 +161,71 @@ class TestGetDicePool(unittest.TestCase):
         self.assertEqual(pool, 6, "Should add +1 for specialty (3+2+1=6)")
 
 
+class TestTraitSnapshot(EvenniaTest):
+    """Test the per-character trait snapshot cache."""
+
+    def setUp(self):
+        super().setUp()
+        trait_utils._snapshots.clear()
+
+    def tearDown(self):
+        trait_utils._snapshots.clear()
+        super().tearDown()
+
+    def test_reads_reuse_snapshot(self):
+        """Test repeated reads come from one snapshot without re-reading db.stats."""
+        self.char1.db.stats['attributes']['physical']['strength'] = 3
+        snapshot = trait_utils.get_trait_snapshot(self.char1)
+        self.assertEqual(snapshot.values['strength'], 3)
+
+        with patch.object(trait_utils, '_build_trait_values') as build:
+            self.assertEqual(trait_utils.get_trait_value(self.char1, 'Strength'), 3)
+            self.assertEqual(trait_utils.get_dice_pool(self.char1, 'strength', 'brawl'), 3)
+            build.assert_not_called()
+        self.assertIs(trait_utils.get_trait_snapshot(self.char1), snapshot)
+
+    def test_set_trait_value_writes_through(self):
+        """Test setters update the snapshot in place and bump its version."""
+        snapshot = trait_utils.get_trait_snapshot(self.char1)
+        version = snapshot.version
+
+        trait_utils.set_trait_value(self.char1, 'brawl', 4, category='skill')
+        trait_utils.set_trait_value(self.char1, 'herd', 2, category='background')
+
+        self.assertIs(trait_utils.get_trait_snapshot(self.char1), snapshot)
+        self.assertGreater(snapshot.version, version)
+        self.assertEqual(trait_utils.get_trait_value(self.char1, 'brawl'), 4)
+        self.assertEqual(trait_utils.get_trait_value(self.char1, 'herd'), 2)
+        self.assertEqual(self.char1.db.stats['skills']['physical']['brawl'], 4)
+
+    def test_xp_spend_writes_through(self):
+        """Test spending XP on a discipline updates the snapshot."""
+        self.char1.db.experience['current'] = 50
+        snapshot = trait_utils.get_trait_snapshot(self.char1)
+
+        success, _ = spend_xp_on_discipline(self.char1, 'auspex')
+
+        self.assertTrue(success)
+        self.assertIs(trait_utils.get_trait_snapshot(self.char1), snapshot)
+        self.assertEqual(trait_utils.get_trait_value(self.char1, 'auspex'), 1)
+
+    def test_direct_write_rebuilds_snapshot(self):
+        """Test writes that bypass the setters are still seen."""
+        snapshot = trait_utils.get_trait_snapshot(self.char1)
+        self.char1.db.stats['attributes']['mental']['wits'] = 5
+
+        rebuilt = trait_utils.get_trait_snapshot(self.char1)
+        self.assertIsNot(rebuilt, snapshot)
+        self.assertGreater(rebuilt.version, snapshot.version)
+        self.assertEqual(rebuilt.values['wits'], 5)
+
+    def test_delete_drops_snapshot(self):
+        """Test deleting a character forgets its snapshot."""
+        trait_utils.get_trait_snapshot(self.char2)
+        char_id = self.char2.id
+        self.char2.delete()
+        self.assertNotIn(char_id, trait_utils._snapshots)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for Character Vitals
+
+Validates that Hunger and the other vitals have one canonical value,
+are clamped, and send vital_changed whenever they change.
+"""
+
+import unittest
+from unittest.mock import patch
+from evennia.utils.test_resources import EvenniaTest
+from commands.v5.utils import blood_utils
+from dice import rouse_checker
+from world.character_state import convert_character, revert_character
+from world.vitals import vital_changed
+
+
+class TestCharacterVitals(EvenniaTest):
+    """Test character.vitals and the legacy Hunger locations."""
+
+    def setUp(self):
+        super().setUp()
+        self.changes = []
+        vital_changed.connect(self._record, dispatch_uid='test_vitals')
+
+    def tearDown(self):
+        vital_changed.disconnect(dispatch_uid='test_vitals')
+        super().tearDown()
+
+    def _record(self, sender, character, vital, old, new, **kwargs):
+        self.changes.append((character, vital, old, new))
+
+    def test_one_hunger(self):
+        """Test every Hunger location reads and writes the same value."""
+        self.char1.db.hunger = 3
+        self.assertEqual(self.char1.vitals.hunger, 3)
+        self.assertEqual(self.char1.db.vampire['hunger'], 3)
+        self.assertEqual(self.char1.hunger, 3)
+        self.assertFalse(self.char1.attributes.has('hunger'))
+
+        self.char1.db.vampire['hunger'] = 4
+        self.assertEqual(self.char1.db.hunger, 4)
+        self.assertEqual(blood_utils.get_hunger_level(self.char1), 4)
+        self.assertEqual(rouse_checker.get_hunger_level(self.char1), 4)
+
+    def test_set_clamps(self):
+        """Test values are clamped to the vital's range."""
+        self.assertEqual(self.char1.vitals.set('hunger', 9), 5)
+        self.assertEqual(self.char1.vitals.adjust('humanity', -20), 0)
+        self.assertEqual(self.char1.vitals.adjust('superficial_damage', -1), 0)
+
+    def test_changes_send_signal(self):
+        """Test vitals writes send vital_changed, and unchanged values don't."""
+        self.char1.vitals.hunger = 1
+        self.assertEqual(self.changes, [])
+
+        blood_utils.set_hunger_level(self.char1, 2)
+        self.assertEqual(self.changes, [(self.char1, 'hunger', 1, 2)])
+
+    def test_legacy_dictionary_writes_send_signal(self):
+        """Test edits through db.pools report the vitals they change."""
+        self.char1.db.pools['superficial_damage'] = 2
+        self.char1.db.pools = {'health': 7, 'current_health': 3}
+
+        self.assertEqual(self.changes, [
+            (self.char1, 'superficial_damage', 0, 2),
+            (self.char1, 'health', 3, 7),
+            (self.char1, 'superficial_damage', 2, 0),
+        ])
+
+    def test_rouse_check_updates_vitals(self):
+        """Test a failed Rouse check raises the canonical Hunger."""
+        rouse_checker.set_hunger_level(self.char1, 2)
+        with patch.object(rouse_checker, 'base_rouse_check', return_value={'roll': 3, 'success': False}), \
+                patch.object(rouse_checker, 'can_reroll_rouse', return_value=False):
+            result = rouse_checker.perform_rouse_check(self.char1)
+        self.assertEqual(result['hunger_after'], 3)
+        self.assertEqual(self.char1.vitals.hunger, 3)
+        self.assertEqual(self.char1.db.vampire['hunger'], 3)
+
+    def test_legacy_character(self):
+        """Test characters not yet on the state keep db.hunger in step."""
+        revert_character(self.char1)
+        self.char1.attributes.add('hunger', 4)
+        self.assertEqual(self.char1.vitals.hunger, 4)
+
+        self.char1.vitals.hunger = 2
+        self.assertEqual(self.char1.attributes.get('hunger'), 2)
+        self.assertEqual(self.char1.attributes.get('vampire')['hunger'], 2)
+
+    def test_conversion_keeps_legacy_hunger(self):
+        """Test converting a character folds the old db.hunger into the state."""
+        revert_character(self.char1)
+        self.char1.attributes.add('hunger', 4)
+        convert_character(self.char1)
+
+        self.assertFalse(self.char1.attributes.has('hunger'))
+        self.assertEqual(self.char1.vitals.hunger, 4)
+
+    def test_set_replaces_untyped_copy(self):
+        """Test a value that didn't fit the typed slot doesn't shadow a new one."""
+        state = self.char1.get_state()
+        state.set_section('vampire', {'hunger': '4', 'clan': 'Tremere'})
+        self.char1.save_state(state)
+
+        self.char1.vitals.hunger = 2
+        self.assertEqual(self.char1.vitals.hunger, 2)
+        self.assertEqual(self.char1.db.vampire, {'hunger': 2, 'clan': 'Tremere'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ Hunger, feeding, Blood Surge, and resonance.
 from typing import Dict, Any, Optional
 import time
 
+from world.vitals import get_vitals
+
 
 # Constants
 
@@ -29,8 +31,8 @@ def get_hunger_level(character) -> int:
     """
     Get character's current Hunger level.
 
-    Supports both new vampire data structure (character.db.vampire['hunger'])
-    and legacy structure (character.db.hunger).
+    Characters read it from their vitals (see world.vitals); other objects
+    from db.vampire['hunger'] or the legacy db.hunger.
 
     Args:
         character: Character object
@@ -38,6 +40,10 @@ def get_hunger_level(character) -> int:
     Returns:
         int: Hunger level (0-5), defaults to 1 if not set
     """
+    vitals = get_vitals(character)
+    if vitals is not None:
+        return vitals.hunger
+
     try:
         # Try new vampire data structure first
         vampire_data = getattr(character.db, 'vampire', None)
@@ -73,8 +79,8 @@ def set_hunger_level(character, hunger: int) -> int:
     """
     Set character's Hunger level.
 
-    Supports both new vampire data structure (character.db.vampire['hunger'])
-    and legacy structure (character.db.hunger).
+    Characters set it in their vitals (see world.vitals); other objects in
+    db.vampire['hunger'] or the legacy db.hunger.
 
     Args:
         character: Character object
@@ -83,6 +89,10 @@ def set_hunger_level(character, hunger: int) -> int:
     Returns:
         int: Actual Hunger level set (after clamping)
     """
+    vitals = get_vitals(character)
+    if vitals is not None:
+        return vitals.set('hunger', hunger)
+
     clamped_hunger = max(0, min(5, hunger))
 
     try:
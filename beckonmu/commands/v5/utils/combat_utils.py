@@ -10,7 +10,7 @@ This module provides functions for:
 """
 
 from world.v5_dice import roll_pool, DiceResult
-from .blood_utils import mend_damage
+from .blood_utils import get_hunger_level, mend_damage
 from .discipline_effects import get_active_effects
 from .trait_utils import get_trait_value
 from world.ansi_theme import BLOOD_RED, DARK_RED, RESET, GOLD, PALE_IVORY, SHADOW_GREY
@@ -51,7 +51,7 @@ def calculate_attack(attacker, defender, attack_pool_desc):
         total_pool += trait_value
 
     # Get attacker's hunger
-    hunger = attacker.db.vampire_stats.get("hunger", 0) if hasattr(attacker.db, "vampire_stats") else 0
+    hunger = get_hunger_level(attacker)
 
     # Calculate defender's defense
     defense = calculate_defense(defender)
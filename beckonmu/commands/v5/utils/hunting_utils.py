@@ -5,6 +5,7 @@ Handles hunting mechanics, prey selection, resonance determination, and complica
 """
 
 import random
+from world.character_state import character_batch
 from .blood_utils import get_blood_potency_bonus, get_hunger_level, reduce_hunger, set_resonance
 from .clan_utils import get_clan
 
@@ -216,14 +217,15 @@ def hunt_prey(character, location="street", skill_name=None, predator_type_bonus
     hunger_reduction = min(hunger_reduction, 3)  # Cap at 3
 
     old_hunger = get_hunger_level(character)
-    new_hunger = reduce_hunger(character, hunger_reduction)
-
-    # Set resonance from the prey
-    set_resonance(
-        character,
-        resonance_data["type"],
-        resonance_data["intensity"]
-    )
+    with character_batch(character):
+        new_hunger = reduce_hunger(character, hunger_reduction)
+
+        # Set resonance from the prey
+        set_resonance(
+            character,
+            resonance_data["type"],
+            resonance_data["intensity"]
+        )
 
     # Build narrative message
     message = f"You hunt in the {location} and find: {resonance_data['description']}.\n"
@@ -6,8 +6,172 @@ including attributes, skills, disciplines, and advantages.
 
 These functions provide a clean interface between commands and character data,
 with proper error handling and validation.
+
+Trait reads are served from a per-character snapshot: a flat name -> value
+map built once from db.stats and db.advantages. Every character.db access
+unpickles the whole nested Attribute, so walking attributes, skills,
+disciplines and backgrounds on each lookup was the main cost of building
+dice pools. The setters in this module (and the XP spend functions) update
+the snapshot as they write; any other write to db.stats or db.advantages
+is noticed on the next read, because saving an Attribute replaces its
+stored value, and the snapshot is rebuilt.
 """
 
+from collections.abc import Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+
+
+# ============================================================================
+# Trait Snapshot Cache
+# ============================================================================
+
+class TraitSnapshot:
+    """
+    Flattened view of one character's traits.
+
+    Attributes:
+        values: Read-only mapping of normalized trait name -> rating
+        version (int): Bumped on every rebuild or write-through update
+    """
+
+    __slots__ = ('values', 'version', '_values', '_sources')
+
+    def __init__(self, values, sources, version=0):
+        self._values = values
+        self.values = MappingProxyType(values)
+        self._sources = sources
+        self.version = version
+
+
+# Character id -> TraitSnapshot
+_snapshots = {}
+
+
+def _snapshot_sources(character):
+    """
+    Identify the stored stats and advantages values without unpickling them
+    (or, for characters on the compact state, the state's stats and
+    advantages sections).
+
+    Saving an Attribute (including in-place edits to its dict) replaces its
+    stored value, so a snapshot is current while these are the same objects.
+    """
+    get_state = getattr(character, "get_state", None)
+    state = get_state() if get_state else None
+    if state is not None:
+        return (state.section_token("stats"), state.section_token("advantages"))
+
+    stats = character.attributes.get("stats", return_obj=True)
+    advantages = character.attributes.get("advantages", return_obj=True)
+    return (
+        stats.db_value if stats is not None else None,
+        advantages.db_value if advantages is not None else None,
+    )
+
+
+def _sources_match(snapshot, sources):
+    """Whether a snapshot was built from (or kept up with) these stored values."""
+    return all(old is new for old, new in zip(snapshot._sources, sources))
+
+
+def _cacheable(character):
+    """Only saved characters (with a database id) keep a snapshot."""
+    return isinstance(getattr(character, 'id', None), int)
+
+
+def _build_trait_values(character):
+    """
+    Flatten db.stats and db.advantages into name -> rating.
+
+    Earlier sources win, matching the original lookup order: attributes,
+    skills, disciplines, then backgrounds.
+    """
+    values = {}
+    stats = character.db.stats
+    if isinstance(stats, Mapping):
+        for section in ('attributes', 'skills'):
+            groups = stats.get(section) or {}
+            for category in ['physical', 'social', 'mental']:
+                for name, rating in (groups.get(category) or {}).items():
+                    values.setdefault(name, rating)
+        for name, data in (stats.get('disciplines') or {}).items():
+            values.setdefault(name, data.get('level', 0))
+
+    advantages = character.db.advantages
+    if isinstance(advantages, Mapping):
+        for name, rating in (advantages.get('backgrounds') or {}).items():
+            values.setdefault(name, rating)
+
+    return values
+
+
+def _current_snapshot(character):
+    """The character's cached snapshot if it is still current, else None."""
+    snapshot = _snapshots.get(character.id)
+    if snapshot is not None and _sources_match(snapshot, _snapshot_sources(character)):
+        return snapshot
+    return None
+
+
+def get_trait_snapshot(character):
+    """
+    Get a character's flattened trait snapshot, building it if needed.
+
+    Args:
+        character: Character object
+
+    Returns:
+        TraitSnapshot: Snapshot whose .values maps normalized trait names
+        to ratings
+    """
+    if not _cacheable(character):
+        return TraitSnapshot(_build_trait_values(character), ())
+
+    sources = _snapshot_sources(character)
+    snapshot = _snapshots.get(character.id)
+    if snapshot is not None and _sources_match(snapshot, sources):
+        return snapshot
+
+    version = snapshot.version + 1 if snapshot is not None else 0
+    snapshot = TraitSnapshot(_build_trait_values(character), sources, version)
+    _snapshots[character.id] = snapshot
+    return snapshot
+
+
+@contextmanager
+def trait_snapshot_write(character):
+    """
+    Keep a character's snapshot current across a write to db.stats/db.advantages.
+
+    Record each trait value written in the yielded dict; on exit they are
+    applied to the snapshot, which is marked current again. Without this,
+    a write is still safe: the snapshot is simply rebuilt on the next read.
+
+    Args:
+        character: Character object
+
+    Yields:
+        dict: Normalized trait name -> new rating, filled in by the caller
+
+    Example:
+        >>> with trait_snapshot_write(char) as updates:
+        >>>     char.db.stats['disciplines']['auspex']['level'] = 3
+        >>>     updates['auspex'] = 3
+    """
+    snapshot = _current_snapshot(character) if _cacheable(character) else None
+    updates = {}
+    yield updates
+    if snapshot is not None:
+        snapshot._values.update(updates)
+        snapshot._sources = _snapshot_sources(character)
+        snapshot.version += 1
+
+
+def drop_trait_snapshot(character):
+    """Forget a character's snapshot (called when the character is deleted)."""
+    _snapshots.pop(getattr(character, 'id', None), None)
+
 
 # ============================================================================
 # Internal Bridge Functions
@@ -18,7 +182,9 @@ with proper error handling and validation.
 
 def _db_get_trait(character, trait_name):
     """
-    Internal function to get a trait value from character.db.stats.
+    Internal function to get a trait value from the character's trait snapshot.
+
+    Looks in attributes, skills, disciplines, then backgrounds.
 
     Args:
         character: Character object
@@ -28,36 +194,7 @@ def _db_get_trait(character, trait_name):
         int: Trait value, or 0 if not found
     """
     trait_name = trait_name.lower().replace(" ", "_")
-
-    if not hasattr(character.db, 'stats') or not character.db.stats:
-        return 0
-
-    stats = character.db.stats
-
-    # Check attributes (physical, social, mental)
-    for category in ['physical', 'social', 'mental']:
-        attrs = stats.get('attributes', {}).get(category, {})
-        if trait_name in attrs:
-            return attrs[trait_name]
-
-    # Check skills
-    for category in ['physical', 'social', 'mental']:
-        skills = stats.get('skills', {}).get(category, {})
-        if trait_name in skills:
-            return skills[trait_name]
-
-    # Check disciplines
-    disciplines = stats.get('disciplines', {})
-    if trait_name in disciplines:
-        return disciplines[trait_name].get('level', 0)
-
-    # Check advantages/backgrounds
-    if hasattr(character.db, 'advantages'):
-        backgrounds = character.db.advantages.get('backgrounds', {})
-        if trait_name in backgrounds:
-            return backgrounds[trait_name]
-
-    return 0
+    return get_trait_snapshot(character).values.get(trait_name, 0)
 
 
 def _db_set_trait(character, trait_name, value):
@@ -79,26 +216,23 @@ def _db_set_trait(character, trait_name, value):
 
     stats = character.db.stats
 
-    # Try to set in attributes
-    for category in ['physical', 'social', 'mental']:
-        attrs = stats.get('attributes', {}).get(category, {})
-        if trait_name in attrs:
-            attrs[trait_name] = value
-            return True
-
-    # Try to set in skills
-    for category in ['physical', 'social', 'mental']:
-        skills = stats.get('skills', {}).get(category, {})
-        if trait_name in skills:
-            skills[trait_name] = value
+    with trait_snapshot_write(character) as updates:
+        # Try to set in attributes, then skills
+        for section in ['attributes', 'skills']:
+            for category in ['physical', 'social', 'mental']:
+                traits = stats.get(section, {}).get(category, {})
+                if trait_name in traits:
+                    traits[trait_name] = value
+                    updates[trait_name] = value
+                    return True
+
+        # Try to set in disciplines
+        disciplines = stats.get('disciplines', {})
+        if trait_name in disciplines:
+            disciplines[trait_name]['level'] = value
+            updates[trait_name] = value
             return True
 
-    # Try to set in disciplines
-    disciplines = stats.get('disciplines', {})
-    if trait_name in disciplines:
-        disciplines[trait_name]['level'] = value
-        return True
-
     return False
 
 
@@ -123,29 +257,9 @@ def get_trait_value(character, trait_name, category=None):
         >>> get_trait_value(char, 'brawl', 'skill')
         2
     """
-    # Use the existing bridge function which checks both Django models and char.db.stats
-    value = _db_get_trait(character, trait_name)
-
-    if value > 0:
-        return value
-
-    # Fallback for disciplines (which are stored differently in char.db.stats)
-    trait_name = trait_name.lower().replace(" ", "_")
-
-    if category in [None, 'discipline', 'disciplines']:
-        if hasattr(character.db, 'stats') and character.db.stats:
-            disciplines = character.db.stats.get("disciplines", {})
-            if trait_name in disciplines:
-                return disciplines[trait_name].get("level", 0)
-
-    # Try backgrounds (might not be in Django models yet)
-    if category in [None, 'background', 'backgrounds']:
-        if hasattr(character.db, 'advantages') and character.db.advantages:
-            backgrounds = character.db.advantages.get("backgrounds", {})
-            if trait_name in backgrounds:
-                return backgrounds[trait_name]
-
-    return 0
+    # Attributes, skills, disciplines and backgrounds all come from the
+    # character's trait snapshot, so the category hint isn't needed
+    return _db_get_trait(character, trait_name)
 
 
 def set_trait_value(character, trait_name, value, category=None):
@@ -173,31 +287,36 @@ def set_trait_value(character, trait_name, value, category=None):
     if value < 0 or value > 5:
         raise ValueError(f"Trait value must be between 0 and 5, got {value}")
 
-    # Use the bridge function to update both Django models and char.db.stats
-    success = _db_set_trait(character, trait_name, value)
+    with trait_snapshot_write(character) as updates:
+        # Use the bridge function to update both Django models and char.db.stats
+        success = _db_set_trait(character, trait_name, value)
 
-    # Special handling for disciplines (stored differently)
-    if category in [None, 'discipline', 'disciplines']:
-        if not hasattr(character.db, 'stats') or not character.db.stats:
-            return False
+        # Special handling for disciplines (stored differently)
+        if category in [None, 'discipline', 'disciplines']:
+            if not hasattr(character.db, 'stats') or not character.db.stats:
+                return False
 
-        disciplines = character.db.stats.get("disciplines", {})
-        if trait_name in disciplines:
-            disciplines[trait_name]["level"] = value
-            success = True
-        elif category == 'discipline':
-            # Create new discipline entry
-            disciplines[trait_name] = {"level": value, "powers": []}
-            success = True
+            disciplines = character.db.stats.get("disciplines", {})
+            if trait_name in disciplines:
+                disciplines[trait_name]["level"] = value
+                success = True
+            elif category == 'discipline':
+                # Create new discipline entry
+                disciplines[trait_name] = {"level": value, "powers": []}
+                success = True
+
+        # Special handling for backgrounds (might not be in Django models)
+        if category in [None, 'background', 'backgrounds']:
+            if not hasattr(character.db, 'advantages'):
+                character.db.advantages = {"backgrounds": {}, "merits": {}, "flaws": {}}
 
-    # Special handling for backgrounds (might not be in Django models)
-    if category in [None, 'background', 'backgrounds']:
-        if not hasattr(character.db, 'advantages'):
-            character.db.advantages = {"backgrounds": {}, "merits": {}, "flaws": {}}
+            backgrounds = character.db.advantages.get("backgrounds", {})
+            backgrounds[trait_name] = value
+            success = True
 
-        backgrounds = character.db.advantages.get("backgrounds", {})
-        backgrounds[trait_name] = value
-        success = True
+        # Every layer holding this trait now has the new value
+        if success:
+            updates[trait_name] = value
 
     # Recalculate derived stats if attributes changed
     if category in ['attribute', 'attributes']:
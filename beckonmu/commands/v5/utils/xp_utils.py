@@ -4,10 +4,22 @@ XP System Utility Functions for V5
 Handles experience point costs, spending, and tracking.
 """
 
-from .trait_utils import get_trait_value, set_trait_value
+from functools import wraps
+
+from world.character_state import character_batch
+from .trait_utils import get_trait_value, set_trait_value, trait_snapshot_write
 from .clan_utils import get_clan, get_inclan_disciplines
 
 
+def _batched(spend):
+    """Run an XP spend in one character batch, so its writes are saved together."""
+    @wraps(spend)
+    def wrapper(character, *args, **kwargs):
+        with character_batch(character):
+            return spend(character, *args, **kwargs)
+    return wrapper
+
+
 def get_xp_cost_attribute(character, attribute_name):
     """
     Calculate XP cost to raise an attribute.
@@ -306,6 +318,7 @@ def award_xp(character, amount, reason="", awarded_by=None):
     return (True, f"Awarded {amount} XP. Current XP: {exp['current']}")
 
 
+@_batched
 def spend_xp_on_attribute(character, attribute_name, reason=""):
     """
     Spend XP to raise an attribute.
@@ -340,6 +353,7 @@ def spend_xp_on_attribute(character, attribute_name, reason=""):
     return (True, f"Raised {attribute_name} to {new_rating} for {cost} XP.")
 
 
+@_batched
 def spend_xp_on_skill(character, skill_name, reason=""):
     """
     Spend XP to raise a skill.
@@ -370,6 +384,7 @@ def spend_xp_on_skill(character, skill_name, reason=""):
     return (True, f"Raised {skill_name} to {new_rating} for {cost} XP.")
 
 
+@_batched
 def spend_xp_on_specialty(character, skill_name, specialty_name, reason=""):
     """
     Spend XP to add a specialty.
@@ -396,10 +411,12 @@ def spend_xp_on_specialty(character, skill_name, specialty_name, reason=""):
     if not hasattr(character.db, 'stats'):
         return (False, "Character stats not initialized.")
 
-    if 'specialties' not in character.db.stats:
-        character.db.stats['specialties'] = {}
+    # Specialties aren't in the trait snapshot, but keep it current
+    with trait_snapshot_write(character):
+        if 'specialties' not in character.db.stats:
+            character.db.stats['specialties'] = {}
 
-    character.db.stats['specialties'][skill_name] = specialty_name
+        character.db.stats['specialties'][skill_name] = specialty_name
 
     # Deduct XP
     _deduct_xp(character, cost, f"Added specialty: {skill_name} ({specialty_name})" + (f" - {reason}" if reason else ""))
@@ -407,6 +424,7 @@ def spend_xp_on_specialty(character, skill_name, specialty_name, reason=""):
     return (True, f"Added specialty {specialty_name} to {skill_name} for {cost} XP.")
 
 
+@_batched
 def spend_xp_on_discipline(character, discipline_name, reason=""):
     """
     Spend XP to raise a discipline.
@@ -432,13 +450,15 @@ def spend_xp_on_discipline(character, discipline_name, reason=""):
     if not hasattr(character.db, 'stats'):
         return (False, "Character stats not initialized.")
 
-    if 'disciplines' not in character.db.stats:
-        character.db.stats['disciplines'] = {}
+    with trait_snapshot_write(character) as updates:
+        if 'disciplines' not in character.db.stats:
+            character.db.stats['disciplines'] = {}
 
-    if discipline_name not in character.db.stats['disciplines']:
-        character.db.stats['disciplines'][discipline_name] = {'level': 0, 'powers': []}
+        if discipline_name not in character.db.stats['disciplines']:
+            character.db.stats['disciplines'][discipline_name] = {'level': 0, 'powers': []}
 
-    character.db.stats['disciplines'][discipline_name]['level'] = new_rating
+        character.db.stats['disciplines'][discipline_name]['level'] = new_rating
+        updates[discipline_name] = new_rating
 
     # Deduct XP
     clan_str = " (in-clan)" if is_in_clan else " (out-of-clan)"
@@ -447,6 +467,7 @@ def spend_xp_on_discipline(character, discipline_name, reason=""):
     return (True, f"Raised {discipline_name} to {new_rating} for {cost} XP{clan_str}.")
 
 
+@_batched
 def spend_xp_on_humanity(character, reason=""):
     """
     Spend XP to raise Humanity.
@@ -479,6 +500,7 @@ def spend_xp_on_humanity(character, reason=""):
     return (True, f"Raised Humanity to {new_rating} for {cost} XP.")
 
 
+@_batched
 def spend_xp_on_willpower(character, reason=""):
     """
     Spend XP to raise permanent Willpower.
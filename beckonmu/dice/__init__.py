@@ -8,6 +8,11 @@ This package provides the core dice rolling mechanics for V5, including:
 - Willpower rerolls
 - Success counting and critical detection
 - Discipline power rolling with trait integration
+- Exact pool odds from a precomputed probability table
+- Vectorized batch rolling for NPC crowds and simulations
+- Group and contested batch rolls for whole scenes
+- Willpower reroll advice from precomputed outcome tables
+- Buffered, seedable dice RNG with replay for disputed rolls
 """
 
 from .dice_roller import (
@@ -17,6 +22,11 @@ from .dice_roller import (
     apply_willpower_reroll
 )
 from .roll_result import RollResult
+from .probability import calculate_odds
+from .batch_roller import roll_v5_pool_batch
+from .group_roller import roll_group, roll_contested_group
+from .reroll_advisor import advise_reroll
+from .rng import DiceRNG, use_rng, replay_dice
 from .rouse_checker import (
     perform_rouse_check,
     can_reroll_rouse,
@@ -26,6 +36,7 @@ from .rouse_checker import (
 )
 from .discipline_roller import (
     roll_discipline_power,
+    compile_dice_pool,
     parse_dice_pool,
     calculate_pool_from_traits,
     get_blood_potency_bonus,
@@ -36,7 +47,8 @@ from .commands import (
     CmdRoll,
     CmdRollPower,
     CmdRouse,
-    CmdShowDice
+    CmdShowDice,
+    CmdDice
 )
 from .cmdset import DiceCmdSet
 
@@ -46,7 +58,19 @@ __all__ = [
     'roll_rouse_check',
     'roll_contested',
     'apply_willpower_reroll',
+    'advise_reroll',
     'RollResult',
+    # Probability
+    'calculate_odds',
+    # Batch rolling
+    'roll_v5_pool_batch',
+    # Group rolls
+    'roll_group',
+    'roll_contested_group',
+    # Dice RNG
+    'DiceRNG',
+    'use_rng',
+    'replay_dice',
     # Rouse checks
     'perform_rouse_check',
     'can_reroll_rouse',
@@ -55,6 +79,7 @@ __all__ = [
     'format_hunger_display',
     # Discipline powers
     'roll_discipline_power',
+    'compile_dice_pool',
     'parse_dice_pool',
     'calculate_pool_from_traits',
     'get_blood_potency_bonus',
@@ -65,5 +90,6 @@ __all__ = [
     'CmdRollPower',
     'CmdRouse',
     'CmdShowDice',
+    'CmdDice',
     'DiceCmdSet',
 ]
@@ -0,0 +1,217 @@
+"""
+Vectorized Batch Roller for V5 Dice Pools
+
+Rolls many V5 pools at once for NPC crowds, simulations and statistical
+tests. All dice are drawn in a single NumPy call and evaluated with array
+operations, so no RollResult is allocated per roll.
+
+The rules are the same as RollResult:
+- 6-9 = 1 success, 10 = 2 successes
+- Critical = at least two 10s
+- Messy Critical = critical with at least one Hunger 10
+- Bestial Failure = failure with a Hunger 1 and no regular 1s
+
+NumPy is optional. Without it the same API falls back to a plain Python
+loop and returns lists instead of arrays.
+"""
+
+from typing import Dict, Any, Sequence, Union
+
+from .core import DiceTally, roll_dice
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+IntOrSequence = Union[int, Sequence[int]]
+
+
+def _broadcast(value: IntOrSequence, count: int, name: str) -> list:
+    """
+    Expand a scalar to a list of `count` items, or check a sequence's length.
+
+    Args:
+        value: Scalar or sequence of ints
+        count: Number of rolls in the batch
+        name: Parameter name for error messages
+
+    Returns:
+        List of ints with one entry per roll
+
+    Raises:
+        ValueError: If a sequence has the wrong length
+    """
+    if isinstance(value, int):
+        return [value] * count
+    values = [int(v) for v in value]
+    if len(values) != count:
+        raise ValueError(f"{name} has {len(values)} entries, expected {count}")
+    return values
+
+
+def _broadcast_array(value: IntOrSequence, count: int, name: str):
+    """
+    NumPy version of _broadcast: expand a scalar or check a sequence.
+
+    Returns:
+        int16 array with one entry per roll
+
+    Raises:
+        ValueError: If a sequence has the wrong length
+    """
+    if np.ndim(value) == 0:
+        return np.full(count, value, dtype=np.int16)
+    values = np.asarray(value, dtype=np.int16).reshape(-1)
+    if len(values) != count:
+        raise ValueError(f"{name} has {len(values)} entries, expected {count}")
+    return values
+
+
+def _validate_batch(pools: list, hungers: list, difficulties: list) -> None:
+    """
+    Apply roll_v5_pool's parameter rules to every roll in a batch.
+
+    Raises:
+        ValueError: On the first invalid roll, naming its index
+    """
+    for i, (pool_size, hunger, difficulty) in enumerate(zip(pools, hungers, difficulties)):
+        if pool_size < 1:
+            raise ValueError(f"Roll {i}: pool size must be at least 1 (got {pool_size})")
+        if hunger < 0 or hunger > 5:
+            raise ValueError(f"Roll {i}: hunger must be between 0 and 5 (got {hunger})")
+        if hunger > pool_size:
+            raise ValueError(f"Roll {i}: hunger ({hunger}) cannot exceed pool size ({pool_size})")
+        if difficulty < 0:
+            raise ValueError(f"Roll {i}: difficulty must be 0 or greater (got {difficulty})")
+
+
+def roll_v5_pool_batch(
+    pools: Sequence[int],
+    hungers: IntOrSequence = 0,
+    difficulties: IntOrSequence = 0,
+    rng=None
+) -> Dict[str, Any]:
+    """
+    Roll many V5 dice pools in one call.
+
+    Hunger dice replace regular dice exactly as in roll_v5_pool. Each
+    returned array has one entry per pool, in the order given.
+
+    Args:
+        pools: Pool size for each roll (minimum 1)
+        hungers: Hunger level per roll, or one level for all rolls
+        difficulties: Difficulty per roll, or one difficulty for all rolls
+        rng: Optional numpy.random.Generator (ignored without NumPy)
+
+    Returns:
+        Dictionary containing (arrays with NumPy, lists without):
+            - 'successes' (int): Total successes per roll
+            - 'is_success' (bool): Whether the difficulty was met
+            - 'is_critical' (bool): At least two 10s were rolled
+            - 'is_messy_critical' (bool): Critical with a Hunger 10
+            - 'is_bestial_failure' (bool): Failure with only Hunger 1s
+
+    Raises:
+        ValueError: If any roll has invalid parameters
+
+    Example:
+        >>> batch = roll_v5_pool_batch([5, 6, 7], hungers=2, difficulties=3)
+        >>> print(batch['is_success'].sum(), "of 3 NPCs succeeded")
+    """
+    if not NUMPY_AVAILABLE:
+        pools = [int(p) for p in pools]
+        count = len(pools)
+        hungers = _broadcast(hungers, count, "hungers")
+        difficulties = _broadcast(difficulties, count, "difficulties")
+        _validate_batch(pools, hungers, difficulties)
+        return _roll_batch_python(pools, hungers, difficulties)
+
+    pool_arr = np.asarray(pools, dtype=np.int16).reshape(-1)
+    count = len(pool_arr)
+    hunger_arr = _broadcast_array(hungers, count, "hungers")
+    difficulty_arr = _broadcast_array(difficulties, count, "difficulties")
+
+    # Check the whole batch at once; only walk it to report the first bad roll
+    if count and (
+        pool_arr.min() < 1 or hunger_arr.min() < 0 or hunger_arr.max() > 5
+        or (hunger_arr > pool_arr).any() or difficulty_arr.min() < 0
+    ):
+        _validate_batch(pool_arr.tolist(), hunger_arr.tolist(), difficulty_arr.tolist())
+
+    if count == 0:
+        empty_int = np.zeros(0, dtype=np.int16)
+        empty_bool = np.zeros(0, dtype=bool)
+        return {
+            'successes': empty_int,
+            'is_success': empty_bool,
+            'is_critical': empty_bool,
+            'is_messy_critical': empty_bool,
+            'is_bestial_failure': empty_bool,
+        }
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # One row per roll; columns past the pool size are padding.
+    # Hunger dice occupy the last `hunger` live columns of each row.
+    dice = rng.integers(1, 11, size=(count, int(pool_arr.max())), dtype=np.int8)
+    columns = np.arange(dice.shape[1], dtype=np.int16)
+    live = columns < pool_arr[:, None]
+    hunger_mask = live & (columns >= (pool_arr - hunger_arr)[:, None])
+    regular_mask = live & ~hunger_mask
+
+    tens = (dice == 10) & live
+    ones = dice == 1
+
+    successes = (((dice >= 6) & live).sum(axis=1) + tens.sum(axis=1)).astype(np.int16)
+    is_success = successes >= np.maximum(difficulty_arr, 1)
+    is_critical = tens.sum(axis=1) >= 2
+    is_messy_critical = is_critical & (tens & hunger_mask).any(axis=1)
+    is_bestial_failure = (
+        ~is_success
+        & (ones & hunger_mask).any(axis=1)
+        & ~(ones & regular_mask).any(axis=1)
+    )
+
+    return {
+        'successes': successes,
+        'is_success': is_success,
+        'is_critical': is_critical,
+        'is_messy_critical': is_messy_critical,
+        'is_bestial_failure': is_bestial_failure,
+    }
+
+
+def _roll_batch_python(pools: list, hungers: list, difficulties: list) -> Dict[str, list]:
+    """
+    Pure Python fallback for roll_v5_pool_batch when NumPy is missing.
+
+    Returns:
+        Same keys as roll_v5_pool_batch, with lists instead of arrays
+    """
+    batch = {
+        'successes': [],
+        'is_success': [],
+        'is_critical': [],
+        'is_messy_critical': [],
+        'is_bestial_failure': [],
+    }
+
+    for pool_size, hunger, difficulty in zip(pools, hungers, difficulties):
+        tally = DiceTally(*roll_dice(pool_size, hunger))
+        successes = tally.successes + tally.tens
+
+        is_success = successes >= max(difficulty, 1)
+        is_critical = tally.tens >= 2
+        batch['successes'].append(successes)
+        batch['is_success'].append(is_success)
+        batch['is_critical'].append(is_critical)
+        batch['is_messy_critical'].append(is_critical and tally.hunger_tens > 0)
+        batch['is_bestial_failure'].append(
+            not is_success and tally.hunger_ones > 0 and tally.regular_ones == 0
+        )
+
+    return batch
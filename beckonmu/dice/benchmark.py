@@ -0,0 +1,104 @@
+"""
+Dice Core Microbenchmark
+
+Measures the per-roll cost of evaluating V5 dice before and after the
+unified dice core. "Before" is the original multi-pass analysis that
+RollResult and DiceResult each performed on their own; "after" is the
+single-pass DiceTally they now share.
+
+Run from `evennia shell`:
+
+    >>> from dice.benchmark import run_benchmark
+    >>> run_benchmark()
+"""
+
+import timeit
+from typing import Dict
+
+from .core import DiceTally, roll_dice
+
+
+def _legacy_roll_result(regular_dice, hunger_dice, difficulty):
+    """The five separate passes RollResult used to make over its dice."""
+    all_dice = regular_dice + hunger_dice
+    successes = 0
+    for die in all_dice:
+        if die >= 6:
+            successes += 2 if die == 10 else 1
+    is_success = successes >= difficulty if difficulty > 0 else successes > 0
+    is_critical = sum(1 for die in all_dice if die == 10) >= 2
+    is_messy = is_critical and sum(1 for die in hunger_dice if die == 10) >= 1
+    is_bestial = (
+        not is_success
+        and bool(hunger_dice)
+        and sum(1 for die in hunger_dice if die == 1) > 0
+        and sum(1 for die in regular_dice if die == 1) == 0
+    )
+    return successes, is_critical, is_messy, is_bestial
+
+
+def _legacy_dice_result(normal_dice, hunger_dice, difficulty):
+    """The four separate passes DiceResult used to make over its dice."""
+    normal_successes = sum(1 for d in normal_dice if d >= 6)
+    hunger_successes = sum(1 for d in hunger_dice if d >= 6)
+    successes = normal_successes + hunger_successes
+    normal_tens = sum(1 for d in normal_dice if d == 10)
+    hunger_tens = sum(1 for d in hunger_dice if d == 10)
+    criticals = (normal_tens + hunger_tens) // 2
+    is_messy = criticals > 0 and hunger_tens > 0
+    return successes, criticals, is_messy
+
+
+def _core_evaluate(regular_dice, hunger_dice, difficulty):
+    """Evaluate both rule sets from one DiceTally."""
+    tally = DiceTally(regular_dice, hunger_dice)
+    successes = tally.successes + tally.tens
+    is_success = successes >= max(difficulty, 1)
+    is_critical = tally.tens >= 2
+    is_messy = is_critical and tally.hunger_tens > 0
+    is_bestial = not is_success and tally.hunger_ones > 0 and tally.regular_ones == 0
+    return successes, is_critical, is_messy, is_bestial, tally.tens // 2
+
+
+def run_benchmark(pool_size: int = 8, hunger: int = 2, number: int = 20000) -> Dict[str, float]:
+    """
+    Time dice evaluation per roll, before and after the dice core.
+
+    Both sides evaluate the same pre-rolled dice so only evaluation cost
+    is compared. "before" covers a RollResult-style and a DiceResult-style
+    analysis, since every roll used to run one of each rule set's passes.
+
+    Args:
+        pool_size: Dice per roll
+        hunger: Hunger dice per roll
+        number: Rolls to evaluate for each measurement
+
+    Returns:
+        Dictionary of microseconds per roll:
+            - 'roll' (float): Drawing the dice
+            - 'before_roll_result' (float): Legacy RollResult analysis
+            - 'before_dice_result' (float): Legacy DiceResult analysis
+            - 'after' (float): Single DiceTally pass for both rule sets
+    """
+    rolls = [roll_dice(pool_size, hunger) for _ in range(number)]
+
+    def per_roll(func):
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        return seconds / number * 1_000_000
+
+    results = {
+        'roll': per_roll(lambda: [roll_dice(pool_size, hunger) for _ in range(number)]),
+        'before_roll_result': per_roll(
+            lambda: [_legacy_roll_result(r, h, 3) for r, h in rolls]),
+        'before_dice_result': per_roll(
+            lambda: [_legacy_dice_result(r, h, 3) for r, h in rolls]),
+        'after': per_roll(lambda: [_core_evaluate(r, h, 3) for r, h in rolls]),
+    }
+
+    print(f"Dice core benchmark: pool {pool_size}, hunger {hunger}, {number} rolls")
+    print(f"  Rolling dice:              {results['roll']:.2f} us/roll")
+    print(f"  Before (RollResult):       {results['before_roll_result']:.2f} us/roll")
+    print(f"  Before (DiceResult):       {results['before_dice_result']:.2f} us/roll")
+    print(f"  After (shared DiceTally):  {results['after']:.2f} us/roll")
+
+    return results
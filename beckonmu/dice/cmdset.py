@@ -17,7 +17,7 @@ To integrate with your game:
 """
 
 from evennia import CmdSet
-from .commands import CmdRoll, CmdRollPower, CmdRouse, CmdShowDice
+from .commands import CmdRoll, CmdRollPower, CmdRouse, CmdShowDice, CmdDice
 
 
 class DiceCmdSet(CmdSet):
@@ -29,6 +29,7 @@ class DiceCmdSet(CmdSet):
     - power: Discipline power rolling with automatic pool calculation
     - rouse: Rouse checks with Blood Potency rerolls
     - showdice: Dice mechanics reference
+    - +dice: Exact pool odds (+dice/odds)
 
     Priority is set to 1 to ensure these commands are available but
     can be overridden by higher-priority command sets if needed.
@@ -45,3 +46,4 @@ class DiceCmdSet(CmdSet):
         self.add(CmdRollPower())
         self.add(CmdRouse())
         self.add(CmdShowDice())
+        self.add(CmdDice())
@@ -5,13 +5,142 @@ Provides Evennia MuxCommands for rolling dice, using discipline powers,
 performing Rouse checks, and viewing dice mechanics.
 """
 
+import re
+import time
+
 from evennia import Command
 from evennia import default_cmds
 from evennia.utils.utils import inherits_from
-from . import dice_roller, discipline_roller, rouse_checker
+from . import dice_roller, discipline_roller, rouse_checker, probability, group_roller
+from . import reroll_advisor
+from . import rng as dice_rng
 from .roll_result import RollResult
 
 
+# Splits "<a> vs <b>" case-insensitively, keeping the case of both sides
+_VS_SPLIT = re.compile(r'\s+vs\s+', re.IGNORECASE)
+
+# Seconds after a failed roll during which roll/reroll may be used
+REROLL_WINDOW = 30
+
+
+def get_current_willpower(character):
+    """
+    Get a character's current Willpower.
+
+    Args:
+        character: Character object
+
+    Returns:
+        int: Current Willpower, 0 if not tracked
+    """
+    pools = character.db.pools
+    if pools and 'current_willpower' in pools:
+        return pools['current_willpower']
+    return character.db.willpower or 0
+
+
+def _spend_willpower(character):
+    """Deduct 1 Willpower from wherever the character tracks it."""
+    pools = character.db.pools
+    if pools and 'current_willpower' in pools:
+        pools['current_willpower'] -= 1
+    else:
+        character.db.willpower = (character.db.willpower or 0) - 1
+
+
+def offer_willpower_reroll(character, result, roll_type, secret=False):
+    """
+    Remember a failed roll for roll/reroll and describe the offer.
+
+    The roll is kept in character.ndb.last_roll (not persistent) for
+    REROLL_WINDOW seconds and can be rerolled once.
+
+    Args:
+        character: Character who rolled
+        result (RollResult): The failed roll
+        roll_type (str): 'basic' or 'power'
+        secret (bool): Whether the roll was secret (the reroll will be too)
+
+    Returns:
+        str: Offer text including the advisor's suggestion, or "" if the
+            character has no Willpower to spend
+    """
+    if get_current_willpower(character) < 1:
+        return ""
+
+    character.ndb.last_roll = {
+        'result': result,
+        'can_reroll': True,
+        'timestamp': time.time(),
+        'roll_type': roll_type,
+        'secret': secret,
+    }
+
+    advice = reroll_advisor.advise_reroll(result)
+    return (
+        "|yYou may spend 1 Willpower to reroll up to 3 failed dice.|n\n"
+        f"{reroll_advisor.format_advice(result, advice)}\n"
+        "|x(Use 'roll/reroll' to take the suggested reroll)|n"
+    )
+
+
+def parse_roll_args(args):
+    """
+    Parse roll arguments into pool, hunger, and difficulty.
+
+    Shared by roll and +dice/odds so both accept the same syntax.
+
+    Args:
+        args: Raw argument string
+
+    Returns:
+        Tuple of (pool_size, hunger, difficulty)
+
+    Raises:
+        ValueError: If arguments are invalid
+    """
+    # Split on 'vs' to separate difficulty
+    if ' vs ' in args.lower():
+        pool_args, diff_str = args.lower().split(' vs ', 1)
+        try:
+            difficulty = int(diff_str.strip())
+        except ValueError:
+            raise ValueError("Difficulty must be a number")
+    else:
+        pool_args = args
+        difficulty = 0
+
+    # Parse pool and hunger
+    parts = pool_args.split()
+    if len(parts) < 1:
+        raise ValueError("Must specify at least pool size")
+
+    try:
+        pool_size = int(parts[0])
+    except ValueError:
+        raise ValueError("Pool size must be a number")
+
+    hunger = 0
+    if len(parts) >= 2:
+        try:
+            hunger = int(parts[1])
+        except ValueError:
+            raise ValueError("Hunger must be a number")
+
+    # Validate ranges
+    if pool_size < 1:
+        raise ValueError("Pool size must be at least 1")
+    if hunger < 0 or hunger > 5:
+        raise ValueError("Hunger must be between 0 and 5")
+    if hunger > pool_size:
+        raise ValueError("Hunger cannot exceed pool size")
+    if difficulty < 0:
+        raise ValueError("Difficulty must be 0 or greater")
+
+    return pool_size, hunger, difficulty
+
+
 class CmdRoll(default_cmds.MuxCommand):
     """
     Roll a V5 dice pool with optional Hunger dice.
@@ -20,16 +149,29 @@ class CmdRoll(default_cmds.MuxCommand):
       roll <pool> [<hunger>] [vs <difficulty>]
       roll/willpower <pool> [<hunger>] [vs <difficulty>]
       roll/secret <pool> [<hunger>] [vs <difficulty>]
+      roll/reroll
+      roll/group <char>, <char>, ... = <pool> [vs <difficulty>]
+      roll/contest <char> vs <char>, ... = <pool> vs <pool>
 
     Examples:
       roll 7                      # Roll 7 dice
       roll 5 2 vs 3              # Roll 5 dice with Hunger 2 vs difficulty 3
       roll/willpower 4 3         # Roll with option for Willpower reroll
       roll/secret 6 vs 2         # Secret roll (only show to roller)
+      roll/group Ann, Bo, Cy = Wits + Awareness vs 3
+      roll/contest Ann vs Bo, Cy vs Di = Dexterity + Stealth vs Wits + Awareness
 
     Switches:
       willpower - Offer Willpower reroll on failure (costs 1 Willpower)
       secret    - Only show result to the roller (no room broadcast)
+      reroll    - Spend 1 Willpower on the suggested reroll of your last
+                  failed /willpower roll (within 30 seconds, once)
+      group     - (Staff) Roll one pool for several characters in the room
+      contest   - (Staff) Resolve several contested pairs at once
+
+    Group and contested pools are a number of dice or a trait expression
+    worked out from each character's sheet; everyone rolls their own
+    Hunger. The room gets a single combined message.
 
     V5 Dice Rules:
     - Each die is a d10 (1-10)
@@ -46,6 +188,15 @@ class CmdRoll(default_cmds.MuxCommand):
 
     def func(self):
         """Execute the roll command."""
+        # Storyteller batch rolls
+        if 'group' in self.switches or 'contest' in self.switches:
+            self._do_batch_roll()
+            return
+
+        if 'reroll' in self.switches:
+            self._do_reroll()
+            return
+
         # Validate caller is a character
         if not inherits_from(self.caller, "typeclasses.characters.Character"):
             self.caller.msg("|rYou must be in character to roll dice.|n")
@@ -72,15 +223,23 @@ class CmdRoll(default_cmds.MuxCommand):
         use_willpower = 'willpower' in self.switches
         is_secret = 'secret' in self.switches
 
-        # Perform the roll
+        # Perform the roll (seeded scenes draw from a replayable stream)
         try:
-            result = dice_roller.roll_v5_pool(pool_size, hunger, difficulty)
+            with dice_rng.scene_dice(self.caller.location) as rng:
+                offset = rng.offset
+                result = dice_roller.roll_v5_pool(pool_size, hunger, difficulty)
         except ValueError as e:
             self.caller.msg(f"|rRoll error:|n {e}")
             return
 
+        # Queue for the roll log (buffered; no database write here)
+        from rolls.utils import record_roll
+        record_roll(self.caller, result, "roll", seed=rng.seed, offset=offset)
+
         # Format the output
         message = self._format_roll_message(result, pool_size, hunger, difficulty)
+        if rng.seed is not None:
+            message += f"\n|x[Seeded roll: offset {offset}, {pool_size} dice]|n"
 
         # Handle Messy Critical - automatically add Stain
         if result.is_messy_critical:
@@ -97,10 +256,9 @@ class CmdRoll(default_cmds.MuxCommand):
 
         # Handle Willpower reroll offer
         if use_willpower and not result.is_success:
-            willpower = self._get_willpower()
-            if willpower and willpower > 0:
-                message += "\n\n|yYou may spend 1 Willpower to reroll up to 3 failed dice.|n"
-                message += "\n|x(Use 'willpower reroll' to attempt reroll)|n"
+            offer = offer_willpower_reroll(self.caller, result, 'basic', secret=is_secret)
+            if offer:
+                message += "\n\n" + offer
 
         # Send message
         if is_secret:
@@ -113,6 +271,158 @@ class CmdRoll(default_cmds.MuxCommand):
             )
             self.caller.msg(message)
 
+    def _do_reroll(self):
+        """Spend Willpower to reroll the advised dice of the last failed roll."""
+        caller = self.caller
+
+        last_roll = caller.ndb.last_roll
+        if not last_roll or not last_roll.get('can_reroll'):
+            caller.msg("|rNo recent roll to reroll.|n (Roll with /willpower first.)")
+            return
+
+        if time.time() - last_roll['timestamp'] > REROLL_WINDOW:
+            caller.ndb.last_roll = None
+            caller.msg("|rToo much time has passed to reroll that roll.|n")
+            return
+
+        willpower = get_current_willpower(caller)
+        if willpower < 1:
+            caller.msg("|rYou have no Willpower remaining.|n")
+            return
+
+        result = last_roll['result']
+        advice = reroll_advisor.advise_reroll(result)
+        if not advice['indices']:
+            caller.msg(reroll_advisor.format_advice(result, advice))
+            return
+
+        with dice_rng.scene_dice(caller.location) as rng:
+            offset = rng.offset
+            new_result, rerolled = dice_roller.apply_willpower_reroll(
+                result, indices=advice['indices']
+            )
+
+        # Each roll can only be rerolled once
+        _spend_willpower(caller)
+        caller.ndb.last_roll = None
+
+        from rolls.utils import record_roll
+        record_roll(caller, new_result, "reroll", seed=rng.seed, offset=offset)
+
+        old_dice = ", ".join(str(result.regular_dice[i]) for i in rerolled)
+        new_dice = ", ".join(str(new_result.regular_dice[i]) for i in rerolled)
+        message = "\n".join([
+            "|c=== Willpower Reroll ===|n",
+            f"Rerolled [{old_dice}] -> [{new_dice}]",
+            "",
+            new_result.format_result(show_details=True),
+        ])
+
+        # Handle Messy Critical - automatically add Stain
+        if new_result.is_messy_critical:
+            try:
+                from commands.v5.utils import humanity_utils
+                stain_result = humanity_utils.add_stain(caller, 1)
+                message += f"\n\n|r*** MESSY CRITICAL ***|n\n{stain_result['message']}"
+            except (ValueError, AttributeError, KeyError) as e:
+                message += f"\n\n|r*** MESSY CRITICAL ***|n (Stain addition failed: {e})"
+
+        if last_roll.get('secret'):
+            message = "|y[Secret Roll]|n\n" + message
+        elif caller.location:
+            caller.location.msg_contents(
+                f"|c{caller.name}|n spends Willpower to reroll...\n{message}",
+                exclude=[caller]
+            )
+        caller.msg(f"{message}\n|xWillpower remaining: {willpower - 1}|n")
+
+    def _do_batch_roll(self):
+        """Roll for a group of characters, or a batch of contested pairs."""
+        caller = self.caller
+
+        if not caller.check_permstring("Builder"):
+            caller.msg("|rStaff only.|n")
+            return
+
+        if not caller.location:
+            caller.msg("|rYou must be in a room to roll for a scene.|n")
+            return
+
+        is_contest = 'contest' in self.switches
+        if not self.lhslist or not self.rhs:
+            if is_contest:
+                caller.msg("Usage: roll/contest <char> vs <char>, ... = <pool> vs <pool>")
+            else:
+                caller.msg("Usage: roll/group <char>, <char>, ... = <pool> [vs <difficulty>]")
+            return
+
+        # Parse pools before searching, so typos don't spam search errors
+        try:
+            if is_contest:
+                pool_texts = _VS_SPLIT.split(self.rhs, 1)
+                if len(pool_texts) != 2:
+                    raise ValueError("Contested rolls need two pools: <pool> vs <pool>")
+                spec1 = group_roller.parse_pool_spec(pool_texts[0])
+                spec2 = group_roller.parse_pool_spec(pool_texts[1])
+            else:
+                pool_text, *diff_text = _VS_SPLIT.split(self.rhs, 1)
+                difficulty = 0
+                if diff_text:
+                    try:
+                        difficulty = int(diff_text[0].strip())
+                    except ValueError:
+                        raise ValueError("Difficulty must be a number")
+                    if difficulty < 0:
+                        raise ValueError("Difficulty must be 0 or greater")
+                spec = group_roller.parse_pool_spec(pool_text)
+        except ValueError as e:
+            caller.msg(f"|rError:|n {e}")
+            return
+
+        if is_contest:
+            pairs = []
+            for entry in self.lhslist:
+                names = _VS_SPLIT.split(entry, 1)
+                if len(names) != 2:
+                    caller.msg(f"|rError:|n '{entry}' is not a pair (use <char> vs <char>).")
+                    return
+                roller1 = caller.search(names[0].strip())
+                roller2 = caller.search(names[1].strip())
+                if not roller1 or not roller2:
+                    return
+                pairs.append((roller1, roller2))
+        else:
+            characters = []
+            for name in self.lhslist:
+                character = caller.search(name)
+                if not character:
+                    return
+                characters.append(character)
+
+        from rolls.utils import record_roll
+
+        with dice_rng.scene_dice(caller.location) as rng:
+            offset = rng.offset
+            if is_contest:
+                contests = group_roller.roll_contested_group(pairs, spec1, spec2)
+                message = group_roller.format_contested_group(contests, spec1, spec2)
+                logged = []
+                for entry in contests:
+                    logged.append((entry['roller1'], entry['contest']['roller1_result']))
+                    logged.append((entry['roller2'], entry['contest']['roller2_result']))
+            else:
+                rolls = group_roller.roll_group(characters, spec, difficulty)
+                message = group_roller.format_group_roll(rolls, spec, difficulty)
+                logged = [(roll['character'], roll['result']) for roll in rolls]
+
+        # Rolls were drawn in order, so each one's stream offset follows on
+        command = "contest" if is_contest else "group"
+        for character, result in logged:
+            record_roll(character, result, command, seed=rng.seed, offset=offset)
+            offset += len(result.regular_dice) + len(result.hunger_dice)
+
+        caller.location.msg_contents(f"|c{caller.name}|n rolls for the scene...\n{message}")
+
     def _parse_args(self, args):
         """
         Parse roll arguments into pool, hunger, and difficulty.
@@ -126,45 +436,7 @@ class CmdRoll(default_cmds.MuxCommand):
         Raises:
             ValueError: If arguments are invalid
         """
-        # Split on 'vs' to separate difficulty
-        if ' vs ' in args.lower():
-            pool_args, diff_str = args.lower().split(' vs ', 1)
-            try:
-                difficulty = int(diff_str.strip())
-            except ValueError:
-                raise ValueError("Difficulty must be a number")
-        else:
-            pool_args = args
-            difficulty = 0
-
-        # Parse pool and hunger
-        parts = pool_args.split()
-        if len(parts) < 1:
-            raise ValueError("Must specify at least pool size")
-
-        try:
-            pool_size = int(parts[0])
-        except ValueError:
-            raise ValueError("Pool size must be a number")
-
-        hunger = 0
-        if len(parts) >= 2:
-            try:
-                hunger = int(parts[1])
-            except ValueError:
-                raise ValueError("Hunger must be a number")
-
-        # Validate ranges
-        if pool_size < 1:
-            raise ValueError("Pool size must be at least 1")
-        if hunger < 0 or hunger > 5:
-            raise ValueError("Hunger must be between 0 and 5")
-        if hunger > pool_size:
-            raise ValueError("Hunger cannot exceed pool size")
-        if difficulty < 0:
-            raise ValueError("Difficulty must be 0 or greater")
-
-        return pool_size, hunger, difficulty
+        return parse_roll_args(args)
 
     def _format_roll_message(self, result, pool_size, hunger, difficulty):
         """
@@ -193,10 +465,6 @@ class CmdRoll(default_cmds.MuxCommand):
 
         return "\n".join(lines)
 
-    def _get_willpower(self):
-        """Get character's current Willpower."""
-        return getattr(self.caller.db, 'willpower', None)
-
 
 class CmdRollPower(default_cmds.MuxCommand):
     """
@@ -262,12 +530,14 @@ class CmdRollPower(default_cmds.MuxCommand):
 
         # Perform the discipline roll
         try:
-            result = discipline_roller.roll_discipline_power(
-                character=self.caller,
-                power_name=power_name,
-                difficulty=difficulty,
-                with_rouse=with_rouse
-            )
+            with dice_rng.scene_dice(self.caller.location) as rng:
+                offset = rng.offset
+                result = discipline_roller.roll_discipline_power(
+                    character=self.caller,
+                    power_name=power_name,
+                    difficulty=difficulty,
+                    with_rouse=with_rouse
+                )
         except (ValueError, AttributeError, KeyError) as e:
             self.caller.msg(f"|rError:|n {e}")
             return
@@ -275,8 +545,13 @@ class CmdRollPower(default_cmds.MuxCommand):
         # Display result (pre-formatted by discipline_roller)
         self.caller.msg(result['message'])
 
-        # Handle Messy Critical - automatically add Stain
+        # Queue for the roll log (buffered; no database write here)
         roll_result = result.get('roll_result')
+        if roll_result:
+            from rolls.utils import record_roll
+            record_roll(self.caller, roll_result, "power", seed=rng.seed, offset=offset)
+
+        # Handle Messy Critical - automatically add Stain
         if roll_result and roll_result.is_messy_critical:
             try:
                 from commands.v5.utils import humanity_utils
@@ -290,11 +565,10 @@ class CmdRollPower(default_cmds.MuxCommand):
                 self.caller.msg(f"|yYour Beast influenced your power! (Stain addition failed: {e})|n")
 
         # Handle Willpower reroll offer
-        if use_willpower and not result['success']:
-            willpower = self._get_willpower()
-            if willpower and willpower > 0:
-                self.caller.msg("\n|yYou may spend 1 Willpower to reroll up to 3 failed dice.|n")
-                self.caller.msg("|x(Use 'willpower reroll' to attempt reroll)|n")
+        if use_willpower and roll_result and not result['success']:
+            offer = offer_willpower_reroll(self.caller, roll_result, 'power')
+            if offer:
+                self.caller.msg("\n" + offer)
 
         # Broadcast to room (simplified version)
         if self.caller.location:
@@ -306,10 +580,6 @@ class CmdRollPower(default_cmds.MuxCommand):
 
             self.caller.location.msg_contents(room_msg, exclude=[self.caller])
 
-    def _get_willpower(self):
-        """Get character's current Willpower."""
-        return getattr(self.caller.db, 'willpower', None)
-
 
 class CmdRouse(Command):
     """
@@ -345,15 +615,24 @@ class CmdRouse(Command):
 
         # Perform the Rouse check
         try:
-            result = rouse_checker.perform_rouse_check(
-                character=self.caller,
-                reason=reason,
-                power_level=1  # Default to level 1 for manual checks
-            )
+            with dice_rng.scene_dice(self.caller.location) as rng:
+                result = rouse_checker.perform_rouse_check(
+                    character=self.caller,
+                    reason=reason,
+                    power_level=1  # Default to level 1 for manual checks
+                )
+                # The die that counted is the last one drawn (after any reroll)
+                offset = rng.offset - 1
         except (ValueError, AttributeError, KeyError) as e:
             self.caller.msg(f"|rError:|n {e}")
             return
 
+        # Log the die that decided the check (none is rolled at Hunger 5)
+        if result['roll']:
+            from rolls.utils import record_roll
+            record_roll(self.caller, RollResult([result['roll']], [], 1), "rouse",
+                        seed=rng.seed, offset=offset)
+
         # Display result (pre-formatted by rouse_checker)
         self.caller.msg(result['message'])
 
@@ -550,3 +829,129 @@ class CmdShowDice(Command):
         lines.append("")
 
         self.caller.msg("\n".join(lines))
+
+
+class CmdDice(default_cmds.MuxCommand):
+    """
+    Dice odds and seeded scene tools.
+
+    Usage:
+      +dice/odds <pool> [<hunger>] [vs <difficulty>]
+      +dice/seed [<seed>|off]
+      +dice/replay <seed> <offset> <count>
+
+    Examples:
+      +dice/odds 7                # Odds for 7 dice, no Hunger
+      +dice/odds 5 2 vs 3         # 5 dice with Hunger 2 vs difficulty 3
+      +dice/seed                  # Show this room's seed (staff)
+      +dice/seed 90210            # Seed this room's dice (staff)
+      +dice/seed off              # Return to unseeded dice (staff)
+      +dice/replay 90210 40 7     # Reproduce a disputed 7-die roll (staff)
+
+    Switches:
+      odds   - Show success, critical, Messy Critical and Bestial Failure
+               chances for the pool
+      seed   - Put this room in seeded replay mode (staff only)
+      replay - Reproduce the dice of a seeded roll (staff only)
+
+    Odds are exact, not simulated, and cover pools of 1-30 dice.
+    Nothing is rolled and nothing is shown to the room.
+
+    In a seeded room every roll notes its offset in the dice stream, so
+    staff can replay it exactly from the seed and offset.
+    """
+
+    key = "+dice"
+    aliases = ["dice"]
+    switch_options = ("odds", "seed", "replay")
+    locks = "cmd:all()"
+    help_category = "Dice"
+
+    def func(self):
+        """Execute the dice command."""
+        if "seed" in self.switches:
+            self._do_seed()
+        elif "replay" in self.switches:
+            self._do_replay()
+        elif "odds" in self.switches:
+            self._do_odds()
+        else:
+            self.caller.msg("Usage: +dice/odds <pool> [<hunger>] [vs <difficulty>]")
+
+    def _do_odds(self):
+        """Show exact odds for a pool."""
+        args = self.args.strip()
+        if not args:
+            self.caller.msg("Usage: +dice/odds <pool> [<hunger>] [vs <difficulty>]")
+            return
+
+        try:
+            pool_size, hunger, difficulty = parse_roll_args(args)
+            message = probability.format_odds(pool_size, hunger, difficulty)
+        except ValueError as e:
+            self.caller.msg(f"|rError:|n {e}")
+            return
+
+        self.caller.msg(message)
+
+    def _do_seed(self):
+        """Show, set or clear the current room's dice seed."""
+        if not self.caller.check_permstring("Builder"):
+            self.caller.msg("|rStaff only.|n")
+            return
+
+        location = self.caller.location
+        if not location:
+            self.caller.msg("|rYou are not in a room.|n")
+            return
+
+        args = self.args.strip().lower()
+        if not args:
+            seed = location.db.dice_seed
+            if seed is None:
+                self.caller.msg("This room is not in seeded replay mode.")
+            else:
+                self.caller.msg(
+                    f"Dice seed: |w{seed}|n (offset {location.db.dice_offset or 0})"
+                )
+            return
+
+        if args == "off":
+            dice_rng.set_scene_seed(location, None)
+            self.caller.msg("Seeded replay mode |rdisabled|n for this room.")
+            return
+
+        try:
+            seed = int(args)
+        except ValueError:
+            self.caller.msg("|rSeed must be a number or 'off'.|n")
+            return
+
+        try:
+            dice_rng.set_scene_seed(location, seed)
+        except ValueError as e:
+            self.caller.msg(f"|rError:|n {e}")
+            return
+        self.caller.msg(f"Seeded replay mode |genabled|n for this room (seed {seed}).")
+
+    def _do_replay(self):
+        """Reproduce the dice of a seeded roll."""
+        if not self.caller.check_permstring("Builder"):
+            self.caller.msg("|rStaff only.|n")
+            return
+
+        try:
+            seed, offset, count = (int(part) for part in self.args.split())
+        except ValueError:
+            self.caller.msg("Usage: +dice/replay <seed> <offset> <count>")
+            return
+
+        if offset < 0 or count < 1 or count > 100:
+            self.caller.msg("|rOffset must be 0 or more and count between 1 and 100.|n")
+            return
+
+        dice = dice_rng.replay_dice(seed, offset, count)
+        self.caller.msg(
+            f"Seed {seed}, offset {offset}: |w{', '.join(str(die) for die in dice)}|n\n"
+            "|x(Hunger dice are the last ones in the roll.)|n"
+        )
@@ -0,0 +1,137 @@
+"""
+Unified V5 Dice Core
+
+Every roller in the game draws and evaluates dice through this module:
+dice.dice_roller / RollResult, world.v5_dice / DiceResult, and both Rouse
+check implementations. Dice are tallied once, in a single pass, into a
+compact DiceTally that each result class interprets under its own rules.
+
+All dice are drawn from the buffered RNG in dice.rng. This module has no
+Evennia dependencies so it can be used from anywhere.
+"""
+
+from typing import List, Tuple
+
+from .rng import get_rng
+
+
+# Minimum die value that counts as a success
+SUCCESS_THRESHOLD = 6
+
+# Die value that counts toward criticals
+CRITICAL_VALUE = 10
+
+
+class DiceTally:
+    """
+    Raw counts from a single pass over a roll's dice.
+
+    These are rule-neutral facts about the dice; RollResult and DiceResult
+    each derive their successes, criticals and special results from them.
+
+    Attributes:
+        regular_successes (int): Regular dice showing 6+ (10s included)
+        hunger_successes (int): Hunger dice showing 6+ (10s included)
+        regular_tens (int): Regular dice showing 10
+        hunger_tens (int): Hunger dice showing 10
+        regular_ones (int): Regular dice showing 1
+        hunger_ones (int): Hunger dice showing 1
+    """
+
+    __slots__ = (
+        'regular_successes', 'hunger_successes',
+        'regular_tens', 'hunger_tens',
+        'regular_ones', 'hunger_ones',
+    )
+
+    def __init__(self, regular_dice: List[int], hunger_dice: List[int]):
+        """
+        Tally regular and Hunger dice.
+
+        Args:
+            regular_dice: Regular dice results (1-10)
+            hunger_dice: Hunger dice results (1-10)
+        """
+        # Inlined rather than calling a helper twice: this runs on every roll
+        successes = tens = ones = 0
+        for die in regular_dice:
+            if die >= SUCCESS_THRESHOLD:
+                successes += 1
+                if die == CRITICAL_VALUE:
+                    tens += 1
+            elif die == 1:
+                ones += 1
+        self.regular_successes = successes
+        self.regular_tens = tens
+        self.regular_ones = ones
+
+        successes = tens = ones = 0
+        for die in hunger_dice:
+            if die >= SUCCESS_THRESHOLD:
+                successes += 1
+                if die == CRITICAL_VALUE:
+                    tens += 1
+            elif die == 1:
+                ones += 1
+        self.hunger_successes = successes
+        self.hunger_tens = tens
+        self.hunger_ones = ones
+
+    @property
+    def successes(self) -> int:
+        """Dice showing 6+ across the whole pool."""
+        return self.regular_successes + self.hunger_successes
+
+    @property
+    def tens(self) -> int:
+        """Dice showing 10 across the whole pool."""
+        return self.regular_tens + self.hunger_tens
+
+    def __repr__(self) -> str:
+        return (f"DiceTally(successes={self.regular_successes}+{self.hunger_successes}, "
+                f"tens={self.regular_tens}+{self.hunger_tens}, "
+                f"ones={self.regular_ones}+{self.hunger_ones})")
+
+
+def roll_d10s(count: int) -> List[int]:
+    """
+    Roll a number of d10s.
+
+    Dice come from the active buffered RNG (see dice.rng), which may be a
+    seeded per-scene stream.
+
+    Args:
+        count: Number of dice to roll
+
+    Returns:
+        List of die results (1-10)
+    """
+    return get_rng().draw(count)
+
+
+def roll_dice(pool_size: int, hunger: int = 0) -> Tuple[List[int], List[int]]:
+    """
+    Roll a pool split into regular and Hunger dice.
+
+    Hunger dice replace regular dice; callers are responsible for
+    validating or clamping pool_size and hunger first.
+
+    Args:
+        pool_size: Total number of dice
+        hunger: Number of those dice that are Hunger dice
+
+    Returns:
+        Tuple of (regular_dice, hunger_dice)
+    """
+    return roll_d10s(pool_size - hunger), roll_d10s(hunger)
+
+
+def roll_rouse_die() -> Tuple[int, bool]:
+    """
+    Roll a single Rouse die.
+
+    Returns:
+        Tuple of (die result, success), where 6+ succeeds
+    """
+    die = get_rng().draw(1)[0]
+    return die, die >= SUCCESS_THRESHOLD
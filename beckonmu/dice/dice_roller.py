@@ -5,8 +5,8 @@ This module provides the fundamental dice rolling mechanics for Vampire: The Mas
 including basic pools, Hunger dice, Rouse checks, contested rolls, and Willpower rerolls.
 """
 
-from random import randint
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional
+from .core import roll_d10s, roll_dice, roll_rouse_die
 from .roll_result import RollResult
 
 
@@ -59,15 +59,8 @@ def roll_v5_pool(pool_size: int, hunger: int = 0, difficulty: int = 0) -> RollRe
         pool_size = 1
         hunger = 0  # Chance die has no Hunger
 
-    # Calculate dice distribution
-    num_regular = pool_size - hunger
-    num_hunger = hunger
-
-    # Roll regular dice
-    regular_dice = [randint(1, 10) for _ in range(num_regular)]
-
-    # Roll hunger dice
-    hunger_dice = [randint(1, 10) for _ in range(num_hunger)]
+    # Hunger dice replace an equal number of regular dice
+    regular_dice, hunger_dice = roll_dice(pool_size, hunger)
 
     # Create and return result
     return RollResult(regular_dice, hunger_dice, difficulty)
@@ -91,7 +84,7 @@ def roll_chance_die() -> RollResult:
         >>> if result.total_successes > 0:
         >>>     print("Miraculous success!")
     """
-    die_roll = randint(1, 10)
+    die_roll = roll_d10s(1)[0]
 
     # For chance die, even a 10 only counts as 1 success, not 2
     # We handle this by treating it as a regular roll with pool 1
@@ -121,8 +114,7 @@ def roll_rouse_check() -> Dict[str, Any]:
         >>> else:
         >>>     print(f"Failed with {result['roll']}, Hunger increases")
     """
-    roll = randint(1, 10)
-    success = roll >= 6
+    roll, success = roll_rouse_die()
     hunger_change = 0 if success else 1
 
     return {
@@ -195,7 +187,11 @@ def roll_contested(
     }
 
 
-def apply_willpower_reroll(result: RollResult, num_rerolls: int = 3) -> Tuple[RollResult, list]:
+def apply_willpower_reroll(
+    result: RollResult,
+    num_rerolls: int = 3,
+    indices: Optional[List[int]] = None
+) -> Tuple[RollResult, list]:
     """
     Reroll up to 3 failed regular dice (Willpower reroll).
 
@@ -209,6 +205,8 @@ def apply_willpower_reroll(result: RollResult, num_rerolls: int = 3) -> Tuple[Ro
     Args:
         result: Original RollResult to improve
         num_rerolls: Number of failed dice to reroll (1-3, default 3)
+        indices: Specific regular dice to reroll, e.g. from
+            reroll_advisor.advise_reroll(); overrides num_rerolls
 
     Returns:
         Tuple of (new_result, rerolled_indices):
@@ -216,7 +214,8 @@ def apply_willpower_reroll(result: RollResult, num_rerolls: int = 3) -> Tuple[Ro
             - rerolled_indices: List of indices that were rerolled
 
     Raises:
-        ValueError: If num_rerolls < 1 or > 3
+        ValueError: If num_rerolls < 1 or > 3, or indices are not
+            up to 3 distinct failed regular dice
 
     Example:
         >>> original = roll_v5_pool(5, hunger=2)
@@ -235,20 +234,26 @@ def apply_willpower_reroll(result: RollResult, num_rerolls: int = 3) -> Tuple[Ro
         if die < 6
     ]
 
-    # Limit to requested number of rerolls
-    num_to_reroll = min(num_rerolls, len(failed_indices))
+    if indices is not None:
+        reroll_indices = sorted(set(indices))
+        if len(reroll_indices) > 3:
+            raise ValueError(f"Can only reroll 1-3 dice (requested {len(reroll_indices)})")
+        if any(i not in failed_indices for i in reroll_indices):
+            raise ValueError("Can only reroll failed regular dice")
+        num_to_reroll = len(reroll_indices)
+    else:
+        # Select which dice to reroll (take first N failed dice)
+        num_to_reroll = min(num_rerolls, len(failed_indices))
+        reroll_indices = failed_indices[:num_to_reroll]
 
     if num_to_reroll == 0:
         # No failed dice to reroll
         return result, []
 
-    # Select which dice to reroll (take first N failed dice)
-    reroll_indices = failed_indices[:num_to_reroll]
-
     # Create new regular dice list with rerolls
     new_regular_dice = result.regular_dice.copy()
-    for idx in reroll_indices:
-        new_regular_dice[idx] = randint(1, 10)
+    for idx, die in zip(reroll_indices, roll_d10s(num_to_reroll)):
+        new_regular_dice[idx] = die
 
     # Create new result with same Hunger dice but new regular dice
     new_result = RollResult(new_regular_dice, result.hunger_dice, result.difficulty)
@@ -6,11 +6,12 @@ calculating dice pools from character traits, applying Blood Potency bonuses,
 and performing Rouse checks.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from .dice_roller import roll_v5_pool
 from .rouse_checker import perform_rouse_check, get_hunger_level
 from traits.models import DisciplinePower
-from traits.utils import get_character_trait_value
+from traits.utils import get_character_trait_value, get_character_trait_values
 
 
 def roll_discipline_power(
@@ -62,7 +63,7 @@ def roll_discipline_power(
     """
     # Look up the discipline power
     try:
-        power = DisciplinePower.objects.get(name__iexact=power_name)
+        power = DisciplinePower.objects.get(name__lower=power_name.lower())
     except DisciplinePower.DoesNotExist:
         raise ValueError(f"Discipline power '{power_name}' not found in database")
 
@@ -85,19 +86,14 @@ def roll_discipline_power(
     if not power.dice_pool:
         raise ValueError(f"Power '{power.name}' has no dice pool defined")
 
-    trait_names = parse_dice_pool(power.dice_pool)
-
-    # Calculate dice pool from traits
-    pool_breakdown = {}
-    base_pool = 0
-
-    for trait_name in trait_names:
-        trait_value = get_character_trait_value(character, trait_name)
-        pool_breakdown[trait_name] = trait_value
-        base_pool += trait_value
+    # Calculate dice pool from traits; Blood Potency rides along in the
+    # same query instead of being looked up separately
+    base_pool, pool_breakdown, values = compile_dice_pool(power.dice_pool).resolve(
+        character, extra_traits=('Blood Potency',)
+    )
 
     # Apply Blood Potency bonus
-    bp_bonus = get_blood_potency_bonus(character, power.discipline.name)
+    bp_bonus = _blood_potency_bonus(values['Blood Potency'])
     pool_breakdown['Blood Potency Bonus'] = bp_bonus
     total_pool = base_pool + bp_bonus
 
@@ -137,6 +133,78 @@ def roll_discipline_power(
     }
 
 
+class DicePoolExpression:
+    """
+    A discipline dice pool string compiled into the traits it sums.
+
+    Compile pool strings with compile_dice_pool(), which caches the result
+    so each distinct DisciplinePower.dice_pool is only parsed once.
+
+    Attributes:
+        source (str): The original pool string
+        trait_names (tuple[str]): Trait names to sum, in order
+    """
+
+    __slots__ = ('source', 'trait_names')
+
+    def __init__(self, source: str):
+        """
+        Parse a dice pool string.
+
+        Each '+' separated term is one trait. A term offering alternatives
+        ("Charisma / Manipulation") uses the first alternative.
+
+        Args:
+            source: Dice pool string, e.g. "Strength + Brawl"
+        """
+        self.source = source
+        trait_names = []
+        for term in (source or '').split('+'):
+            trait_name = term.split('/')[0].strip()
+            if trait_name:
+                trait_names.append(trait_name)
+        self.trait_names = tuple(trait_names)
+
+    def resolve(self, character, extra_traits: Tuple[str, ...] = ()):
+        """
+        Total this pool for a character with a single trait query.
+
+        Args:
+            character: Character object
+            extra_traits: Additional trait names to fetch in the same query
+                (not added to the pool)
+
+        Returns:
+            Tuple of (total_pool, breakdown_dict, values):
+                - total_pool: Sum of the pool's trait values
+                - breakdown_dict: Dict mapping pool trait names to values
+                - values: Dict of every fetched trait value, extras included
+        """
+        values = get_character_trait_values(character, self.trait_names + tuple(extra_traits))
+        breakdown = {name: values[name] for name in self.trait_names}
+        return sum(values[name] for name in self.trait_names), breakdown, values
+
+    def __repr__(self) -> str:
+        return f"DicePoolExpression({self.source!r})"
+
+
+@lru_cache(maxsize=512)
+def compile_dice_pool(pool_string: str) -> DicePoolExpression:
+    """
+    Get the compiled expression for a dice pool string.
+
+    Results are cached by pool string, so repeated activations of a power
+    skip parsing entirely. Expressions are immutable and safe to share.
+
+    Args:
+        pool_string: Dice pool string from DisciplinePower.dice_pool
+
+    Returns:
+        DicePoolExpression for the string
+    """
+    return DicePoolExpression(pool_string)
+
+
 def parse_dice_pool(pool_string: str) -> List[str]:
     """
     Parse a dice pool string into trait names.
@@ -162,24 +230,15 @@ def parse_dice_pool(pool_string: str) -> List[str]:
     if not pool_string:
         return []
 
-    # Handle alternative traits (separated by /)
-    # Take the first option before any '/'
-    if '/' in pool_string:
-        pool_string = pool_string.split('/')[0].strip()
-
-    # Split on '+' to get individual traits
-    traits = [trait.strip() for trait in pool_string.split('+')]
-
-    # Filter out empty strings
-    traits = [t for t in traits if t]
-
-    return traits
+    return list(compile_dice_pool(pool_string).trait_names)
 
 
 def calculate_pool_from_traits(character, trait_names: List[str]) -> Tuple[int, Dict[str, int]]:
     """
     Calculate total dice pool from a list of trait names.
 
+    All trait values are fetched with a single query.
+
     Args:
         character: Character object
         trait_names: List of trait names to sum
@@ -193,15 +252,8 @@ def calculate_pool_from_traits(character, trait_names: List[str]) -> Tuple[int,
         >>> total, breakdown = calculate_pool_from_traits(character, ['Strength', 'Brawl'])
         >>> # Returns (7, {'Strength': 4, 'Brawl': 3})
     """
-    total = 0
-    breakdown = {}
-
-    for trait_name in trait_names:
-        value = get_character_trait_value(character, trait_name)
-        breakdown[trait_name] = value
-        total += value
-
-    return total, breakdown
+    breakdown = get_character_trait_values(character, trait_names)
+    return sum(breakdown[name] for name in trait_names), breakdown
 
 
 def get_blood_potency_bonus(character, discipline_name: str) -> int:
@@ -227,9 +279,11 @@ def get_blood_potency_bonus(character, discipline_name: str) -> int:
         >>> get_blood_potency_bonus(character, "Auspex")
         2  # Character has BP 4
     """
-    blood_potency = get_character_trait_value(character, 'Blood Potency')
+    return _blood_potency_bonus(get_character_trait_value(character, 'Blood Potency'))
+
 
-    # Calculate bonus based on BP level
+def _blood_potency_bonus(blood_potency: int) -> int:
+    """Bonus dice for a Blood Potency rating (see get_blood_potency_bonus)."""
     if blood_potency >= 10:
         return 5
     elif blood_potency >= 8:
@@ -268,7 +322,7 @@ def can_use_power(character, power_name: str) -> Tuple[bool, str]:
     """
     # Look up the power
     try:
-        power = DisciplinePower.objects.get(name__iexact=power_name)
+        power = DisciplinePower.objects.get(name__lower=power_name.lower())
     except DisciplinePower.DoesNotExist:
         return False, f"Power '{power_name}' not found"
 
@@ -330,7 +384,7 @@ def get_character_discipline_powers(character, discipline_name: Optional[str] =
 
     # Filter by discipline if specified
     if discipline_name:
-        char_powers = char_powers.filter(power__discipline__name__iexact=discipline_name)
+        char_powers = char_powers.filter(power__discipline__name__lower=discipline_name.lower())
 
     # Build result list
     results = []
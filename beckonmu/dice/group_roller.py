@@ -0,0 +1,244 @@
+"""
+Group and Contested Roll Resolution for Scenes
+
+Rolls one pool for a whole list of characters, or resolves many contested
+pairs, in a single call. Pools can be a fixed number of dice or a trait
+expression such as "Wits + Awareness"; trait expressions are resolved for
+every participant with one database query (see
+traits.utils.get_trait_values_for_characters), and each participant rolls
+with their own Hunger.
+
+The format_* helpers build one consolidated message for the whole group,
+so a scene gets a single room broadcast instead of one per roller.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from .dice_roller import roll_v5_pool, roll_contested
+from .discipline_roller import compile_dice_pool, DicePoolExpression
+from .rouse_checker import get_hunger_level
+from traits.utils import get_trait_values_for_characters
+
+
+PoolSpec = Union[int, DicePoolExpression]
+
+# Short result labels for the compact group display
+_RESULT_LABELS = {
+    'success': "|gSuccess|n",
+    'critical_success': "|y|hCritical|n",
+    'messy_critical': "|r|hMessy Critical|n",
+    'failure': "|rFailure|n",
+    'bestial_failure': "|r|hBestial Failure|n",
+}
+
+
+def parse_pool_spec(text: str) -> PoolSpec:
+    """
+    Parse a group roll pool: a number of dice or a trait expression.
+
+    Args:
+        text: e.g. "6" or "Dexterity + Stealth"
+
+    Returns:
+        The dice count, or a compiled DicePoolExpression
+
+    Raises:
+        ValueError: If the pool is empty or not a positive number of dice
+    """
+    text = text.strip()
+    if not text:
+        raise ValueError("Must specify a dice pool")
+    if text.lstrip('-').isdigit():
+        pool_size = int(text)
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        return pool_size
+
+    expression = compile_dice_pool(text)
+    if not expression.trait_names:
+        raise ValueError(f"Could not read dice pool '{text}'")
+    return expression
+
+
+def resolve_group_pools(characters: Sequence, specs: Sequence[PoolSpec]) -> List[int]:
+    """
+    Work out each character's pool size, fetching all traits in one query.
+
+    Args:
+        characters: Characters rolling
+        specs: Pool spec for each character (same order)
+
+    Returns:
+        Pool size per character (minimum 1, a chance die)
+    """
+    trait_names = []
+    for spec in specs:
+        if isinstance(spec, DicePoolExpression):
+            for name in spec.trait_names:
+                if name not in trait_names:
+                    trait_names.append(name)
+
+    values = get_trait_values_for_characters(characters, trait_names) if trait_names else {}
+
+    pools = []
+    for character, spec in zip(characters, specs):
+        if isinstance(spec, DicePoolExpression):
+            character_values = values[character.id]
+            pool_size = sum(character_values[name] for name in spec.trait_names)
+        else:
+            pool_size = spec
+        pools.append(max(1, pool_size))
+    return pools
+
+
+def _roll_for(character, pool_size: int, difficulty: int = 0):
+    """Roll a pool with the character's Hunger (capped at the pool size)."""
+    hunger = min(get_hunger_level(character), pool_size)
+    return hunger, roll_v5_pool(pool_size, hunger, difficulty)
+
+
+def roll_group(characters: Sequence, spec: PoolSpec, difficulty: int = 0) -> List[Dict[str, Any]]:
+    """
+    Roll the same pool for every character in a group.
+
+    Args:
+        characters: Characters rolling
+        spec: Dice count or trait expression (see parse_pool_spec)
+        difficulty: Successes needed (0 = any success)
+
+    Returns:
+        List with one dict per character, in order:
+            - 'character': The character
+            - 'pool' (int): Dice rolled
+            - 'hunger' (int): Hunger dice rolled
+            - 'result' (RollResult): The roll
+
+    Example:
+        >>> rolls = roll_group(guests, parse_pool_spec("Wits + Awareness"), 3)
+        >>> room.msg_contents(format_group_roll(rolls, "Wits + Awareness", 3))
+    """
+    characters = list(characters)
+    pools = resolve_group_pools(characters, [spec] * len(characters))
+
+    rolls = []
+    for character, pool_size in zip(characters, pools):
+        hunger, result = _roll_for(character, pool_size, difficulty)
+        rolls.append({
+            'character': character,
+            'pool': pool_size,
+            'hunger': hunger,
+            'result': result,
+        })
+    return rolls
+
+
+def roll_contested_group(
+    pairs: Sequence[Tuple[Any, Any]],
+    spec1: PoolSpec,
+    spec2: PoolSpec
+) -> List[Dict[str, Any]]:
+    """
+    Resolve many contested rolls at once.
+
+    Every first character rolls spec1 and every second character rolls
+    spec2; all traits for all participants are fetched in one query.
+
+    Args:
+        pairs: (character1, character2) for each contest
+        spec1: Pool for the first character of each pair
+        spec2: Pool for the second character of each pair
+
+    Returns:
+        List with one dict per pair, in order:
+            - 'roller1', 'roller2': The characters
+            - 'pool1', 'pool2' (int): Dice rolled by each
+            - 'contest' (dict): roll_contested() result (results, winner, margin)
+    """
+    pairs = list(pairs)
+    characters = [character for pair in pairs for character in pair]
+    specs = [spec for _ in pairs for spec in (spec1, spec2)]
+    pools = resolve_group_pools(characters, specs)
+
+    contests = []
+    for i, (roller1, roller2) in enumerate(pairs):
+        pool1, pool2 = pools[2 * i], pools[2 * i + 1]
+        contests.append({
+            'roller1': roller1,
+            'roller2': roller2,
+            'pool1': pool1,
+            'pool2': pool2,
+            'contest': roll_contested(
+                pool1, min(get_hunger_level(roller1), pool1),
+                pool2, min(get_hunger_level(roller2), pool2)
+            ),
+        })
+    return contests
+
+
+def _describe_spec(spec: PoolSpec) -> str:
+    """Display text for a pool spec."""
+    if isinstance(spec, DicePoolExpression):
+        return " + ".join(spec.trait_names)
+    return f"{spec} dice"
+
+
+def _format_line(name: str, pool_size: int, result) -> str:
+    """One participant's line in a consolidated roll message."""
+    dice = result._format_dice_list(result.regular_dice)
+    if result.hunger_dice:
+        dice += " " + result._format_dice_list(result.hunger_dice, is_hunger=True)
+    return (f"  |c{name}|n ({pool_size}): {dice} "
+            f"{result.total_successes} - {_RESULT_LABELS[result.result_type]}")
+
+
+def format_group_roll(rolls: List[Dict[str, Any]], spec: PoolSpec, difficulty: int = 0) -> str:
+    """
+    Format a whole group roll as one message.
+
+    Args:
+        rolls: Result of roll_group()
+        spec: Pool spec that was rolled
+        difficulty: Difficulty that was rolled against
+
+    Returns:
+        Formatted string with ANSI color codes
+    """
+    header = f"|c=== Group Roll: {_describe_spec(spec)}"
+    if difficulty > 0:
+        header += f" vs {difficulty}"
+    lines = [header + " ===|n"]
+
+    for roll in rolls:
+        lines.append(_format_line(roll['character'].key, roll['pool'], roll['result']))
+
+    succeeded = sum(1 for roll in rolls if roll['result'].is_success)
+    lines.append(f"|w{succeeded} of {len(rolls)} succeeded.|n")
+    return "\n".join(lines)
+
+
+def format_contested_group(contests: List[Dict[str, Any]], spec1: PoolSpec, spec2: PoolSpec) -> str:
+    """
+    Format a batch of contested rolls as one message.
+
+    Args:
+        contests: Result of roll_contested_group()
+        spec1: Pool rolled by the first character of each pair
+        spec2: Pool rolled by the second character of each pair
+
+    Returns:
+        Formatted string with ANSI color codes
+    """
+    lines = [f"|c=== Contested Rolls: {_describe_spec(spec1)} vs {_describe_spec(spec2)} ===|n"]
+
+    for entry in contests:
+        contest = entry['contest']
+        name1, name2 = entry['roller1'].key, entry['roller2'].key
+        lines.append(_format_line(name1, entry['pool1'], contest['roller1_result']))
+        lines.append(_format_line(name2, entry['pool2'], contest['roller2_result']))
+        if contest['is_tie']:
+            lines.append(f"  |y{name1} and {name2} tie.|n")
+        else:
+            winner = name1 if contest['winner'] == 1 else name2
+            lines.append(f"  |g{winner} wins by {contest['margin']}.|n")
+
+    return "\n".join(lines)
@@ -0,0 +1,263 @@
+"""
+Exact Probability Engine for V5 Dice Pools
+
+This module computes the exact outcome distribution of a V5 dice pool
+instead of sampling it. The distribution is built with dynamic programming
+over regular and Hunger d10s, using the same rules as RollResult:
+
+- 6-9 = 1 success, 10 = 2 successes
+- Critical = at least two 10s
+- Messy Critical = critical success with at least one Hunger 10
+- Bestial Failure = failure with a Hunger 1 and no regular 1s
+
+Every pool from 1 to MAX_ODDS_POOL and every Hunger level from 0 to 5 is
+precomputed once into a table, so answering a query is a dictionary lookup.
+"""
+
+from typing import Dict, Any, Tuple
+
+
+# Largest pool covered by the precomputed odds table
+MAX_ODDS_POOL = 30
+
+# Largest Hunger level covered by the precomputed odds table
+MAX_ODDS_HUNGER = 5
+
+# Ways a single d10 can land in each scoring class: (successes, is_one, is_ten, ways)
+_FACE_CLASSES = (
+    (0, True, False, 1),   # 1
+    (0, False, False, 4),  # 2-5
+    (1, False, False, 4),  # 6-9
+    (2, False, True, 1),   # 10
+)
+
+# (pool, hunger) -> cumulative outcome tables, filled by _build_odds_table()
+_ODDS_TABLE: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+
+def _add_die(states: Dict[tuple, int], is_hunger: bool) -> Dict[tuple, int]:
+    """
+    Add one die to a distribution of partial pool states.
+
+    A state is (successes, tens, hunger_ten, hunger_one, regular_one), where
+    tens is capped at 2 since only "two or more" matters for criticals.
+    Values are exact outcome counts, not probabilities.
+
+    Args:
+        states: Mapping of state tuple to number of ways to reach it
+        is_hunger: Whether the added die is a Hunger die
+
+    Returns:
+        New state mapping with the die added
+    """
+    new_states: Dict[tuple, int] = {}
+    for (successes, tens, h_ten, h_one, r_one), ways in states.items():
+        for face_successes, is_one, is_ten, face_ways in _FACE_CLASSES:
+            if is_hunger:
+                key = (
+                    successes + face_successes,
+                    min(2, tens + is_ten),
+                    h_ten or is_ten,
+                    h_one or is_one,
+                    r_one,
+                )
+            else:
+                key = (
+                    successes + face_successes,
+                    min(2, tens + is_ten),
+                    h_ten,
+                    h_one,
+                    r_one or is_one,
+                )
+            new_states[key] = new_states.get(key, 0) + ways * face_ways
+    return new_states
+
+
+def _summarize(states: Dict[tuple, int], pool_size: int) -> Dict[str, Any]:
+    """
+    Collapse a full pool distribution into cumulative lookup tables.
+
+    For each success count s the table stores the probability of rolling
+    at least s successes (overall, as a critical, and as a messy critical)
+    and of rolling fewer than s successes with a bestial pattern. Any
+    difficulty then resolves with a single index into these lists.
+
+    Args:
+        states: Final state mapping for the whole pool
+        pool_size: Number of dice in the pool
+
+    Returns:
+        Dictionary of per-success-count and cumulative probability lists
+    """
+    max_successes = pool_size * 2
+    total_ways = 10 ** pool_size
+
+    exact = [0] * (max_successes + 1)
+    critical = [0] * (max_successes + 1)
+    messy = [0] * (max_successes + 1)
+    bestial = [0] * (max_successes + 1)
+
+    for (successes, tens, h_ten, h_one, r_one), ways in states.items():
+        exact[successes] += ways
+        if tens >= 2:
+            critical[successes] += ways
+            if h_ten:
+                messy[successes] += ways
+        if h_one and not r_one:
+            bestial[successes] += ways
+
+    # at_least[s] = P(successes >= s); one extra slot keeps s = max + 1 valid
+    at_least = [0.0] * (max_successes + 2)
+    critical_at_least = [0.0] * (max_successes + 2)
+    messy_at_least = [0.0] * (max_successes + 2)
+    bestial_below = [0.0] * (max_successes + 2)
+
+    running = running_crit = running_messy = 0
+    for s in range(max_successes, -1, -1):
+        running += exact[s]
+        running_crit += critical[s]
+        running_messy += messy[s]
+        at_least[s] = running / total_ways
+        critical_at_least[s] = running_crit / total_ways
+        messy_at_least[s] = running_messy / total_ways
+
+    running_bestial = 0
+    for s in range(max_successes + 1):
+        bestial_below[s] = running_bestial / total_ways
+        running_bestial += bestial[s]
+    bestial_below[max_successes + 1] = running_bestial / total_ways
+
+    return {
+        'distribution': [ways / total_ways for ways in exact],
+        'expected_successes': sum(s * ways for s, ways in enumerate(exact)) / total_ways,
+        'at_least': at_least,
+        'critical_at_least': critical_at_least,
+        'messy_at_least': messy_at_least,
+        'bestial_below': bestial_below,
+    }
+
+
+def _build_odds_table() -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """
+    Precompute the odds table for every supported (pool, hunger) pair.
+
+    Hunger dice are added first, then regular dice one at a time; each
+    intermediate distribution is exactly the pool with that many regular
+    dice, so a single pass per Hunger level covers every pool size.
+
+    Returns:
+        The populated module-level odds table
+    """
+    if _ODDS_TABLE:
+        return _ODDS_TABLE
+
+    for hunger in range(MAX_ODDS_HUNGER + 1):
+        states = {(0, 0, False, False, False): 1}
+        for _ in range(hunger):
+            states = _add_die(states, is_hunger=True)
+
+        for pool_size in range(hunger, MAX_ODDS_POOL + 1):
+            if pool_size > hunger:
+                states = _add_die(states, is_hunger=False)
+            if pool_size >= 1:
+                _ODDS_TABLE[(pool_size, hunger)] = _summarize(states, pool_size)
+
+    return _ODDS_TABLE
+
+
+def calculate_odds(pool_size: int, hunger: int = 0, difficulty: int = 0) -> Dict[str, Any]:
+    """
+    Look up the exact outcome probabilities for a V5 roll.
+
+    Result types match RollResult.result_type and are mutually exclusive,
+    so 'success', 'critical_success' and 'messy_critical' together make up
+    'total_success', and 'failure' plus 'bestial_failure' make up the rest.
+
+    Args:
+        pool_size: Total number of dice (1 to MAX_ODDS_POOL)
+        hunger: Current Hunger level (0-5, cannot exceed pool_size)
+        difficulty: Number of successes needed (0 = any success wins)
+
+    Returns:
+        Dictionary containing:
+            - 'total_success' (float): Chance the roll succeeds at all
+            - 'success' (float): Chance of a plain success
+            - 'critical_success' (float): Chance of a clean critical
+            - 'messy_critical' (float): Chance of a Messy Critical
+            - 'failure' (float): Chance of a plain failure
+            - 'bestial_failure' (float): Chance of a Bestial Failure
+            - 'expected_successes' (float): Mean successes rolled
+            - 'distribution' (list[float]): P(exactly n successes) by n
+
+    Raises:
+        ValueError: If parameters are outside the precomputed table
+
+    Example:
+        >>> odds = calculate_odds(7, hunger=2, difficulty=3)
+        >>> print(f"{odds['total_success']:.1%} to succeed")
+    """
+    if pool_size < 1 or pool_size > MAX_ODDS_POOL:
+        raise ValueError(f"Pool size must be between 1 and {MAX_ODDS_POOL} (got {pool_size})")
+
+    if hunger < 0 or hunger > MAX_ODDS_HUNGER:
+        raise ValueError(f"Hunger must be between 0 and {MAX_ODDS_HUNGER} (got {hunger})")
+
+    if hunger > pool_size:
+        raise ValueError(f"Hunger ({hunger}) cannot exceed pool size ({pool_size})")
+
+    if difficulty < 0:
+        raise ValueError(f"Difficulty must be 0 or greater (got {difficulty})")
+
+    entry = _build_odds_table()[(pool_size, hunger)]
+
+    # Difficulty 0 still needs one success; anything above the maximum is impossible
+    threshold = min(max(difficulty, 1), pool_size * 2 + 1)
+
+    total_success = entry['at_least'][threshold]
+    critical = entry['critical_at_least'][threshold]
+    messy = entry['messy_at_least'][threshold]
+    bestial = entry['bestial_below'][threshold]
+
+    return {
+        'total_success': total_success,
+        'success': total_success - critical,
+        'critical_success': critical - messy,
+        'messy_critical': messy,
+        'failure': 1.0 - total_success - bestial,
+        'bestial_failure': bestial,
+        'expected_successes': entry['expected_successes'],
+        'distribution': entry['distribution'],
+    }
+
+
+def format_odds(pool_size: int, hunger: int = 0, difficulty: int = 0) -> str:
+    """
+    Format the odds for a roll as a colored summary for display.
+
+    Args:
+        pool_size: Total number of dice
+        hunger: Current Hunger level
+        difficulty: Number of successes needed
+
+    Returns:
+        Formatted string with ANSI color codes
+    """
+    odds = calculate_odds(pool_size, hunger, difficulty)
+
+    lines = []
+    lines.append("|c=== Dice Odds ===|n")
+    lines.append(f"Pool: {pool_size} dice (Hunger: {hunger})")
+    if difficulty > 0:
+        lines.append(f"Difficulty: {difficulty}")
+    lines.append("")
+    lines.append(f"|gSuccess (any):|n      {odds['total_success']:6.1%}")
+    lines.append(f"  |gSuccess:|n          {odds['success']:6.1%}")
+    lines.append(f"  |y|hCritical:|n         {odds['critical_success']:6.1%}")
+    lines.append(f"  |y|hMessy Critical:|n   {odds['messy_critical']:6.1%}")
+    lines.append(f"|rFailure (any):|n      {1.0 - odds['total_success']:6.1%}")
+    lines.append(f"  |rFailure:|n          {odds['failure']:6.1%}")
+    lines.append(f"  |r|hBestial Failure:|n  {odds['bestial_failure']:6.1%}")
+    lines.append("")
+    lines.append(f"Expected successes: {odds['expected_successes']:.2f}")
+
+    return "\n".join(lines)
@@ -0,0 +1,240 @@
+"""
+Willpower Reroll Advisor
+
+Suggests which failed regular dice to reroll when spending Willpower.
+
+Only failed regular dice (1-5) can be rerolled, up to three of them (see
+dice_roller.apply_willpower_reroll). Every failed die has the same chance
+to turn into a success, so the only real choices are how many dice to
+reroll and whether to include regular 1s: a regular 1 is what stops a
+Hunger 1 from making a failure bestial, so rerolling the last one can
+trade a safe failure for a Bestial Failure.
+
+A roll's reroll prospects depend only on a few counts: regular 1s and
+2-5s available, successes still needed, 10s already rolled, and whether a
+Hunger die shows a 10 or a 1. Every combination of those is small enough
+to precompute, so advice is a single lookup in a table built on first use.
+"""
+
+from itertools import product
+from typing import Dict, Any, List, Tuple
+
+from .core import SUCCESS_THRESHOLD, CRITICAL_VALUE
+
+
+# Most dice a Willpower reroll can change
+MAX_REROLLS = 3
+
+# Successes still needed beyond what three rerolled dice can add (2 each)
+# all behave alike, so the table stops here
+_MAX_NEED = MAX_REROLLS * 2 + 1
+
+# (successes added, 10s added, any 1 rolled) -> probability, per number of dice
+_REROLL_OUTCOMES: Dict[int, Dict[Tuple[int, int, bool], float]] = {}
+
+# (ones, blanks, need, tens, hunger_ten, hunger_one) -> advice
+_ADVICE_TABLE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _build_reroll_outcomes() -> Dict[int, Dict[Tuple[int, int, bool], float]]:
+    """
+    Enumerate every result of rerolling 0-3 dice, collapsed to what matters.
+
+    Returns:
+        The populated module-level outcome table
+    """
+    if _REROLL_OUTCOMES:
+        return _REROLL_OUTCOMES
+
+    for count in range(MAX_REROLLS + 1):
+        outcomes: Dict[Tuple[int, int, bool], float] = {}
+        for faces in product(range(1, 11), repeat=count):
+            tens = sum(1 for die in faces if die == CRITICAL_VALUE)
+            successes = sum(1 for die in faces if die >= SUCCESS_THRESHOLD) + tens
+            key = (successes, tens, 1 in faces)
+            outcomes[key] = outcomes.get(key, 0) + 1
+        _REROLL_OUTCOMES[count] = {key: ways / 10 ** count for key, ways in outcomes.items()}
+
+    return _REROLL_OUTCOMES
+
+
+def _evaluate(ones: int, blanks: int, reroll_ones: int, reroll_blanks: int,
+              need: int, tens: int, hunger_ten: bool, hunger_one: bool) -> Dict[str, float]:
+    """
+    Exact outcome chances for one choice of dice to reroll.
+
+    Args:
+        ones: Regular 1s in the roll (capped, see _advice_key)
+        blanks: Regular 2-5s in the roll (capped)
+        reroll_ones: Regular 1s to reroll
+        reroll_blanks: Regular 2-5s to reroll
+        need: Successes still needed to succeed
+        tens: 10s already rolled (capped at 2)
+        hunger_ten: Whether a Hunger die shows 10
+        hunger_one: Whether a Hunger die shows 1
+
+    Returns:
+        Chances of success, critical, messy critical and bestial failure
+    """
+    kept_one = ones - reroll_ones > 0
+    chances = {'success': 0.0, 'critical': 0.0, 'messy_critical': 0.0, 'bestial_failure': 0.0}
+
+    for (added, added_tens, rolled_one), chance in _REROLL_OUTCOMES[reroll_ones + reroll_blanks].items():
+        if added >= need:
+            chances['success'] += chance
+            if tens + added_tens >= 2:
+                chances['critical'] += chance
+                if hunger_ten:
+                    chances['messy_critical'] += chance
+        elif hunger_one and not kept_one and not rolled_one:
+            chances['bestial_failure'] += chance
+
+    return chances
+
+
+def _build_advice_table() -> Dict[tuple, Dict[str, Any]]:
+    """
+    Precompute the best reroll for every reachable roll state.
+
+    Choices are ranked by chance of success, then by lower chance of a
+    Bestial Failure, then by fewer dice rerolled. Rerolling nothing is
+    always a candidate, so advice never makes a roll worse.
+
+    Returns:
+        The populated module-level advice table
+    """
+    if _ADVICE_TABLE:
+        return _ADVICE_TABLE
+
+    _build_reroll_outcomes()
+
+    # One more 1 than can be rerolled, so "a 1 stays behind" is representable
+    for ones, blanks, need, tens, hunger_ten, hunger_one in product(
+        range(MAX_REROLLS + 2), range(MAX_REROLLS + 1), range(_MAX_NEED + 1),
+        range(3), (False, True), (False, True)
+    ):
+        best = None
+        for reroll_ones in range(min(ones, MAX_REROLLS) + 1):
+            for reroll_blanks in range(min(blanks, MAX_REROLLS - reroll_ones) + 1):
+                chances = _evaluate(ones, blanks, reroll_ones, reroll_blanks,
+                                    need, tens, hunger_ten, hunger_one)
+                rank = (chances['success'], -chances['bestial_failure'],
+                        -(reroll_ones + reroll_blanks))
+                if best is None or rank > best[0]:
+                    best = (rank, reroll_ones, reroll_blanks, chances)
+
+        _, reroll_ones, reroll_blanks, chances = best
+        _ADVICE_TABLE[(ones, blanks, need, tens, hunger_ten, hunger_one)] = {
+            'reroll_ones': reroll_ones,
+            'reroll_blanks': reroll_blanks,
+            'success_chance': chances['success'],
+            'critical_chance': chances['critical'],
+            'messy_chance': chances['messy_critical'],
+            'bestial_chance': chances['bestial_failure'],
+        }
+
+    return _ADVICE_TABLE
+
+
+def _advice_key(result) -> tuple:
+    """
+    Reduce a roll to the counts that decide its reroll prospects.
+
+    Args:
+        result: RollResult to reroll
+
+    Returns:
+        Key into the advice table
+    """
+    tally = result.tally
+    ones = tally.regular_ones
+    blanks = len(result.regular_dice) - tally.regular_successes - ones
+    need = max(result.difficulty, 1) - result.total_successes
+    return (
+        min(ones, MAX_REROLLS + 1),
+        min(blanks, MAX_REROLLS),
+        min(max(need, 0), _MAX_NEED),
+        min(tally.tens, 2),
+        tally.hunger_tens > 0,
+        tally.hunger_ones > 0,
+    )
+
+
+def advise_reroll(result) -> Dict[str, Any]:
+    """
+    Pick the best failed regular dice to reroll with Willpower.
+
+    A roll that already succeeds, or that no reroll can rescue, gets an
+    empty suggestion: spending Willpower would not change the outcome.
+
+    Args:
+        result: RollResult to reroll
+
+    Returns:
+        Dictionary containing:
+            - 'indices' (list[int]): Regular dice to reroll (may be empty)
+            - 'success_chance' (float): Chance of success after rerolling
+            - 'critical_chance' (float): Chance of a critical (messy or not)
+            - 'messy_chance' (float): Chance of a Messy Critical
+            - 'bestial_chance' (float): Chance of a Bestial Failure
+            - 'gain' (float): Improvement in chance of success
+
+    Example:
+        >>> advice = advise_reroll(result)
+        >>> if advice['indices']:
+        >>>     new_result, _ = apply_willpower_reroll(result, indices=advice['indices'])
+    """
+    advice = _build_advice_table()[_advice_key(result)]
+    current = 1.0 if result.is_success else 0.0
+
+    indices: List[int] = []
+    if advice['success_chance'] > current:
+        ones_left = advice['reroll_ones']
+        blanks_left = advice['reroll_blanks']
+        for i, die in enumerate(result.regular_dice):
+            if die == 1 and ones_left:
+                indices.append(i)
+                ones_left -= 1
+            elif 1 < die < SUCCESS_THRESHOLD and blanks_left:
+                indices.append(i)
+                blanks_left -= 1
+
+    if not indices:
+        return {
+            'indices': [],
+            'success_chance': current,
+            'critical_chance': 1.0 if result.is_critical else 0.0,
+            'messy_chance': 1.0 if result.is_messy_critical else 0.0,
+            'bestial_chance': 1.0 if result.is_bestial_failure else 0.0,
+            'gain': 0.0,
+        }
+
+    return {
+        'indices': indices,
+        'success_chance': advice['success_chance'],
+        'critical_chance': advice['critical_chance'],
+        'messy_chance': advice['messy_chance'],
+        'bestial_chance': advice['bestial_chance'],
+        'gain': advice['success_chance'] - current,
+    }
+
+
+def format_advice(result, advice: Dict[str, Any]) -> str:
+    """
+    Describe reroll advice for display.
+
+    Args:
+        result: RollResult the advice is for
+        advice: Result of advise_reroll()
+
+    Returns:
+        One-line suggestion with ANSI color codes
+    """
+    if not advice['indices']:
+        return "|xA Willpower reroll cannot improve this roll.|n"
+
+    dice = ", ".join(str(result.regular_dice[i]) for i in advice['indices'])
+    line = f"|ySuggested reroll:|n [{dice}] for {advice['success_chance']:.0%} to succeed"
+    if advice['bestial_chance'] > 0:
+        line += f" ({advice['bestial_chance']:.0%} Bestial Failure)"
+    return line
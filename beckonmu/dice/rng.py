@@ -0,0 +1,232 @@
+"""
+Buffered Dice Entropy Source
+
+All d10s in the game are drawn from a DiceRNG. Instead of one randint call
+per die, a DiceRNG refills a buffer of pre-generated d10 values in bulk and
+hands them out in order.
+
+A DiceRNG can also be seeded. A seeded RNG produces the same stream of
+dice every time, so any roll can be replayed exactly from the seed and the
+offset (number of dice drawn before it). Rooms with a `dice_seed` attribute
+roll from a seeded per-scene RNG; staff can then settle disputed rolls with
+replay_dice() instead of storing every die.
+"""
+
+import random
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+# Dice generated per refill
+DEFAULT_BUFFER_SIZE = 1024
+
+# Dice skipped per step when fast-forwarding to an offset
+_SKIP_CHUNK = 4096
+
+_FACES = range(1, 11)
+
+# Range of seeds the roll log can store (a signed 64-bit integer)
+MIN_SEED = -2 ** 63
+MAX_SEED = 2 ** 63 - 1
+
+
+class DiceRNG:
+    """
+    Buffered, optionally seeded source of d10 results.
+
+    The stream of dice depends only on the seed, never on the buffer size
+    or on how draws are split, so (seed, offset) identifies any die.
+
+    Attributes:
+        seed (int or None): Seed of the stream, None for an unseeded RNG
+        offset (int): Number of dice handed out so far
+    """
+
+    def __init__(self, seed: Optional[int] = None, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Create a dice RNG.
+
+        Args:
+            seed: Seed for a replayable stream, or None for OS entropy
+            buffer_size: Dice generated per refill
+        """
+        self.seed = seed
+        self.offset = 0
+        self._random = random.Random(seed)
+        self._buffer_size = buffer_size
+        self._buffer: List[int] = []
+        self._index = 0
+
+    def _refill(self, needed: int) -> None:
+        """Top up the buffer so at least `needed` undrawn dice are available."""
+        remaining = self._buffer[self._index:]
+        count = max(self._buffer_size, needed - len(remaining))
+        self._buffer = remaining + self._random.choices(_FACES, k=count)
+        self._index = 0
+
+    def draw(self, count: int) -> List[int]:
+        """
+        Hand out the next `count` dice.
+
+        Args:
+            count: Number of dice to draw
+
+        Returns:
+            List of die results (1-10)
+        """
+        end = self._index + count
+        if end > len(self._buffer):
+            self._refill(count)
+            end = count
+        dice = self._buffer[self._index:end]
+        self._index = end
+        self.offset += count
+        return dice
+
+    def skip(self, count: int) -> None:
+        """
+        Discard the next `count` dice, e.g. to fast-forward to an offset.
+
+        Args:
+            count: Number of dice to discard
+        """
+        while count > 0:
+            step = min(count, _SKIP_CHUNK)
+            self.draw(step)
+            count -= step
+
+
+# RNG used when no scene RNG is active
+_default_rng = DiceRNG()
+
+# RNG currently used by the dice core (swapped by use_rng)
+_active_rng = _default_rng
+
+# Seeded per-scene RNGs, keyed by room id
+_scene_rngs: Dict[int, DiceRNG] = {}
+
+
+def get_rng() -> DiceRNG:
+    """
+    Get the RNG the dice core is currently drawing from.
+
+    Returns:
+        The active DiceRNG
+    """
+    return _active_rng
+
+
+@contextmanager
+def use_rng(rng: DiceRNG):
+    """
+    Route every die rolled inside the block through `rng`.
+
+    Example:
+        >>> with use_rng(get_scene_rng(room)):
+        >>>     result = roll_v5_pool(5, hunger=2)
+    """
+    global _active_rng
+    previous = _active_rng
+    _active_rng = rng
+    try:
+        yield rng
+    finally:
+        _active_rng = previous
+
+
+def get_scene_rng(location) -> DiceRNG:
+    """
+    Get the RNG for rolls made in a location.
+
+    Locations with a `dice_seed` attribute get a seeded RNG that resumes
+    from their stored `dice_offset`; everywhere else uses the shared
+    unseeded RNG.
+
+    Args:
+        location: Room the roll happens in (may be None)
+
+    Returns:
+        DiceRNG to roll with
+    """
+    seed = location.db.dice_seed if location else None
+    if seed is None:
+        return _default_rng
+
+    rng = _scene_rngs.get(location.id)
+    if rng is None or rng.seed != seed:
+        rng = DiceRNG(seed)
+        rng.skip(location.db.dice_offset or 0)
+        _scene_rngs[location.id] = rng
+    return rng
+
+
+@contextmanager
+def scene_dice(location):
+    """
+    Roll everything inside the block from the location's scene RNG.
+
+    For seeded locations the new stream offset is saved on exit, so the
+    scene resumes at the right place after a server reload.
+
+    Args:
+        location: Room the roll happens in (may be None)
+
+    Example:
+        >>> with scene_dice(caller.location) as rng:
+        >>>     start = rng.offset
+        >>>     result = roll_v5_pool(5, hunger=2)
+    """
+    rng = get_scene_rng(location)
+    try:
+        with use_rng(rng):
+            yield rng
+    finally:
+        if rng.seed is not None:
+            location.db.dice_offset = rng.offset
+
+
+def set_scene_seed(location, seed: Optional[int]) -> None:
+    """
+    Start (or stop) seeded rolling for a location.
+
+    Setting a seed restarts the scene's stream at offset 0. Passing None
+    returns the location to the shared unseeded RNG.
+
+    Args:
+        location: Room to configure
+        seed: New seed, or None to disable replay mode
+
+    Raises:
+        ValueError: If the seed is outside MIN_SEED..MAX_SEED
+    """
+    if seed is not None and not MIN_SEED <= seed <= MAX_SEED:
+        raise ValueError(f"Seed must be between {MIN_SEED} and {MAX_SEED}.")
+
+    _scene_rngs.pop(location.id, None)
+    if seed is None:
+        location.attributes.remove("dice_seed")
+        location.attributes.remove("dice_offset")
+    else:
+        location.db.dice_seed = seed
+        location.db.dice_offset = 0
+
+
+def replay_dice(seed: int, offset: int, count: int) -> List[int]:
+    """
+    Reproduce dice from a seeded stream.
+
+    Args:
+        seed: Seed the dice were rolled with
+        offset: Number of dice drawn from the stream before them
+        count: Number of dice to reproduce
+
+    Returns:
+        The exact dice originally rolled
+
+    Example:
+        >>> dice = replay_dice(12345, offset=40, count=7)
+        >>> regular, hunger = dice[:5], dice[5:]  # Hunger 2 roll
+    """
+    rng = DiceRNG(seed)
+    rng.skip(offset)
+    return rng.draw(count)
@@ -6,7 +6,7 @@ dice roll outcomes according to Vampire: The Masquerade 5th Edition rules.
 """
 
 from typing import List
-from evennia.utils.ansi import ANSIString
+from .core import DiceTally
 
 
 class RollResult:
@@ -23,7 +23,8 @@ class RollResult:
     Attributes:
         regular_dice (list[int]): Regular dice results (1-10)
         hunger_dice (list[int]): Hunger dice results (1-10)
-        all_dice (list[int]): Combined regular and hunger dice
+        tally (DiceTally): Raw counts from the shared dice core
+        all_dice (list[int]): Combined regular and hunger dice (computed on access)
         difficulty (int): Target number of successes needed
         total_successes (int): Total successes rolled
         is_success (bool): Whether difficulty was met
@@ -34,10 +35,20 @@ class RollResult:
         result_type (str): Overall result classification
     """
 
+    __slots__ = (
+        'regular_dice', 'hunger_dice', 'difficulty', 'tally',
+        'total_successes', 'is_success', 'margin',
+        'is_critical', 'is_messy_critical', 'is_bestial_failure',
+        'result_type', '_formatted',
+    )
+
     def __init__(self, regular_dice: List[int], hunger_dice: List[int], difficulty: int = 0):
         """
         Initialize roll result and perform all analysis.
 
+        Every flag is derived from one DiceTally pass over the dice. Display
+        text is not built here; format_result renders it on first use.
+
         Args:
             regular_dice: Regular dice results (1-10)
             hunger_dice: Hunger dice results (1-10)
@@ -45,122 +56,44 @@ class RollResult:
         """
         self.regular_dice = regular_dice
         self.hunger_dice = hunger_dice
-        self.all_dice = regular_dice + hunger_dice
         self.difficulty = difficulty
 
-        # Core calculations
-        self.total_successes = self._count_successes()
-        self.is_success = self.total_successes >= difficulty if difficulty > 0 else self.total_successes > 0
-        self.margin = self.total_successes - difficulty
-
-        # Special results
-        self.is_critical = self._check_critical()
-        self.is_messy_critical = self._check_messy_critical()
-        self.is_bestial_failure = self._check_bestial_failure()
+        # Single pass over the dice, shared with every other roller
+        tally = self.tally = DiceTally(regular_dice, hunger_dice)
+
+        # Core calculations: 6-9 = 1 success, 10 = 2 successes.
+        # A 10 is already counted once among the 6+ dice; add its second success.
+        total_successes = self.total_successes = tally.successes + tally.tens
+        is_success = self.is_success = total_successes >= max(difficulty, 1)
+        self.margin = total_successes - difficulty
+
+        # Special results:
+        # - Critical: at least two 10s
+        # - Messy Critical: critical with at least one Hunger 10
+        # - Bestial Failure: failure with a Hunger 1 and NO regular 1s
+        is_critical = self.is_critical = tally.tens >= 2
+        is_messy = self.is_messy_critical = is_critical and tally.hunger_tens >= 1
+        is_bestial = self.is_bestial_failure = (
+            not is_success and tally.hunger_ones > 0 and tally.regular_ones == 0
+        )
 
         # Result interpretation
-        self.result_type = self._interpret_result()
-
-    def _count_successes(self) -> int:
-        """
-        Count total successes according to V5 rules.
-
-        Rules:
-        - 6-9 on a die = 1 success
-        - 10 on a die = 2 successes (critical)
-        - 1-5 on a die = 0 successes (failure)
-
-        Returns:
-            Total number of successes
-        """
-        successes = 0
-        for die in self.all_dice:
-            if die >= 6:
-                successes += 2 if die == 10 else 1
-        return successes
-
-    def _check_critical(self) -> bool:
-        """
-        Check for critical win (pair of 10s).
-
-        A critical occurs when at least two dice show 10.
-        Each pair of 10s adds 2 additional successes (4 total from the pair).
-
-        Returns:
-            True if at least two 10s were rolled
-        """
-        tens = sum(1 for die in self.all_dice if die == 10)
-        return tens >= 2
-
-    def _check_messy_critical(self) -> bool:
-        """
-        Check if critical includes a Hunger die showing 10.
-
-        A Messy Critical occurs when you achieve a critical win
-        but at least one of the 10s is on a Hunger die. This means
-        you succeed dramatically but your Beast influences the outcome.
-
-        Returns:
-            True if critical and at least one Hunger die shows 10
-        """
-        if not self.is_critical:
-            return False
-        hunger_tens = sum(1 for die in self.hunger_dice if die == 10)
-        return hunger_tens >= 1
-
-    def _check_bestial_failure(self) -> bool:
-        """
-        Check if failure includes only Hunger dice showing 1s.
-
-        A Bestial Failure occurs when:
-        1. The roll fails (doesn't meet difficulty or has zero successes)
-        2. At least one Hunger die shows a 1
-        3. NO regular dice show 1s
-
-        This represents the Beast taking control during a failure.
-
-        Returns:
-            True if failed roll with only Hunger 1s present
-        """
-        # Must be a failure
-        if self.is_success:
-            return False
-
-        # Must have Hunger dice
-        if not self.hunger_dice:
-            return False
-
-        # Check for 1s on Hunger dice
-        hunger_ones = sum(1 for die in self.hunger_dice if die == 1)
-        if hunger_ones == 0:
-            return False
-
-        # Check that NO regular dice show 1s
-        regular_ones = sum(1 for die in self.regular_dice if die == 1)
-        return regular_ones == 0
+        if not is_success:
+            self.result_type = 'bestial_failure' if is_bestial else 'failure'
+        elif is_messy:
+            self.result_type = 'messy_critical'
+        elif is_critical:
+            self.result_type = 'critical_success'
+        else:
+            self.result_type = 'success'
 
-    def _interpret_result(self) -> str:
-        """
-        Interpret overall result type for display and game logic.
+        # Rendered text per show_details value, created by format_result
+        self._formatted = None
 
-        Result types:
-        - 'bestial_failure': Failed with only Hunger 1s (Beast takes over)
-        - 'failure': Failed without bestial complications
-        - 'messy_critical': Critical success with Hunger complications
-        - 'critical_success': Critical success without complications
-        - 'success': Normal success
-
-        Returns:
-            String describing result type
-        """
-        if not self.is_success:
-            return 'bestial_failure' if self.is_bestial_failure else 'failure'
-        elif self.is_messy_critical:
-            return 'messy_critical'
-        elif self.is_critical:
-            return 'critical_success'
-        else:
-            return 'success'
+    @property
+    def all_dice(self) -> List[int]:
+        """Combined regular and Hunger dice, built only when asked for."""
+        return self.regular_dice + self.hunger_dice
 
     def format_result(self, show_details: bool = True) -> str:
         """
@@ -173,12 +106,20 @@ class RollResult:
         - Criticals (10): Bright Yellow
         - Failures (1-5): Dark Gray
 
+        The rendered text is cached on first call, so repeat displays of
+        the same roll (roller, room, logs) format it only once.
+
         Args:
             show_details: If True, show detailed breakdown
 
         Returns:
             Formatted string with ANSI color codes
         """
+        if self._formatted is None:
+            self._formatted = {}
+        elif show_details in self._formatted:
+            return self._formatted[show_details]
+
         output = []
 
         # Format dice display
@@ -204,7 +145,8 @@ class RollResult:
         result_msg = self._get_result_message()
         output.append(f"\n{result_msg}")
 
-        return "\n".join(output)
+        formatted = self._formatted[show_details] = "\n".join(output)
+        return formatted
 
     def _format_dice_list(self, dice: List[int], is_hunger: bool = False) -> str:
         """
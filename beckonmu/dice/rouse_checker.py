@@ -7,6 +7,7 @@ the character trait system to track and update Hunger levels.
 
 from typing import Dict, Any, Optional
 from .dice_roller import roll_rouse_check as base_rouse_check
+from commands.v5.utils.blood_utils import get_hunger_level, set_hunger_level
 from traits.utils import get_character_trait_value
 
 
@@ -50,8 +51,7 @@ def perform_rouse_check(character, reason: str = '', power_level: int = 1) -> Di
         >>>     print(f"Failed. Hunger increased to {result['hunger_after']}")
     """
     # Get current Hunger
-    hunger_before = getattr(character.db, 'hunger', 1)
-    hunger_before = max(0, min(5, hunger_before))  # Clamp to 0-5
+    hunger_before = get_hunger_level(character)
 
     # Check if Hunger is already at maximum
     if hunger_before >= 5:
@@ -90,7 +90,7 @@ def perform_rouse_check(character, reason: str = '', power_level: int = 1) -> Di
     hunger_after = min(5, hunger_before + hunger_change)
 
     # Save updated Hunger to character
-    character.db.hunger = hunger_after
+    set_hunger_level(character, hunger_after)
 
     return {
         'roll': roll_value,
@@ -162,36 +162,6 @@ def can_reroll_rouse(character, power_level: int) -> bool:
     return power_level <= max_reroll_level
 
 
-def get_hunger_level(character) -> int:
-    """
-    Get character's current Hunger level.
-
-    Args:
-        character: Character object
-
-    Returns:
-        int: Hunger level (0-5), defaults to 1 if not set
-    """
-    hunger = getattr(character.db, 'hunger', 1)
-    return max(0, min(5, hunger))  # Clamp to valid range
-
-
-def set_hunger_level(character, hunger: int) -> int:
-    """
-    Set character's Hunger level.
-
-    Args:
-        character: Character object
-        hunger: New Hunger level (will be clamped to 0-5)
-
-    Returns:
-        int: Actual Hunger level set (after clamping)
-    """
-    clamped_hunger = max(0, min(5, hunger))
-    character.db.hunger = clamped_hunger
-    return clamped_hunger
-
-
 def _format_rouse_message(
     roll: int,
     success: bool,
@@ -0,0 +1,252 @@
+"""
+Statistical Validation Tests for V5 Dice
+
+Where dice/tests.py checks individual rule cases, these tests check the
+dice in aggregate:
+
+- ExactDistributionTestCase: The probability engine against brute-force
+  enumeration of every possible roll through RollResult (small pools)
+- BatchRollerStatisticsTestCase: Millions of seeded batch-roller samples
+  against the probability engine, with chi-square goodness-of-fit tests
+  for every pool and Hunger combination in the odds table
+
+Sampling is seeded, so results are reproducible, and vectorized through
+NumPy so the whole module runs in a few seconds. Without NumPy only a
+small pure-Python sample is checked.
+"""
+
+from itertools import product
+from statistics import NormalDist
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+
+from dice.batch_roller import roll_v5_pool_batch, NUMPY_AVAILABLE
+from dice.probability import calculate_odds, MAX_ODDS_POOL, MAX_ODDS_HUNGER
+from dice.roll_result import RollResult
+from dice.rng import DiceRNG, use_rng
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+# Rolls sampled per (pool, hunger) combination; 165 combinations in all
+SAMPLES_PER_COMBINATION = 20000
+
+# Fixed seed so a failure is a real regression, not bad luck
+SAMPLE_SEED = 20251117
+
+# Significance for a single combination, and for all combinations pooled.
+# Deliberately strict: with ~330 individual tests, a sound roller should
+# essentially never trip them, while rule bugs move the statistic by orders
+# of magnitude.
+ALPHA_SINGLE = 1e-7
+ALPHA_POOLED = 1e-4
+
+RESULT_TYPES = ('success', 'critical_success', 'messy_critical', 'failure', 'bestial_failure')
+
+
+def chi_square_critical(dof, alpha):
+    """
+    Upper critical value of the chi-square distribution.
+
+    Uses the Wilson-Hilferty approximation, which is accurate to well
+    under 1% for the degrees of freedom used here.
+
+    Args:
+        dof: Degrees of freedom
+        alpha: Significance level
+
+    Returns:
+        float: Statistic value exceeded with probability alpha
+    """
+    z = NormalDist().inv_cdf(1 - alpha)
+    k = 2 / (9 * dof)
+    return dof * (1 - k + z * k ** 0.5) ** 3
+
+
+def chi_square(observed, probabilities, samples):
+    """
+    Pearson chi-square statistic, merging sparse bins.
+
+    Adjacent bins are merged until each expects at least 5 samples, so
+    rare outcomes (e.g. 50+ successes) don't dominate the statistic.
+
+    Args:
+        observed: Observed count per bin
+        probabilities: Exact probability per bin
+        samples: Total number of samples
+
+    Returns:
+        Tuple of (statistic, degrees_of_freedom)
+    """
+    merged = []
+    pending_observed = pending_expected = 0.0
+    for count, probability in zip(observed, probabilities):
+        pending_observed += count
+        pending_expected += probability * samples
+        if pending_expected >= 5:
+            merged.append((pending_observed, pending_expected))
+            pending_observed = pending_expected = 0.0
+    if pending_expected > 0 or pending_observed > 0:
+        if merged:
+            last_observed, last_expected = merged.pop()
+            merged.append((last_observed + pending_observed, last_expected + pending_expected))
+        else:
+            merged.append((pending_observed, pending_expected))
+
+    statistic = sum((o - e) ** 2 / e for o, e in merged if e > 0)
+    return statistic, max(len(merged) - 1, 1)
+
+
+def result_type_counts(batch):
+    """
+    Count how many rolls of a batch ended in each RollResult.result_type.
+
+    Args:
+        batch: Result of roll_v5_pool_batch() (NumPy arrays)
+
+    Returns:
+        List of counts in RESULT_TYPES order
+    """
+    success = batch['is_success']
+    messy = success & batch['is_messy_critical']
+    critical = success & batch['is_critical'] & ~messy
+    bestial = ~success & batch['is_bestial_failure']
+    return [
+        int((success & ~batch['is_critical']).sum()),
+        int(critical.sum()),
+        int(messy.sum()),
+        int((~success & ~bestial).sum()),
+        int(bestial.sum()),
+    ]
+
+
+def difficulty_for(pool_size):
+    """A difficulty near the pool's average, so every result type occurs."""
+    return max(1, round(pool_size * 0.6))
+
+
+class ExactDistributionTestCase(SimpleTestCase):
+    """Test the probability engine against exhaustive enumeration."""
+
+    def test_engine_matches_enumeration(self):
+        """Test every pool up to 4 dice at every Hunger level."""
+        for pool_size in range(1, 5):
+            # Every difficulty for small pools; the interesting ones for 4 dice
+            if pool_size < 4:
+                difficulties = range(0, pool_size * 2 + 2)
+            else:
+                difficulties = (0, 3, 5, 9)
+
+            for hunger in range(0, pool_size + 1):
+                rolls = [
+                    (list(dice[:pool_size - hunger]), list(dice[pool_size - hunger:]))
+                    for dice in product(range(1, 11), repeat=pool_size)
+                ]
+                total = len(rolls)
+
+                for difficulty in difficulties:
+                    counts = dict.fromkeys(RESULT_TYPES, 0)
+                    successes = [0] * (pool_size * 2 + 1)
+                    for regular, hunger_dice in rolls:
+                        result = RollResult(regular, hunger_dice, difficulty)
+                        counts[result.result_type] += 1
+                        successes[result.total_successes] += 1
+
+                    odds = calculate_odds(pool_size, hunger, difficulty)
+                    for result_type in RESULT_TYPES:
+                        self.assertAlmostEqual(
+                            odds[result_type], counts[result_type] / total,
+                            msg=f"{result_type}: pool {pool_size}, hunger {hunger}, vs {difficulty}"
+                        )
+                    for n, count in enumerate(successes):
+                        self.assertAlmostEqual(odds['distribution'][n], count / total)
+
+
+@skipUnless(NUMPY_AVAILABLE, "NumPy is required for large-sample dice tests")
+class BatchRollerStatisticsTestCase(SimpleTestCase):
+    """Test millions of batch-rolled samples against the exact odds."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Sample every pool and Hunger combination once for all tests."""
+        super().setUpClass()
+        rng = np.random.default_rng(SAMPLE_SEED)
+        cls.samples = {}
+        for pool_size in range(1, MAX_ODDS_POOL + 1):
+            for hunger in range(0, min(pool_size, MAX_ODDS_HUNGER) + 1):
+                cls.samples[(pool_size, hunger)] = roll_v5_pool_batch(
+                    [pool_size] * SAMPLES_PER_COMBINATION,
+                    hungers=hunger,
+                    difficulties=difficulty_for(pool_size),
+                    rng=rng
+                )
+
+    def _check(self, statistics):
+        """Assert each combination and the pooled statistic pass."""
+        pooled_statistic = pooled_dof = 0
+        for combination, (statistic, dof) in statistics.items():
+            self.assertLess(
+                statistic, chi_square_critical(dof, ALPHA_SINGLE),
+                msg=f"pool {combination[0]}, hunger {combination[1]}: chi2={statistic:.1f} (dof {dof})"
+            )
+            pooled_statistic += statistic
+            pooled_dof += dof
+        self.assertLess(pooled_statistic, chi_square_critical(pooled_dof, ALPHA_POOLED))
+
+    def test_success_distribution(self):
+        """Test success counts follow the exact distribution."""
+        statistics = {}
+        for (pool_size, hunger), batch in self.samples.items():
+            odds = calculate_odds(pool_size, hunger)
+            observed = np.bincount(batch['successes'], minlength=len(odds['distribution']))
+            statistics[(pool_size, hunger)] = chi_square(
+                observed, odds['distribution'], SAMPLES_PER_COMBINATION
+            )
+        self._check(statistics)
+
+    def test_result_type_distribution(self):
+        """Test criticals, messy criticals and bestial failures occur at the exact rates."""
+        statistics = {}
+        for (pool_size, hunger), batch in self.samples.items():
+            odds = calculate_odds(pool_size, hunger, difficulty_for(pool_size))
+            observed = result_type_counts(batch)
+            statistics[(pool_size, hunger)] = chi_square(
+                observed, [odds[result_type] for result_type in RESULT_TYPES],
+                SAMPLES_PER_COMBINATION
+            )
+        self._check(statistics)
+
+    def test_detects_rule_regression(self):
+        """Test the chi-square check catches a small rules change."""
+        # Count 10s as one success instead of two: the kind of bug to catch
+        pool_size, hunger = 7, 2
+        rng = np.random.default_rng(SAMPLE_SEED)
+        dice = rng.integers(1, 11, size=(SAMPLES_PER_COMBINATION, pool_size))
+        wrong_successes = (dice >= 6).sum(axis=1)
+
+        odds = calculate_odds(pool_size, hunger)
+        observed = np.bincount(wrong_successes, minlength=len(odds['distribution']))
+        statistic, dof = chi_square(observed, odds['distribution'], SAMPLES_PER_COMBINATION)
+        self.assertGreater(statistic, chi_square_critical(dof, ALPHA_SINGLE))
+
+
+class PythonRollerStatisticsTestCase(SimpleTestCase):
+    """Test the pure-Python path (dice core and DiceRNG) on a smaller sample."""
+
+    def test_python_batch_matches_odds(self):
+        """Test the NumPy-free batch roller against the exact distribution."""
+        from dice.batch_roller import _roll_batch_python
+
+        samples = 5000
+        with use_rng(DiceRNG(seed=SAMPLE_SEED)):
+            for pool_size, hunger in ((1, 1), (5, 2), (12, 5)):
+                batch = _roll_batch_python([pool_size] * samples, [hunger] * samples, [0] * samples)
+                odds = calculate_odds(pool_size, hunger)
+
+                observed = [0] * len(odds['distribution'])
+                for successes in batch['successes']:
+                    observed[successes] += 1
+                statistic, dof = chi_square(observed, odds['distribution'], samples)
+                self.assertLess(statistic, chi_square_critical(dof, ALPHA_SINGLE))
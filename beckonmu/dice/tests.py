@@ -6,18 +6,36 @@ Test coverage for:
 - RollResultTestCase: Result parsing and interpretation (roll_result.py)
 - DisciplineRollerTestCase: Discipline power rolling (discipline_roller.py)
 - RouseCheckerTestCase: Rouse checks and Hunger management (rouse_checker.py)
+- ProbabilityTestCase: Exact pool odds (probability.py)
+- BatchRollerTestCase: Vectorized batch rolling (batch_roller.py)
+- DiceCoreTestCase: Shared dice tally (core.py)
+- DiceRNGTestCase: Buffered and seeded dice RNG (rng.py)
+- GroupRollerTestCase: Group and contested scene rolls (group_roller.py)
+- WillpowerRerollTestCase: Reroll advice and roll/reroll (reroll_advisor.py)
 """
 
+import time
 from unittest.mock import patch, MagicMock
-from evennia.utils.test_resources import EvenniaTest
+from evennia.utils.test_resources import EvenniaTest, EvenniaCommandTest
 from dice import dice_roller, roll_result, discipline_roller, rouse_checker
 from dice.dice_roller import (
     roll_v5_pool, roll_chance_die, roll_rouse_check, roll_contested,
     apply_willpower_reroll, validate_pool_params, get_success_threshold
 )
 from dice.roll_result import RollResult
+from dice.probability import calculate_odds, MAX_ODDS_POOL
+from dice import batch_roller
+from dice.batch_roller import roll_v5_pool_batch
+from dice.core import DiceTally, roll_dice, roll_rouse_die
+from dice.rng import DiceRNG, use_rng, scene_dice, set_scene_seed, replay_dice
+from dice.reroll_advisor import advise_reroll
+from dice.commands import CmdRoll
+from dice.group_roller import (
+    parse_pool_spec, resolve_group_pools, roll_group, roll_contested_group,
+    format_group_roll, format_contested_group
+)
 from dice.discipline_roller import (
-    roll_discipline_power, parse_dice_pool, calculate_pool_from_traits,
+    roll_discipline_power, parse_dice_pool, calculate_pool_from_traits, compile_dice_pool,
     get_blood_potency_bonus, can_use_power, get_character_discipline_powers
 )
 from dice.rouse_checker import (
@@ -480,6 +498,28 @@ class RollResultTestCase(EvenniaTest):
         self.assertIsInstance(formatted, str)
         self.assertGreater(len(formatted), 0)
 
+    def test_format_result_cached(self):
+        """Test that formatting is deferred and rendered only once."""
+        result = RollResult(
+            regular_dice=[6, 1, 10],
+            hunger_dice=[10],
+            difficulty=2
+        )
+
+        # Nothing is rendered until asked for
+        self.assertIsNone(result._formatted)
+
+        first = result.format_result(show_details=True)
+        self.assertIs(result.format_result(show_details=True), first)
+        self.assertIsNot(result.format_result(show_details=False), first)
+
+    def test_slotted_result(self):
+        """Test that results are slotted and all_dice is derived on access."""
+        result = RollResult(regular_dice=[6, 7], hunger_dice=[1], difficulty=0)
+
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(result.all_dice, [6, 7, 1])
+
 
 class DisciplineRollerTestCase(EvenniaTest):
     """Test discipline power rolling."""
@@ -634,6 +674,24 @@ class DisciplineRollerTestCase(EvenniaTest):
         self.assertEqual(total, 7)  # 4 + 3
         self.assertEqual(breakdown, {'Strength': 4, 'Brawl': 3})
 
+    def test_compile_dice_pool_cached(self):
+        """Test pool strings are compiled once and reused."""
+        expression = compile_dice_pool("Resolve + Auspex")
+        self.assertIs(compile_dice_pool("Resolve + Auspex"), expression)
+        self.assertEqual(expression.trait_names, ('Resolve', 'Auspex'))
+
+    def test_pool_resolves_in_one_query(self):
+        """Test a pool and Blood Potency are fetched with a single query."""
+        expression = compile_dice_pool("Strength + Blood Sorcery")
+        with self.assertNumQueries(1):
+            total, breakdown, values = expression.resolve(
+                self.char1, extra_traits=('Blood Potency',)
+            )
+
+        self.assertEqual(total, 6)  # 4 + 2
+        self.assertEqual(breakdown, {'Strength': 4, 'Blood Sorcery': 2})
+        self.assertEqual(values['Blood Potency'], 2)
+
     def test_blood_potency_bonus(self):
         """Test BP adds correct bonus dice."""
         # BP 0-1: +0
@@ -995,3 +1053,373 @@ class RouseCheckerTestCase(EvenniaTest):
 
         for level in range(1, 6):
             self.assertTrue(can_reroll_rouse(self.char1, level))
+
+
+class ProbabilityTestCase(EvenniaTest):
+    """Test the exact probability engine."""
+
+    def test_single_die_odds(self):
+        """Test that one regular die succeeds on 6-10."""
+        odds = calculate_odds(1, hunger=0, difficulty=0)
+
+        self.assertAlmostEqual(odds['total_success'], 0.5)
+        self.assertAlmostEqual(odds['critical_success'], 0.0)
+        self.assertAlmostEqual(odds['bestial_failure'], 0.0)
+        self.assertAlmostEqual(odds['expected_successes'], 0.6)
+
+    def test_single_hunger_die_bestial(self):
+        """Test that a lone Hunger die showing 1 is a Bestial Failure."""
+        odds = calculate_odds(1, hunger=1, difficulty=0)
+
+        self.assertAlmostEqual(odds['bestial_failure'], 0.1)
+        self.assertAlmostEqual(odds['failure'], 0.4)
+
+    def test_two_dice_critical(self):
+        """Test critical and messy critical odds for two dice."""
+        odds = calculate_odds(2, hunger=1, difficulty=0)
+
+        # Only 10/10 is a critical, and it always includes the Hunger die
+        self.assertAlmostEqual(odds['messy_critical'], 0.01)
+        self.assertAlmostEqual(odds['critical_success'], 0.0)
+
+    def test_outcomes_sum_to_one(self):
+        """Test that result types partition every supported pool."""
+        for pool in (1, 5, 12, MAX_ODDS_POOL):
+            for hunger in range(0, min(pool, 5) + 1):
+                odds = calculate_odds(pool, hunger, difficulty=3)
+                total = (odds['success'] + odds['critical_success'] +
+                         odds['messy_critical'] + odds['failure'] +
+                         odds['bestial_failure'])
+                self.assertAlmostEqual(total, 1.0)
+                self.assertAlmostEqual(sum(odds['distribution']), 1.0)
+
+    def test_odds_match_roll_result(self):
+        """Test odds against brute-force enumeration through RollResult."""
+        from itertools import product
+
+        counts = {}
+        for regular in product(range(1, 11), repeat=2):
+            for hunger in product(range(1, 11), repeat=1):
+                result = RollResult(list(regular), list(hunger), difficulty=2)
+                counts[result.result_type] = counts.get(result.result_type, 0) + 1
+
+        odds = calculate_odds(3, hunger=1, difficulty=2)
+        for result_type, count in counts.items():
+            self.assertAlmostEqual(odds[result_type], count / 1000)
+
+    def test_impossible_difficulty(self):
+        """Test that unreachable difficulties have zero success chance."""
+        odds = calculate_odds(2, hunger=0, difficulty=5)
+
+        self.assertEqual(odds['total_success'], 0.0)
+
+    def test_invalid_parameters(self):
+        """Test that parameters outside the table raise ValueError."""
+        with self.assertRaises(ValueError):
+            calculate_odds(0)
+        with self.assertRaises(ValueError):
+            calculate_odds(MAX_ODDS_POOL + 1)
+        with self.assertRaises(ValueError):
+            calculate_odds(3, hunger=4)
+        with self.assertRaises(ValueError):
+            calculate_odds(3, difficulty=-1)
+
+
+class BatchRollerTestCase(EvenniaTest):
+    """Test vectorized batch rolling."""
+
+    def _check_batch(self, batch, pools, difficulty):
+        """Check that every roll in a batch obeys the V5 rules."""
+        self.assertEqual(len(batch['successes']), len(pools))
+        for i, pool in enumerate(pools):
+            successes = int(batch['successes'][i])
+            self.assertGreaterEqual(successes, 0)
+            self.assertLessEqual(successes, pool * 2)
+            self.assertEqual(bool(batch['is_success'][i]), successes >= max(difficulty, 1))
+            if batch['is_messy_critical'][i]:
+                self.assertTrue(batch['is_critical'][i])
+            if batch['is_bestial_failure'][i]:
+                self.assertFalse(batch['is_success'][i])
+
+    def test_batch_shapes_and_rules(self):
+        """Test batch results line up with the requested pools."""
+        pools = [1, 3, 5, 8, 12] * 200
+        batch = roll_v5_pool_batch(pools, hungers=1, difficulties=2)
+        self._check_batch(batch, pools, 2)
+
+    def test_batch_python_fallback(self):
+        """Test the pure Python path used without NumPy."""
+        pools = [2, 4, 6] * 100
+        with patch.object(batch_roller, 'NUMPY_AVAILABLE', False):
+            batch = roll_v5_pool_batch(pools, hungers=2, difficulties=1)
+
+        self.assertIsInstance(batch['successes'], list)
+        self._check_batch(batch, pools, 1)
+
+    def test_batch_per_roll_parameters(self):
+        """Test per-roll Hunger and difficulty sequences."""
+        batch = roll_v5_pool_batch([4, 4], hungers=[0, 4], difficulties=[0, 9])
+
+        # Difficulty 9 is unreachable with 4 dice
+        self.assertFalse(batch['is_success'][1])
+        # No Hunger dice means no Bestial Failure or Messy Critical
+        self.assertFalse(batch['is_bestial_failure'][0])
+        self.assertFalse(batch['is_messy_critical'][0])
+
+    def test_batch_validation(self):
+        """Test that invalid rolls raise ValueError."""
+        with self.assertRaises(ValueError):
+            roll_v5_pool_batch([0, 3])
+        with self.assertRaises(ValueError):
+            roll_v5_pool_batch([3], hungers=4)
+        with self.assertRaises(ValueError):
+            roll_v5_pool_batch([3, 3], hungers=[1])
+        with self.assertRaises(ValueError):
+            roll_v5_pool_batch([3], difficulties=-1)
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns empty results."""
+        batch = roll_v5_pool_batch([])
+        self.assertEqual(len(batch['successes']), 0)
+
+
+class DiceCoreTestCase(EvenniaTest):
+    """Test the shared dice core."""
+
+    def test_tally_counts(self):
+        """Test that one pass counts successes, 10s and 1s per dice type."""
+        tally = DiceTally([1, 6, 10, 10, 3], [1, 9, 10])
+
+        self.assertEqual(tally.regular_successes, 3)
+        self.assertEqual(tally.hunger_successes, 2)
+        self.assertEqual(tally.regular_tens, 2)
+        self.assertEqual(tally.hunger_tens, 1)
+        self.assertEqual(tally.regular_ones, 1)
+        self.assertEqual(tally.hunger_ones, 1)
+        self.assertEqual(tally.successes, 5)
+        self.assertEqual(tally.tens, 3)
+
+    def test_both_result_types_share_tally(self):
+        """Test that RollResult and DiceResult read the same dice the same way."""
+        from world.v5_dice import DiceResult
+
+        regular, hunger = [10, 6, 2], [10, 1]
+        roll = RollResult(regular, hunger, difficulty=2)
+        legacy = DiceResult(regular, hunger, difficulty=2)
+
+        # RollResult: 10 = 2 successes; DiceResult: 10 = 1, +2 per pair
+        self.assertEqual(roll.total_successes, 5)
+        self.assertEqual(legacy.successes + legacy.criticals * 2, 5)
+        self.assertTrue(roll.is_messy_critical)
+        self.assertTrue(legacy.is_messy)
+
+    def test_roll_dice_split(self):
+        """Test that Hunger dice replace regular dice."""
+        regular, hunger = roll_dice(6, 2)
+
+        self.assertEqual(len(regular), 4)
+        self.assertEqual(len(hunger), 2)
+        for die in regular + hunger:
+            self.assertTrue(1 <= die <= 10)
+
+    def test_rouse_die(self):
+        """Test that a Rouse die succeeds on 6+."""
+        for _ in range(50):
+            die, success = roll_rouse_die()
+            self.assertTrue(1 <= die <= 10)
+            self.assertEqual(success, die >= 6)
+
+
+class DiceRNGTestCase(EvenniaTest):
+    """Test the buffered, seedable dice RNG."""
+
+    def test_dice_in_range(self):
+        """Test that buffered dice are valid d10 results."""
+        rng = DiceRNG(buffer_size=16)
+        dice = rng.draw(100)
+
+        self.assertEqual(len(dice), 100)
+        self.assertEqual(rng.offset, 100)
+        for die in dice:
+            self.assertTrue(1 <= die <= 10)
+
+    def test_seeded_stream_ignores_buffering(self):
+        """Test that a seed gives the same dice however draws are split."""
+        small = DiceRNG(seed=7, buffer_size=5)
+        chunked = small.draw(3) + small.draw(11) + small.draw(1)
+
+        self.assertEqual(DiceRNG(seed=7).draw(15), chunked)
+
+    def test_replay_from_offset(self):
+        """Test that replay_dice reproduces dice from seed and offset."""
+        rng = DiceRNG(seed=1234)
+        rng.draw(40)
+        offset = rng.offset
+        roll = rng.draw(7)
+
+        self.assertEqual(replay_dice(1234, offset, 7), roll)
+
+    def test_use_rng_routes_rolls(self):
+        """Test that rolls inside use_rng draw from the given RNG."""
+        with use_rng(DiceRNG(seed=99)):
+            result = roll_v5_pool(6, hunger=2)
+
+        self.assertEqual(result.regular_dice + result.hunger_dice, replay_dice(99, 0, 6))
+
+    def test_scene_seed_persists_offset(self):
+        """Test that seeded rooms record their stream offset."""
+        set_scene_seed(self.room1, 555)
+
+        with scene_dice(self.room1) as rng:
+            self.assertEqual(rng.seed, 555)
+            result = roll_v5_pool(4, hunger=1)
+
+        self.assertEqual(self.room1.db.dice_offset, 4)
+        self.assertEqual(result.regular_dice + result.hunger_dice, replay_dice(555, 0, 4))
+
+        set_scene_seed(self.room1, None)
+        with scene_dice(self.room1) as rng:
+            self.assertIsNone(rng.seed)
+        self.assertIsNone(self.room1.db.dice_seed)
+
+    def test_scene_seed_range(self):
+        """Test seeds the roll log can't store are refused."""
+        with self.assertRaises(ValueError):
+            set_scene_seed(self.room1, 2 ** 70)
+        self.assertIsNone(self.room1.db.dice_seed)
+
+
+class GroupRollerTestCase(EvenniaTest):
+    """Test group and contested scene rolls."""
+
+    def setUp(self):
+        """Give both characters Wits and Awareness."""
+        super().setUp()
+        category = TraitCategory.objects.create(name="Attributes", code="attributes")
+        wits = Trait.objects.create(name="Wits", category=category)
+        awareness = Trait.objects.create(name="Awareness", category=category)
+
+        for character, wits_rating, awareness_rating in ((self.char1, 3, 2), (self.char2, 2, 0)):
+            CharacterTrait.objects.create(character=character, trait=wits, rating=wits_rating)
+            CharacterTrait.objects.create(character=character, trait=awareness, rating=awareness_rating)
+            character.db.hunger = 1
+
+    def test_parse_pool_spec(self):
+        """Test numeric pools and trait expressions."""
+        self.assertEqual(parse_pool_spec("6"), 6)
+        self.assertEqual(parse_pool_spec("Wits + Awareness").trait_names, ('Wits', 'Awareness'))
+        with self.assertRaises(ValueError):
+            parse_pool_spec("0")
+        with self.assertRaises(ValueError):
+            parse_pool_spec("  ")
+
+    def test_pools_resolve_in_one_query(self):
+        """Test every participant's traits are fetched together."""
+        spec = parse_pool_spec("Wits + Awareness")
+        with self.assertNumQueries(1):
+            pools = resolve_group_pools([self.char1, self.char2], [spec, spec])
+        self.assertEqual(pools, [5, 2])
+
+    def test_roll_group(self):
+        """Test a group roll rolls each character's own pool and Hunger."""
+        rolls = roll_group([self.char1, self.char2], parse_pool_spec("Wits + Awareness"), 2)
+
+        self.assertEqual([roll['character'] for roll in rolls], [self.char1, self.char2])
+        self.assertEqual([roll['pool'] for roll in rolls], [5, 2])
+        for roll in rolls:
+            self.assertEqual(roll['hunger'], 1)
+            self.assertEqual(len(roll['result'].hunger_dice), 1)
+            self.assertEqual(roll['result'].difficulty, 2)
+
+        output = format_group_roll(rolls, parse_pool_spec("Wits + Awareness"), 2)
+        self.assertIn("Group Roll: Wits + Awareness vs 2", output)
+        self.assertIn(self.char2.key, output)
+
+    def test_roll_contested_group(self):
+        """Test each pair is resolved against its own pools."""
+        with use_rng(DiceRNG(seed=7)):
+            contests = roll_contested_group([(self.char1, self.char2)], 4, parse_pool_spec("Wits"))
+
+        contest = contests[0]['contest']
+        self.assertEqual((contests[0]['pool1'], contests[0]['pool2']), (4, 2))
+        self.assertEqual(len(contest['roller1_result'].all_dice), 4)
+        self.assertEqual(len(contest['roller2_result'].all_dice), 2)
+
+        output = format_contested_group(contests, 4, parse_pool_spec("Wits"))
+        self.assertIn("Contested Rolls: 4 dice vs Wits", output)
+        self.assertTrue("wins by" in output or "tie" in output)
+
+
+class WillpowerRerollTestCase(EvenniaCommandTest):
+    """Test Willpower reroll advice and the roll/reroll switch."""
+
+    def test_advice_rerolls_failed_dice(self):
+        """Test advice rerolls up to 3 failed dice for an exact success chance."""
+        result = RollResult([2, 3, 4, 5, 7], [], difficulty=2)
+        advice = advise_reroll(result)
+
+        self.assertEqual(len(advice['indices']), 3)
+        self.assertTrue(all(result.regular_dice[i] < 6 for i in advice['indices']))
+        # Need 1 more success from 3 dice: 1 - 0.5^3
+        self.assertAlmostEqual(advice['success_chance'], 0.875)
+        self.assertAlmostEqual(advice['gain'], 0.875)
+
+    def test_advice_protects_against_bestial_failure(self):
+        """Test a regular 1 is kept when rerolling it only adds Bestial risk."""
+        # Rerolling the 1 instead of a 2-5 gains nothing but exposes the Hunger 1
+        result = RollResult([1, 2, 3, 4], [1], difficulty=3)
+        advice = advise_reroll(result)
+
+        self.assertEqual(advice['indices'], [1, 2, 3])
+        self.assertEqual(advice['bestial_chance'], 0.0)
+
+    def test_advice_skips_hopeless_and_successful_rolls(self):
+        """Test no reroll is suggested when it cannot change the outcome."""
+        self.assertEqual(advise_reroll(RollResult([6, 2], [], difficulty=1))['indices'], [])
+        self.assertEqual(advise_reroll(RollResult([2, 3], [], difficulty=9))['indices'], [])
+
+    def test_reroll_chosen_indices(self):
+        """Test explicit indices are rerolled and Hunger dice refused."""
+        result = RollResult([2, 7, 4], [1], difficulty=3)
+        new_result, rerolled = apply_willpower_reroll(result, indices=[2, 0])
+        self.assertEqual(rerolled, [0, 2])
+        self.assertEqual(new_result.regular_dice[1], 7)
+        self.assertEqual(new_result.hunger_dice, [1])
+
+        with self.assertRaises(ValueError):
+            apply_willpower_reroll(result, indices=[1])  # a success
+        with self.assertRaises(ValueError):
+            apply_willpower_reroll(result, indices=[3])  # the Hunger die
+
+    def _store_failed_roll(self, **overrides):
+        """Put a failed /willpower roll in the reroll slot."""
+        last_roll = {
+            'result': RollResult([2, 3, 4], [], difficulty=1),
+            'can_reroll': True,
+            'timestamp': time.time(),
+            'roll_type': 'basic',
+        }
+        last_roll.update(overrides)
+        self.char1.ndb.last_roll = last_roll
+
+    def test_reroll_spends_willpower_once(self):
+        """Test roll/reroll spends 1 Willpower and clears the roll."""
+        self.char1.db.pools['current_willpower'] = 2
+        self._store_failed_roll()
+
+        self.call(CmdRoll(), "/reroll", "=== Willpower Reroll ===")
+        self.assertEqual(self.char1.db.pools['current_willpower'], 1)
+        self.assertIsNone(self.char1.ndb.last_roll)
+
+        self.call(CmdRoll(), "/reroll", "No recent roll to reroll.")
+
+    def test_reroll_requirements(self):
+        """Test roll/reroll needs Willpower and a recent roll."""
+        self.call(CmdRoll(), "/reroll", "No recent roll to reroll.")
+
+        self._store_failed_roll(timestamp=time.time() - 60)
+        self.call(CmdRoll(), "/reroll", "Too much time has passed")
+
+        self.char1.db.pools['current_willpower'] = 0
+        self._store_failed_roll()
+        self.call(CmdRoll(), "/reroll", "You have no Willpower remaining.")
@@ -0,0 +1,6 @@
+"""
+Roll Log System for V5
+
+Keeps an append-only ledger of dice rolls so staff can review who rolled
+what after the room messages have scrolled away.
+"""
@@ -0,0 +1,14 @@
+"""
+Roll Log Django app configuration.
+"""
+
+from django.apps import AppConfig
+
+
+class RollsConfig(AppConfig):
+    """Django app configuration for the Roll Log system."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'rolls'
+    label = 'rolls'
+    verbose_name = 'Roll Log'
@@ -0,0 +1,58 @@
+"""
+Roll Log Commands
+
+Staff commands for reviewing logged dice rolls.
+"""
+
+from evennia import default_cmds
+from .utils import get_roll_log, format_roll_log
+
+
+class CmdRollLog(default_cmds.MuxCommand):
+    """
+    Review a character's logged dice rolls (Staff only).
+
+    Usage:
+        +rolls/log <character>
+        +rolls/log <character> = <count>
+
+    Shows the character's most recent rolls, newest first, with the
+    dice, Hunger, difficulty and outcome of each. Rolls made in seeded
+    scenes also show the seed and offset needed to replay them with
+    +dice/replay.
+
+    Examples:
+        +rolls/log Marcus
+        +rolls/log Marcus = 50
+    """
+
+    key = "+rolls"
+    aliases = ["rolls"]
+    switch_options = ("log",)
+    locks = "cmd:perm(Builder)"
+    help_category = "Admin"
+
+    def func(self):
+        """Execute roll log command."""
+        caller = self.caller
+
+        if "log" not in self.switches or not self.lhs:
+            caller.msg("Usage: +rolls/log <character> [= <count>]")
+            return
+
+        limit = 20
+        if self.rhs:
+            try:
+                limit = int(self.rhs.strip())
+            except ValueError:
+                caller.msg("|rCount must be a number.|n")
+                return
+            if limit < 1 or limit > 200:
+                caller.msg("|rCount must be between 1 and 200.|n")
+                return
+
+        target = caller.search(self.lhs.strip(), global_search=True)
+        if not target:
+            return
+
+        caller.msg(format_roll_log(target, get_roll_log(target, limit)))
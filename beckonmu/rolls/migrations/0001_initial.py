@@ -0,0 +1,125 @@
+# Generated by Django 5.2.7 on 2026-10-17 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("objects", "0014_defaultobject_defaultcharacter_defaultexit_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "character_name",
+                    models.CharField(
+                        help_text="Character name at the time of the roll",
+                        max_length=80,
+                    ),
+                ),
+                (
+                    "command",
+                    models.CharField(
+                        help_text="Command that made the roll (e.g., roll, power)",
+                        max_length=40,
+                    ),
+                ),
+                (
+                    "pool",
+                    models.PositiveSmallIntegerField(help_text="Total dice rolled"),
+                ),
+                (
+                    "hunger",
+                    models.PositiveSmallIntegerField(
+                        default=0, help_text="Hunger dice in the pool"
+                    ),
+                ),
+                (
+                    "difficulty",
+                    models.PositiveSmallIntegerField(
+                        default=0, help_text="Successes needed (0 = any)"
+                    ),
+                ),
+                (
+                    "regular_dice",
+                    models.JSONField(default=list, help_text="Regular dice results"),
+                ),
+                (
+                    "hunger_dice",
+                    models.JSONField(default=list, help_text="Hunger dice results"),
+                ),
+                (
+                    "successes",
+                    models.SmallIntegerField(help_text="Total successes rolled"),
+                ),
+                (
+                    "result_type",
+                    models.CharField(
+                        choices=[
+                            ("success", "Success"),
+                            ("critical_success", "Critical Success"),
+                            ("messy_critical", "Messy Critical"),
+                            ("failure", "Failure"),
+                            ("bestial_failure", "Bestial Failure"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "seed",
+                    models.BigIntegerField(
+                        blank=True, help_text="Scene dice seed, if seeded", null=True
+                    ),
+                ),
+                (
+                    "dice_offset",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Stream offset of the first die",
+                        null=True,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "character",
+                    models.ForeignKey(
+                        help_text="Character who rolled",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="roll_logs",
+                        to="objects.objectdb",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Roll Log Entry",
+                "verbose_name_plural": "Roll Log",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["character", "created_at"],
+                        name="rolls_character_time_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+"""
+Django Models for Roll Log System
+
+An append-only record of every logged dice roll.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+
+class RollLog(models.Model):
+    """
+    A single logged dice roll.
+
+    Entries are written in batches by rolls.utils.flush_roll_log() and are
+    never edited afterwards. The character's name is copied onto the entry
+    so the log stays readable if the character is deleted.
+    """
+
+    RESULT_CHOICES = [
+        ('success', 'Success'),
+        ('critical_success', 'Critical Success'),
+        ('messy_critical', 'Messy Critical'),
+        ('failure', 'Failure'),
+        ('bestial_failure', 'Bestial Failure'),
+    ]
+
+    character = models.ForeignKey(
+        'objects.ObjectDB',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='roll_logs',
+        help_text="Character who rolled"
+    )
+    character_name = models.CharField(max_length=80, help_text="Character name at the time of the roll")
+    command = models.CharField(max_length=40, help_text="Command that made the roll (e.g., roll, power)")
+
+    # Roll parameters
+    pool = models.PositiveSmallIntegerField(help_text="Total dice rolled")
+    hunger = models.PositiveSmallIntegerField(default=0, help_text="Hunger dice in the pool")
+    difficulty = models.PositiveSmallIntegerField(default=0, help_text="Successes needed (0 = any)")
+
+    # Outcome
+    regular_dice = models.JSONField(default=list, help_text="Regular dice results")
+    hunger_dice = models.JSONField(default=list, help_text="Hunger dice results")
+    successes = models.SmallIntegerField(help_text="Total successes rolled")
+    result_type = models.CharField(max_length=20, choices=RESULT_CHOICES)
+
+    # Seeded scenes (see dice.rng) can replay the roll from these
+    seed = models.BigIntegerField(null=True, blank=True, help_text="Scene dice seed, if seeded")
+    dice_offset = models.PositiveIntegerField(null=True, blank=True, help_text="Stream offset of the first die")
+
+    # Time of the roll, not of the batch write
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        app_label = 'rolls'
+        verbose_name = "Roll Log Entry"
+        verbose_name_plural = "Roll Log"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['character', 'created_at'], name='rolls_character_time_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.character_name} rolled {self.pool} ({self.hunger} Hunger): {self.result_type}"
+
+    def save(self, *args, **kwargs):
+        """Refuse to rewrite an existing entry; the log is append-only."""
+        if self.pk is not None:
+            raise ValueError("Roll log entries cannot be modified.")
+        super().save(*args, **kwargs)
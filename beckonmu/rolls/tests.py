@@ -0,0 +1,135 @@
+"""
+Tests for the Roll Log system.
+
+Covers buffering, batched flushing, log queries and the staff command.
+"""
+
+from unittest.mock import patch
+from evennia.utils.test_resources import EvenniaTest, EvenniaCommandTest
+from dice.roll_result import RollResult
+from dice.commands import CmdRouse
+from rolls import utils
+from rolls.commands import CmdRollLog
+from rolls.models import RollLog
+from rolls.utils import record_roll, flush_roll_log, get_roll_log, format_roll_log
+
+
+class RollLogTestCase(EvenniaTest):
+    """Test buffered roll logging."""
+
+    def setUp(self):
+        super().setUp()
+        utils._buffer.clear()
+
+    def tearDown(self):
+        utils._buffer.clear()
+        super().tearDown()
+
+    def test_record_roll_does_not_write(self):
+        """Recording a roll only queues it."""
+        record_roll(self.char1, RollResult([6, 7, 2], [1], 2), "roll")
+        self.assertEqual(RollLog.objects.count(), 0)
+        self.assertEqual(len(utils._buffer), 1)
+
+    def test_flush_writes_pending_rolls(self):
+        """Flushing writes every pending roll in one batch."""
+        record_roll(self.char1, RollResult([6, 7, 2], [1], 2), "roll")
+        record_roll(self.char1, RollResult([10, 10], [], 0), "power", seed=42, offset=7)
+
+        self.assertEqual(flush_roll_log(), 2)
+        self.assertEqual(len(utils._buffer), 0)
+        self.assertEqual(flush_roll_log(), 0)
+
+        entry = RollLog.objects.get(command="power")
+        self.assertEqual(entry.character_id, self.char1.id)
+        self.assertEqual(entry.character_name, self.char1.key)
+        self.assertEqual(entry.pool, 2)
+        self.assertEqual(entry.regular_dice, [10, 10])
+        self.assertEqual(entry.successes, 4)
+        self.assertEqual(entry.result_type, 'critical_success')
+        self.assertEqual((entry.seed, entry.dice_offset), (42, 7))
+
+        entry = RollLog.objects.get(command="roll")
+        self.assertEqual((entry.pool, entry.hunger, entry.difficulty), (4, 1, 2))
+        self.assertEqual(entry.hunger_dice, [1])
+
+    def test_buffer_drops_oldest_when_full(self):
+        """A full buffer drops the oldest roll instead of blocking."""
+        with patch.object(utils, '_buffer', utils.deque(maxlen=2)), \
+                patch.object(utils, 'ROLL_LOG_BUFFER_SIZE', 2):
+            for pool in (1, 2, 3):
+                record_roll(self.char1, RollResult([6] * pool, [], 0), "roll")
+            flush_roll_log()
+
+        self.assertEqual(
+            sorted(RollLog.objects.values_list('pool', flat=True)), [2, 3]
+        )
+
+    def test_bad_row_only_loses_itself(self):
+        """A row the database rejects doesn't take the rest of the batch with it."""
+        record_roll(self.char1, RollResult([6], [], 0), "roll")
+        record_roll(self.char2, RollResult([6, 6], [], 0), "roll", seed=2 ** 70, offset=0)
+        record_roll(self.char1, RollResult([6, 6, 6], [], 0), "roll")
+
+        self.assertEqual(flush_roll_log(), 2)
+        self.assertEqual(
+            sorted(RollLog.objects.values_list('pool', flat=True)), [1, 3]
+        )
+
+    def test_entries_are_append_only(self):
+        """Saved entries cannot be modified."""
+        record_roll(self.char1, RollResult([6], [], 0), "roll")
+        flush_roll_log()
+        entry = RollLog.objects.get()
+        entry.successes = 5
+        with self.assertRaises(ValueError):
+            entry.save()
+
+    def test_get_roll_log_newest_first(self):
+        """Queries include pending rolls and are newest first."""
+        record_roll(self.char1, RollResult([6], [], 0), "roll")
+        record_roll(self.char2, RollResult([6, 6], [], 0), "roll")
+        record_roll(self.char1, RollResult([6, 6, 6], [], 0), "roll")
+
+        entries = get_roll_log(self.char1)
+        self.assertEqual([entry.pool for entry in entries], [3, 1])
+        self.assertEqual(len(get_roll_log(self.char1, limit=1)), 1)
+
+    def test_format_roll_log(self):
+        """Formatted log names the character and each result."""
+        record_roll(self.char1, RollResult([6, 2], [1], 3), "roll", seed=9, offset=0)
+        output = format_roll_log(self.char1, get_roll_log(self.char1))
+        self.assertIn(self.char1.key, output)
+        self.assertIn("Bestial Failure", output)
+        self.assertIn("seed 9", output)
+
+        self.assertIn("No logged rolls", format_roll_log(self.char2, []))
+
+
+class CmdRollLogTestCase(EvenniaCommandTest):
+    """Test the +rolls/log staff command."""
+
+    def setUp(self):
+        super().setUp()
+        utils._buffer.clear()
+
+    def test_log_shows_rolls(self):
+        """Staff can view a character's rolls."""
+        record_roll(self.char2, RollResult([6, 7], [], 0), "roll")
+        self.call(CmdRollLog(), f"/log {self.char2.key}", "=== Roll Log: Char2 ===")
+
+    def test_usage(self):
+        """Missing switch or target shows usage."""
+        self.call(CmdRollLog(), "", "Usage: +rolls/log")
+
+    def test_rouse_checks_logged(self):
+        """Rouse checks are logged with the die that decided them."""
+        self.char1.vitals.hunger = 1
+        self.call(CmdRouse(), "", caller=self.char1)
+        entry = get_roll_log(self.char1)[0]
+        self.assertEqual(entry.command, "rouse")
+        self.assertEqual(entry.pool, 1)
+
+    def test_bad_count(self):
+        """Count must be numeric."""
+        self.call(CmdRollLog(), f"/log {self.char2.key} = lots", "Count must be a number.")
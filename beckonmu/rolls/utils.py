@@ -0,0 +1,224 @@
+"""
+Roll Log Utility Functions
+
+Rolls are not written to the database when they happen. record_roll()
+appends a plain tuple to an in-memory ring buffer, and a timer started at
+server boot drains the buffer with a single bulk insert every few seconds.
+The dice commands therefore never wait on the database; the cost of a
+logged roll is one deque append.
+
+If the buffer ever fills before it is flushed, the oldest pending entries
+are dropped (and the loss is logged) rather than blocking the roller. If
+the bulk insert fails, the batch is written row by row so only the rows
+the database rejects are lost.
+"""
+
+from collections import deque
+
+from django.db import transaction
+from django.utils import timezone
+from evennia.utils import logger
+
+from .models import RollLog
+
+
+# Maximum rolls held in memory between flushes
+ROLL_LOG_BUFFER_SIZE = 5000
+
+# Seconds between timed flushes
+ROLL_LOG_FLUSH_INTERVAL = 5
+
+# Pending rolls that trigger an early flush, and rows per INSERT
+ROLL_LOG_BATCH_SIZE = 500
+
+# Pending (character_id, character_name, command, pool, hunger, difficulty,
+# regular_dice, hunger_dice, successes, result_type, seed, offset, time)
+_buffer = deque(maxlen=ROLL_LOG_BUFFER_SIZE)
+
+# Running flush timer (twisted LoopingCall), set by start_roll_log_flusher()
+_flush_task = None
+
+# Whether an early flush is already scheduled
+_flush_pending = False
+
+
+def record_roll(character, result, command, seed=None, offset=None):
+    """
+    Queue a roll for the log without touching the database.
+
+    Args:
+        character: Character who rolled
+        result (RollResult): The roll to log
+        command (str): Command that made the roll (e.g., "roll", "power")
+        seed (int, optional): Scene dice seed, for seeded rolls
+        offset (int, optional): Stream offset of the roll's first die
+    """
+    global _flush_pending
+
+    if len(_buffer) == ROLL_LOG_BUFFER_SIZE:
+        logger.log_warn("Roll log buffer full; dropping oldest unflushed roll.")
+
+    _buffer.append((
+        character.id,
+        character.key,
+        command,
+        len(result.regular_dice) + len(result.hunger_dice),
+        len(result.hunger_dice),
+        result.difficulty,
+        result.regular_dice,
+        result.hunger_dice,
+        result.total_successes,
+        result.result_type,
+        seed,
+        offset,
+        timezone.now(),
+    ))
+
+    # Under heavy load, flush on the next reactor tick instead of waiting
+    # for the timer. Only done while the timer runs (i.e. in the server).
+    if _flush_task is not None and not _flush_pending and len(_buffer) >= ROLL_LOG_BATCH_SIZE:
+        from twisted.internet import reactor
+
+        _flush_pending = True
+        reactor.callLater(0, flush_roll_log)
+
+
+def flush_roll_log():
+    """
+    Write all pending rolls to the database in bulk.
+
+    Returns:
+        int: Number of rolls written
+    """
+    global _flush_pending
+    _flush_pending = False
+
+    if not _buffer:
+        return 0
+
+    entries = []
+    while _buffer:
+        (character_id, character_name, command, pool, hunger, difficulty,
+         regular_dice, hunger_dice, successes, result_type,
+         seed, offset, created_at) = _buffer.popleft()
+        entries.append(RollLog(
+            character_id=character_id,
+            character_name=character_name,
+            command=command,
+            pool=pool,
+            hunger=hunger,
+            difficulty=difficulty,
+            regular_dice=regular_dice,
+            hunger_dice=hunger_dice,
+            successes=successes,
+            result_type=result_type,
+            seed=seed,
+            dice_offset=offset,
+            created_at=created_at,
+        ))
+
+    try:
+        with transaction.atomic():
+            RollLog.objects.bulk_create(entries, batch_size=ROLL_LOG_BATCH_SIZE)
+        return len(entries)
+    except Exception:
+        logger.log_trace("Roll log bulk insert failed; writing rolls one at a time.")
+
+    # One bad row must not cost everyone else's rolls: save the rest singly
+    written = 0
+    for entry in entries:
+        try:
+            with transaction.atomic():
+                entry.save()
+        except Exception as err:
+            logger.log_err(
+                f"Roll log entry for {entry.character_name} ({entry.command}) lost: {err}"
+            )
+            continue
+        written += 1
+    return written
+
+
+def start_roll_log_flusher():
+    """
+    Start the timer that periodically flushes the roll log.
+
+    Called from at_server_start. Safe to call more than once.
+    """
+    global _flush_task
+
+    if _flush_task is not None and _flush_task.running:
+        return
+
+    from twisted.internet.task import LoopingCall
+
+    _flush_task = LoopingCall(flush_roll_log)
+    _flush_task.start(ROLL_LOG_FLUSH_INTERVAL, now=False)
+
+
+def stop_roll_log_flusher():
+    """
+    Stop the flush timer and write out anything still pending.
+
+    Called from at_server_stop so no rolls are lost on reload or shutdown.
+    """
+    global _flush_task
+
+    if _flush_task is not None and _flush_task.running:
+        _flush_task.stop()
+    _flush_task = None
+
+    flush_roll_log()
+
+
+def get_roll_log(character, limit=20):
+    """
+    Get a character's most recent logged rolls, newest first.
+
+    Pending rolls are flushed first so the result is always current.
+
+    Args:
+        character: Character object
+        limit (int): Maximum entries to return
+
+    Returns:
+        list[RollLog]: Log entries
+    """
+    flush_roll_log()
+    return list(
+        RollLog.objects.filter(character=character).order_by('-created_at')[:limit]
+    )
+
+
+def format_roll_log(character, entries):
+    """
+    Format log entries as a table for display.
+
+    Args:
+        character: Character the entries belong to
+        entries (list[RollLog]): Entries from get_roll_log()
+
+    Returns:
+        str: Formatted log with ANSI color codes
+    """
+    lines = [f"|c=== Roll Log: {character.key} ===|n"]
+
+    if not entries:
+        lines.append("|yNo logged rolls.|n")
+        return "\n".join(lines)
+
+    for entry in entries:
+        when = timezone.localtime(entry.created_at).strftime("%Y-%m-%d %H:%M:%S")
+        dice = " ".join(str(die) for die in entry.regular_dice)
+        if entry.hunger_dice:
+            dice += " |r" + " ".join(str(die) for die in entry.hunger_dice) + "|n"
+        vs = f" vs {entry.difficulty}" if entry.difficulty else ""
+        line = (
+            f"{when}  {entry.command:<6} {entry.pool}d ({entry.hunger}h){vs}: "
+            f"[{dice}] {entry.successes} successes, {entry.get_result_type_display()}"
+        )
+        if entry.seed is not None:
+            line += f" |x(seed {entry.seed} @ {entry.dice_offset})|n"
+        lines.append(line)
+
+    return "\n".join(lines)
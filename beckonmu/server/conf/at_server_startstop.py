@@ -10,7 +10,15 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    # Begin periodic batch writes of the dice roll log
+    from rolls.utils import start_roll_log_flusher
+
+    start_roll_log_flusher()
+
+    # Load trait metadata into memory and watch for catalog changes
+    from traits.catalog import start_catalog_watcher
+
+    start_catalog_watcher()
 
 
 def at_server_stop():
@@ -18,4 +26,11 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    # Write out any rolls still waiting in the roll log buffer
+    from rolls.utils import stop_roll_log_flusher
+
+    stop_roll_log_flusher()
+
+    from traits.catalog import stop_catalog_watcher
+
+    stop_catalog_watcher()
@@ -41,6 +41,7 @@ INSTALLED_APPS += (
     "jobs",
     "status",
     "boons",
+    "rolls",
     "traits",
     "web.builder.apps.BuilderConfig",
 )
@@ -0,0 +1,100 @@
+"""
+Tests for the cached room display
+
+Tests that Room.return_appearance reuses its title, exit table and footer
+until the room name or its exits change, while occupants are rendered on
+every look.
+"""
+
+from unittest.mock import patch
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+from typeclasses.exits import Exit
+from typeclasses.rooms import Room
+
+
+class RoomAppearanceCacheTestCase(EvenniaTest):
+    """Test the layered room display cache."""
+
+    room_typeclass = Room
+    exit_typeclass = Exit
+
+    def test_static_parts_reused(self):
+        """Test repeated looks don't rebuild the exit table."""
+        first = self.room1.return_appearance(self.char1)
+        with patch.object(Room, "get_display_exits") as exits:
+            second = self.room1.return_appearance(self.char1)
+            exits.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_occupants_rendered_every_look(self):
+        """Test occupant rows follow shortdesc changes without invalidation."""
+        self.char2.db.shortdesc = "A pale stranger"
+        with patch.object(type(self.char2), "has_account", True):
+            self.assertIn("A pale stranger", self.room1.return_appearance(self.char1))
+            self.char2.db.shortdesc = "A tall stranger"
+            self.assertIn("A tall stranger", self.room1.return_appearance(self.char1))
+
+    def test_character_moves_keep_cache(self):
+        """Test characters coming and going leave the cached parts alone."""
+        self.room1.return_appearance(self.char1)
+        self.char2.move_to(self.room2, quiet=True)
+        self.char2.move_to(self.room1, quiet=True)
+        with patch.object(Room, "get_display_exits") as exits:
+            self.room1.return_appearance(self.char1)
+            exits.assert_not_called()
+
+    def test_new_exit_invalidates(self):
+        """Test creating an exit shows it on the next look."""
+        self.room1.return_appearance(self.char1)
+        create.create_object(Exit, key="sewer grate", location=self.room1, destination=self.room2)
+        self.assertIn("sewer grate", self.room1.return_appearance(self.char1))
+
+    def test_exit_rename_and_delete_invalidate(self):
+        """Test renaming or deleting an exit updates the exit table."""
+        self.room1.return_appearance(self.char1)
+        self.exit.key = "back alley"
+        self.assertIn("back alley", self.room1.return_appearance(self.char1))
+
+        self.exit.delete()
+        self.assertNotIn("back alley", self.room1.return_appearance(self.char1))
+
+    def test_exit_moved_in_invalidates(self):
+        """Test an exit arriving through at_object_receive updates the table."""
+        other_exit = create.create_object(Exit, key="hidden door", location=self.room2, destination=self.room1)
+        self.room1.return_appearance(self.char1)
+        other_exit.move_to(self.room1, quiet=True)
+        self.assertIn("hidden door", self.room1.return_appearance(self.char1))
+
+    def test_exit_link_and_unlink(self):
+        """Test @link/@unlink, which only set the destination, update the table."""
+        self.room1.return_appearance(self.char1)
+        self.exit.destination = None
+        self.assertNotIn(self.exit.key, self.room1.return_appearance(self.char1))
+
+        self.exit.destination = self.room2
+        self.assertIn(self.exit.key, self.room1.return_appearance(self.char1))
+
+    def test_exit_display_changes(self):
+        """Test monikers, OOC tags and exits_per_row show up without invalidation."""
+        self.room1.return_appearance(self.char1)
+        self.exit.db.moniker = "Rusted Gate"
+        self.assertIn("Rusted Gate", self.room1.return_appearance(self.char1))
+
+        self.exit.tags.add("ooc")
+        self.assertIn("OOC", self.room1.return_appearance(self.char1))
+
+        create.create_object(Exit, key="sewer grate", location=self.room1, destination=self.room2)
+        one_row = self.room1.return_appearance(self.char1)
+        self.room1.exits_per_row = 1
+        self.assertNotEqual(one_row, self.room1.return_appearance(self.char1))
+
+    def test_room_rename_and_desc(self):
+        """Test the title follows renames and the description follows edits."""
+        self.room1.return_appearance(self.char1)
+        self.room1.key = "Elysium"
+        self.room1.db.desc = "Velvet and candlelight."
+        appearance = self.room1.return_appearance(self.char1)
+        self.assertIn("Elysium", appearance)
+        self.assertIn("Velvet and candlelight.", appearance)
@@ -0,0 +1,68 @@
+"""
+Tests for room occupancy
+
+Tests that Room.get_occupants, get_exits and get_items follow objects
+moving in and out, including moves that skip the move hooks, and that
+room emits and trigger conditions use them.
+"""
+
+from unittest.mock import patch
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+from typeclasses.characters import Character
+from typeclasses.exits import Exit
+from typeclasses.objects import Object
+from typeclasses.rooms import Room
+from web.builder.v5_conditions import check_condition
+
+
+class RoomOccupancyTestCase(EvenniaTest):
+    """Test the room's view of who and what is in it."""
+
+    room_typeclass = Room
+    exit_typeclass = Exit
+    character_typeclass = Character
+    object_typeclass = Object
+
+    def test_split_by_type(self):
+        """Test characters, exits and items are kept apart."""
+        self.assertEqual(self.room1.get_exits(), [self.exit])
+        self.assertIn(self.obj1, self.room1.get_items())
+        self.assertNotIn(self.char1, self.room1.get_items())
+        self.assertNotIn(self.exit, self.room1.get_items())
+
+    def test_occupants_are_puppeted(self):
+        """Test only characters with a connected account are occupants."""
+        self.assertEqual(self.room1.get_occupants(), [self.char1])
+
+        with patch.object(Character, "has_account", True):
+            self.assertEqual(self.room1.get_occupants(), [self.char1, self.char2])
+
+    def test_moves_update_occupancy(self):
+        """Test arrivals and departures show up without a rescan."""
+        self.char1.move_to(self.room2, quiet=True)
+        self.assertEqual(self.room1.get_occupants(), [])
+        self.assertEqual(self.room2.get_occupants(), [self.char1])
+
+        # Logging out drops the character from the room without move hooks
+        self.char1.location = None
+        self.assertEqual(self.room2.get_occupants(), [])
+
+    def test_deleted_item_removed(self):
+        """Test a deleted object leaves the room's items."""
+        self.obj1.delete()
+        self.assertNotIn(self.obj1, self.room1.get_items())
+
+    def test_emit_skips_exits(self):
+        """Test room emits reach occupants but aren't sent to exits."""
+        with patch.object(Exit, "msg") as exit_msg, patch.object(Character, "msg") as char_msg:
+            self.room1.msg_contents("The lights flicker.", exclude=self.char2)
+            exit_msg.assert_not_called()
+            self.assertEqual(char_msg.call_count, 1)
+
+    def test_occupancy_condition(self):
+        """Test the room_occupancy trigger condition counts occupants."""
+        params = {"operator": "eq", "value": 1}
+        self.assertTrue(check_condition("room_occupancy", params, character=self.char1, room=self.room1))
+        self.assertFalse(check_condition("room_occupancy", params, character=self.char1, room=self.room2))
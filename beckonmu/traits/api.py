@@ -3,21 +3,35 @@ Web API endpoints for enhanced character creation and trait management.
 Provides JSON-based endpoints for web-based character applications.
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views import View
 from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from evennia.objects.models import ObjectDB
 from evennia.accounts.models import AccountDB
+import hashlib
 import json
 
 from .utils import (
     enhanced_import_character_from_json,
     export_character_to_json,
-    get_available_traits_for_character,
+    get_character_splat,
     validate_trait_for_character
 )
 from .models import TraitCategory, Trait, DisciplinePower, CharacterBio, CharacterTrait, CharacterPower
+from .catalog import get_catalog
+from .bulk_export import stream_characters_ndjson
+from .chargen_validation import (
+    RULE_GROUPS,
+    affected_groups,
+    validate_chargen,
+    revalidate_chargen,
+    remember_validation,
+    recall_validation,
+)
 from django.utils import timezone
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -76,6 +90,79 @@ class BaseAPIView(View):
         return super().dispatch(request, *args, **kwargs)
 
 
+# Most pre-serialized catalog payloads (one per filter combination) kept at once
+MAX_CATALOG_PAYLOADS = 256
+
+# Trait catalog the cached payloads were serialized from
+_payload_catalog = None
+
+# (endpoint, filters...) -> (JSON body, ETag)
+_catalog_payloads = {}
+
+
+def catalog_response(request, key, build):
+    """
+    Serve a slice of the trait catalog as JSON, serialized once per catalog.
+
+    The payload for each filter combination is cached until the trait
+    catalog is rebuilt (see traits.catalog). Responses carry an ETag (a
+    hash of the payload) and a Last-Modified time (when the catalog was
+    built), so browsers revalidate and get a 304 while nothing changed.
+
+    Args:
+        request: The GET request
+        key (tuple): Endpoint name and filter values identifying the slice
+        build: Function taking the TraitCatalog and returning the data to send
+
+    Returns:
+        HttpResponse: The JSON payload, or 304 Not Modified
+    """
+    global _payload_catalog
+
+    catalog = get_catalog()
+    if catalog is not _payload_catalog:
+        _catalog_payloads.clear()
+        _payload_catalog = catalog
+
+    entry = _catalog_payloads.get(key)
+    if entry is None:
+        body = json.dumps(build(catalog), cls=DjangoJSONEncoder).encode('utf-8')
+        entry = (body, f'"{hashlib.md5(body).hexdigest()}"')
+        # Filters come from the query string; don't let odd ones grow the cache forever
+        if len(_catalog_payloads) < MAX_CATALOG_PAYLOADS:
+            _catalog_payloads[key] = entry
+    body, etag = entry
+
+    last_modified = int(catalog.built_at.timestamp())
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def serialize_traits(catalog, traits):
+    """Serialize catalog TraitEntry objects for the trait APIs."""
+    categories = catalog.categories
+    data = []
+    for trait in traits:
+        data.append({
+            'id': trait.id,
+            'name': trait.name,
+            'category': trait.category_code,
+            'category_name': categories[trait.category_id].name,
+            'description': trait.description,
+            'min_value': trait.min_value,
+            'max_value': trait.max_value,
+            'is_instanced': trait.is_instanced,
+            'has_specialties': trait.has_specialties,
+            'splat_restriction': trait.splat_restriction
+        })
+    return data
+
+
 class TraitCategoriesAPI(BaseAPIView):
     """API endpoint for trait categories."""
 
@@ -84,7 +171,12 @@ class TraitCategoriesAPI(BaseAPIView):
         if not request.user.is_authenticated:
             return JsonResponse({'error': 'Authentication required'}, status=401)
 
-        categories = TraitCategory.objects.all()
+        return catalog_response(request, ('categories',), self.build)
+
+    @staticmethod
+    def build(catalog):
+        """Serialize every category, in display order."""
+        categories = sorted(catalog.categories.values(), key=lambda category: (category.sort_order, category.name))
         data = []
 
         for category in categories:
@@ -96,7 +188,7 @@ class TraitCategoriesAPI(BaseAPIView):
                 'sort_order': category.sort_order
             })
 
-        return JsonResponse({'categories': data})
+        return {'categories': data}
 
 
 class TraitsAPI(BaseAPIView):
@@ -110,37 +202,21 @@ class TraitsAPI(BaseAPIView):
         category_code = request.GET.get('category')
         splat = request.GET.get('splat', 'mortal')
 
-        traits = Trait.objects.filter(is_active=True)
-
-        if category_code:
-            traits = traits.filter(category__code=category_code)
-
-        # Filter by splat restriction
-        if splat:
-            traits = traits.filter(
-                models.Q(splat_restriction__isnull=True) |
-                models.Q(splat_restriction='') |
-                models.Q(splat_restriction=splat)
-            )
+        return catalog_response(
+            request, ('traits', category_code, splat),
+            lambda catalog: self.build(catalog, category_code, splat)
+        )
 
-        traits = traits.select_related('category').order_by('category__sort_order', 'sort_order', 'name')
+    @staticmethod
+    def build(catalog, category_code=None, splat=None):
+        """Serialize active traits matching the filters, in display order."""
+        # The catalog keeps each splat's list already filtered and sorted
+        traits = catalog.available_for(splat or None)
 
-        data = []
-        for trait in traits:
-            data.append({
-                'id': trait.id,
-                'name': trait.name,
-                'category': trait.category.code,
-                'category_name': trait.category.name,
-                'description': trait.description,
-                'min_value': trait.min_value,
-                'max_value': trait.max_value,
-                'is_instanced': trait.is_instanced,
-                'has_specialties': trait.has_specialties,
-                'splat_restriction': trait.splat_restriction
-            })
+        if category_code:
+            traits = [trait for trait in traits if trait.category_code == category_code]
 
-        return JsonResponse({'traits': data})
+        return {'traits': serialize_traits(catalog, traits)}
 
 
 class DisciplinePowersAPI(BaseAPIView):
@@ -154,69 +230,109 @@ class DisciplinePowersAPI(BaseAPIView):
         discipline_name = request.GET.get('discipline')
         level = request.GET.get('level')
 
-        powers = DisciplinePower.objects.filter(is_active=True)
-
         if discipline_name:
-            powers = powers.filter(discipline__name__iexact=discipline_name)
+            discipline_name = discipline_name.lower()
 
         if level:
             try:
-                powers = powers.filter(level=int(level))
+                level = int(level)
             except ValueError:
                 return JsonResponse({'error': 'Invalid level parameter'}, status=400)
 
-        powers = powers.select_related('discipline', 'amalgam_discipline').order_by(
-            'discipline__name', 'level', 'sort_order', 'name'
+        return catalog_response(
+            request, ('powers', discipline_name, level),
+            lambda catalog: self.build(catalog, discipline_name, level)
         )
 
+    @staticmethod
+    def build(catalog, discipline_name=None, level=None):
+        """Serialize active powers matching the filters, by discipline and level."""
+        powers = [power for power in catalog.powers.values() if power.is_active]
+
+        if discipline_name:
+            powers = [power for power in powers if power.discipline_name.lower() == discipline_name]
+
+        if level:
+            powers = [power for power in powers if power.level == level]
+
+        powers.sort(key=lambda power: (power.discipline_name, power.level, power.sort_order, power.name))
+
         data = []
         for power in powers:
+            amalgam = catalog.traits.get(power.amalgam_discipline_id)
+            requirements_text = f"{power.discipline_name} {power.level}"
+            if amalgam:
+                requirements_text += f", {amalgam.name} {power.amalgam_level}"
+
             data.append({
                 'id': power.id,
                 'name': power.name,
-                'discipline': power.discipline.name,
+                'discipline': power.discipline_name,
                 'level': power.level,
                 'description': power.description,
                 'dice_pool': power.dice_pool,
                 'cost': power.cost,
                 'duration': power.duration,
-                'amalgam_discipline': power.amalgam_discipline.name if power.amalgam_discipline else None,
+                'amalgam_discipline': amalgam.name if amalgam else None,
                 'amalgam_level': power.amalgam_level,
-                'requirements_text': power.requirements_text
+                'requirements_text': requirements_text
             })
 
-        return JsonResponse({'powers': data})
+        return {'powers': data}
 
 
 class CharacterValidationAPI(BaseAPIView):
-    """API endpoint for character validation."""
+    """
+    API endpoint for live character validation.
+
+    Validation runs in memory (see traits.chargen_validation). Post the
+    whole sheet once, either as the request body or as {"sheet": {...}};
+    the response includes a token. After that, post
+    {"token": ..., "changes": {field: value, ...}} with just the fields
+    that changed, and only the rules they affect are checked again. An
+    unknown or expired token gets a 409; post the whole sheet again.
+    """
 
     def post(self, request):
         """Validate character data without creating the character."""
         if not request.user.is_authenticated:
             return JsonResponse({'error': 'Authentication required'}, status=401)
 
-        character_data = request.json
+        data = request.json
 
-        if not character_data:
+        if not data:
             return JsonResponse({'error': 'No character data provided'}, status=400)
 
-        # Create a temporary character object for validation
-        temp_char = ObjectDB()
-        temp_char.db_key = character_data.get('name', 'TempChar')
+        if 'token' in data:
+            changes = data.get('changes') or {}
+            if not isinstance(changes, dict):
+                return JsonResponse({'error': 'changes must be an object'}, status=400)
 
-        # Run validation
-        results = enhanced_import_character_from_json(temp_char, character_data, validate_only=True)
+            state = recall_validation(data['token'], request.user.id)
+            if state is None:
+                return JsonResponse({'error': 'Unknown or expired validation token', 'resync': True}, status=409)
+
+            state = revalidate_chargen(state, changes)
+            checked = affected_groups(changes)
+        else:
+            sheet = data.get('sheet', data)
+            if not isinstance(sheet, dict):
+                return JsonResponse({'error': 'sheet must be an object'}, status=400)
+
+            state = validate_chargen(sheet)
+            checked = list(RULE_GROUPS)
 
         return JsonResponse({
-            'valid': results['success'],
-            'errors': results['validation_errors'] + results['errors'],
-            'warnings': results['warnings'],
+            'valid': state.valid,
+            'errors': state.all_errors(),
+            'warnings': [],
             'summary': {
-                'traits_validated': results['imported_traits'],
-                'specialties_validated': results['imported_specialties'],
-                'powers_validated': results['imported_powers']
-            }
+                'traits_validated': state.counts['traits'],
+                'specialties_validated': state.counts['specialties'],
+                'powers_validated': state.counts['powers']
+            },
+            'token': remember_validation(state, request.user.id),
+            'checked': checked,
         })
 
 
@@ -299,6 +415,28 @@ class CharacterExportAPI(BaseAPIView):
         })
 
 
+class CharacterBulkExportAPI(BaseAPIView):
+    """API endpoint streaming every character as (gzipped) NDJSON for backups."""
+
+    def get(self, request):
+        """Stream all characters, one exported sheet per line."""
+        if not request.user.is_authenticated:
+            return JsonResponse({'error': 'Authentication required'}, status=401)
+        if not request.user.is_staff:
+            return JsonResponse({'error': 'Staff permissions required'}, status=403)
+
+        include_powers = request.GET.get('include_powers', 'true').lower() == 'true'
+        compress = request.GET.get('gzip', 'true').lower() == 'true'
+
+        filename = 'characters.ndjson.gz' if compress else 'characters.ndjson'
+        response = StreamingHttpResponse(
+            stream_characters_ndjson(include_powers=include_powers, compress=compress),
+            content_type='application/gzip' if compress else 'application/x-ndjson',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
 class CharacterAvailableTraitsAPI(BaseAPIView):
     """API endpoint for getting available traits for a character."""
 
@@ -316,24 +454,12 @@ class CharacterAvailableTraitsAPI(BaseAPIView):
         if character.db_account != request.user and not request.user.is_staff:
             return JsonResponse({'error': 'Permission denied'}, status=403)
 
-        available_traits = get_available_traits_for_character(character)
+        splat = get_character_splat(character)
 
-        data = []
-        for trait in available_traits:
-            data.append({
-                'id': trait.id,
-                'name': trait.name,
-                'category': trait.category.code,
-                'category_name': trait.category.name,
-                'description': trait.description,
-                'min_value': trait.min_value,
-                'max_value': trait.max_value,
-                'is_instanced': trait.is_instanced,
-                'has_specialties': trait.has_specialties,
-                'splat_restriction': trait.splat_restriction
-            })
-
-        return JsonResponse({'available_traits': data})
+        return catalog_response(
+            request, ('available', splat),
+            lambda catalog: {'available_traits': serialize_traits(catalog, catalog.available_for(splat))}
+        )
 
 
 class PendingCharactersAPI(BaseAPIView):
@@ -820,5 +946,6 @@ def get_api_urls():
         path('api/character/validate/', CharacterValidationAPI.as_view(), name='character_validation_api'),
         path('api/character/import/', CharacterImportAPI.as_view(), name='character_import_api'),
         path('api/character/<int:character_id>/export/', CharacterExportAPI.as_view(), name='character_export_api'),
+        path('api/characters/export/', CharacterBulkExportAPI.as_view(), name='character_bulk_export_api'),
         path('api/character/<int:character_id>/available-traits/', CharacterAvailableTraitsAPI.as_view(), name='character_available_traits_api'),
     ]
@@ -7,3 +7,9 @@ from django.apps import AppConfig
 class TraitsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'traits'
+
+    def ready(self):
+        # Keep the in-memory trait catalog in step with admin edits
+        from .catalog import connect_signals
+
+        connect_signals()
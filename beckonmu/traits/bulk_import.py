@@ -0,0 +1,400 @@
+"""
+Bulk Character Import
+
+Imports many web character generator sheets at once, e.g. when moving a
+whole chronicle over. Sheets come from a directory of .json files or
+from one NDJSON file (one sheet per line). Exports of existing
+characters (see traits.bulk_export) import with check_pools=False, since
+played characters no longer fit the character creation dot totals.
+
+A run has two phases:
+
+1. Validation. Sheets are parsed and checked against the chargen pool
+   rules (validate_v5_chargen_pools, unless check_pools is False) in
+   worker processes, in parallel.
+   Workers never touch the database; the catalog checks (trait bounds,
+   splat restrictions, instances, power and Amalgam requirements) follow
+   in the main process, using the character creator's checks from
+   traits.chargen_validation.
+2. Writing. Valid sheets are applied a chunk at a time, each chunk in
+   its own transaction: the chunk's characters and existing rows are read
+   in a few queries, then written with bulk_create and bulk_update.
+
+A sheet that fails validation, or whose chunk fails to write, is reported
+and skipped; the run carries on with the rest.
+
+Each sheet names its character with a 'character' field (key or #dbref),
+falling back to 'name'. Exported sheets also carry a 'character_id'
+#dbref, which is used when it still names a character with that key (a
+restore into the same database); keys aren't unique, so this lets
+characters sharing a key be restored.
+
+Usage:
+    sources = read_sheet_sources("/path/to/chronicle.ndjson")
+    for label, result in import_character_sheets(sources, workers=4).items():
+        if not result['success']:
+            print(label, result['validation_errors'] + result['errors'])
+"""
+
+import copy
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from evennia.objects.models import ObjectDB
+from evennia.utils import logger
+
+from .chargen_validation import check_sheet_traits, check_sheet_specialties, check_sheet_powers
+from .models import CharacterTrait, CharacterPower, CharacterBio
+from .utils import STATS, SYNC_BATCH_SIZE, validate_v5_chargen_pools, _set_stats_value
+
+
+# Sheets written per transaction
+IMPORT_CHUNK_SIZE = 200
+
+# Sheets handed to a worker process at a time
+WORKER_BATCH_SIZE = 50
+
+
+def read_sheet_sources(path):
+    """
+    Read raw sheets from a directory of .json files or an NDJSON file.
+
+    Args:
+        path: Directory or NDJSON file path
+
+    Yields:
+        Tuples of (label, text), where label names the file (and line)
+    """
+    path = Path(path)
+    if path.is_dir():
+        for filepath in sorted(path.glob('*.json')):
+            yield filepath.name, filepath.read_text(encoding='utf-8')
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                yield f"{path.name}:{line_number}", line
+
+
+def parse_sheet(source, check_pools=True):
+    """
+    Parse one raw sheet and check its chargen pools.
+
+    Runs in worker processes, so it must not use the database.
+
+    Args:
+        source: Tuple of (label, text) from read_sheet_sources()
+        check_pools: Whether to apply the character creation pool rules
+
+    Returns:
+        Tuple of (label, sheet or None, list of validation errors)
+    """
+    label, text = source
+    try:
+        sheet = json.loads(text)
+    except ValueError as e:
+        return label, None, [f"Invalid JSON: {e}"]
+    if not isinstance(sheet, dict):
+        return label, None, ["Invalid JSON format. Expected a dictionary/object."]
+    if not check_pools:
+        return label, sheet, []
+    return label, sheet, validate_v5_chargen_pools(sheet, clan=sheet.get('clan'))
+
+
+def validate_sheets(sources, workers=1, check_pools=True):
+    """
+    Parse and pool-check sheets, in parallel when workers > 1.
+
+    Worker processes are forked, so they share the loaded code without
+    setting Django up again. Where fork isn't available sheets are checked
+    in this process.
+
+    Args:
+        sources: Iterable of (label, text)
+        workers: Number of worker processes
+        check_pools: Whether to apply the character creation pool rules
+
+    Yields:
+        Results of parse_sheet(), in source order
+    """
+    parse = partial(parse_sheet, check_pools=check_pools)
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        for source in sources:
+            yield parse(source)
+        return
+
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield from pool.map(parse, sources, chunksize=WORKER_BATCH_SIZE)
+
+
+def _resolve_sheet(sheet):
+    """
+    Check a sheet's traits and powers against the trait catalog, with the
+    character creator's checks (see traits.chargen_validation).
+
+    Returns:
+        Tuple of (ratings, power ids, errors). Ratings maps
+        (trait id, instance name, specialty) -> (trait name, rating).
+    """
+    traits, trait_errors = check_sheet_traits(sheet)
+    specialties, specialty_errors = check_sheet_specialties(sheet)
+    powers, power_errors = check_sheet_powers(sheet)
+
+    ratings = {}
+    for trait, instance_name, rating in traits:
+        ratings[(trait.id, instance_name, None)] = (trait.name, rating)
+    for trait, specialty, rating in specialties:
+        ratings[(trait.id, None, specialty)] = (trait.name, rating)
+    power_ids = [power.id for power in powers]
+
+    return ratings, power_ids, trait_errors + specialty_errors + power_errors
+
+
+def _character_ref(sheet):
+    """The character key or #dbref a sheet names."""
+    ref = sheet.get('character') or sheet.get('name') or ''
+    return str(ref).strip()
+
+
+def _character_id_ref(sheet):
+    """The exported #dbref of a sheet's character, or '' if it has none."""
+    ref = str(sheet.get('character_id') or '').strip()
+    return ref if ref.startswith('#') and ref[1:].isdigit() else ''
+
+
+def _pick_character(found, ref, id_ref):
+    """
+    The character a sheet names: its exported #dbref while that is still a
+    character with the sheet's key, otherwise whatever its ref matches.
+    """
+    character = found.get(id_ref)
+    if isinstance(character, ObjectDB) and (not ref or character.key.lower() == ref.lower()):
+        return character
+    return found[ref] if ref else "Sheet has no character name"
+
+
+def _find_characters(refs):
+    """
+    Look up characters by key (case-insensitive) or #dbref in one query.
+
+    Returns:
+        Dictionary of ref -> character, or an error string when the ref
+        matches no character or more than one
+    """
+    ids = {int(ref[1:]) for ref in refs if ref.startswith('#') and ref[1:].isdigit()}
+    keys = {ref.lower() for ref in refs if not ref.startswith('#')}
+
+    from typeclasses.characters import Character
+
+    by_id = {}
+    by_key = {}
+    matches = Character.objects.all_family().annotate(key_lower=Lower('db_key')).filter(Q(id__in=ids) | Q(key_lower__in=keys))
+    for character in matches:
+        by_id[character.id] = character
+        by_key.setdefault(character.key_lower, []).append(character)
+
+    found = {}
+    for ref in refs:
+        if ref.startswith('#') and ref[1:].isdigit():
+            character = by_id.get(int(ref[1:]))
+            found[ref] = character or f"No character found matching '{ref}'"
+            continue
+        candidates = by_key.get(ref.lower(), [])
+        if len(candidates) == 1:
+            found[ref] = candidates[0]
+        elif candidates:
+            found[ref] = f"'{ref}' matches more than one character; use a #dbref"
+        else:
+            found[ref] = f"No character found matching '{ref}'"
+    return found
+
+
+def _write_chunk(entries):
+    """
+    Apply resolved sheets in one transaction.
+
+    Args:
+        entries: List of (character, sheet, ratings, power ids, results),
+            naming each character at most once (see _import_chunk)
+    """
+    character_ids = {character.id for character, *_ in entries}
+    now = timezone.now()
+
+    # Exported instance names are lower-cased, so match them case-insensitively
+    existing = {
+        (row.character_id, row.trait_id, row.instance_name and row.instance_name.lower(), row.specialty): row
+        for row in CharacterTrait.objects.filter(character_id__in=character_ids)
+    }
+    known_powers = set(
+        CharacterPower.objects.filter(character_id__in=character_ids).values_list('character_id', 'power_id')
+    )
+    bios = {bio.character_id: bio for bio in CharacterBio.objects.filter(character_id__in=character_ids)}
+
+    traits_to_create = []
+    traits_to_update = []
+    powers_to_create = []
+    bios_to_create = []
+    bios_to_update = []
+
+    for character, sheet, ratings, power_ids, results in entries:
+        for (trait_id, instance_name, specialty), (trait_name, rating) in ratings.items():
+            key = (character.id, trait_id, instance_name and instance_name.lower(), specialty)
+            row = existing.get(key)
+            if row is None:
+                row = existing[key] = CharacterTrait(
+                    character_id=character.id, trait_id=trait_id, instance_name=instance_name,
+                    specialty=specialty, rating=rating
+                )
+                traits_to_create.append(row)
+            elif row.rating != rating:
+                row.rating = rating
+                if row.pk is not None:
+                    row.updated_at = now
+                    traits_to_update.append(row)
+            results['imported_specialties' if specialty else 'imported_traits'] += 1
+
+        for power_id in power_ids:
+            if (character.id, power_id) not in known_powers:
+                known_powers.add((character.id, power_id))
+                powers_to_create.append(CharacterPower(character_id=character.id, power_id=power_id))
+                results['imported_powers'] += 1
+
+        bio = bios.get(character.id)
+        if bio is None:
+            bio = bios[character.id] = CharacterBio(character_id=character.id)
+            bios_to_create.append(bio)
+        elif bio.pk is not None and bio not in bios_to_update:
+            bio.updated_at = now
+            bios_to_update.append(bio)
+        bio.splat = sheet.get('splat', 'mortal')
+        bio.concept = sheet.get('concept', '')
+        bio.full_name = sheet.get('name', character.key)
+
+    with transaction.atomic():
+        CharacterTrait.objects.bulk_create(traits_to_create, batch_size=SYNC_BATCH_SIZE)
+        CharacterTrait.objects.bulk_update(traits_to_update, ['rating', 'updated_at'], batch_size=SYNC_BATCH_SIZE)
+        CharacterPower.objects.bulk_create(powers_to_create, batch_size=SYNC_BATCH_SIZE)
+        CharacterBio.objects.bulk_create(bios_to_create, batch_size=SYNC_BATCH_SIZE)
+        CharacterBio.objects.bulk_update(
+            bios_to_update, ['splat', 'concept', 'full_name', 'updated_at'], batch_size=SYNC_BATCH_SIZE
+        )
+
+        # Mirror into db.stats for backwards compatibility, one write per character
+        for character, sheet, ratings, power_ids, results in entries:
+            stats = character.db.stats
+            stats = stats.deserialize() if stats else copy.deepcopy(STATS)
+            for (trait_id, instance_name, specialty), (trait_name, rating) in ratings.items():
+                _set_stats_value(stats, trait_name, rating, instance_name=instance_name, specialty=specialty)
+            character.db.stats = stats
+
+
+def _import_chunk(chunk, report, dry_run):
+    """Look up the characters for a chunk of valid sheets and write them."""
+    refs = [_character_ref(sheet) for _, sheet, _, _ in chunk]
+    id_refs = [_character_id_ref(sheet) for _, sheet, _, _ in chunk]
+    found = _find_characters({ref for ref in refs + id_refs if ref})
+
+    entries = []
+    for ref, id_ref, (label, sheet, ratings, power_ids) in zip(refs, id_refs, chunk):
+        results = report[label]
+        character = _pick_character(found, ref, id_ref)
+        if not isinstance(character, ObjectDB):
+            results['errors'].append(character)
+            results['success'] = False
+            continue
+        results['character'] = character.key
+        entries.append((character, sheet, ratings, power_ids, results))
+
+    if dry_run or not entries:
+        return
+
+    # Sheets naming the same character are written one after the other,
+    # as separate imports would be, so the later sheet wins
+    group = []
+    seen = set()
+    for entry in entries:
+        if entry[0].id in seen:
+            _write_or_report(group)
+            group = []
+            seen = set()
+        group.append(entry)
+        seen.add(entry[0].id)
+    _write_or_report(group)
+
+
+def _write_or_report(entries):
+    """Write resolved sheets, reporting a failed write on each of them."""
+    try:
+        _write_chunk(entries)
+    except Exception as e:
+        logger.log_trace("Bulk character import chunk failed.")
+        for *_, results in entries:
+            results['imported_traits'] = results['imported_specialties'] = results['imported_powers'] = 0
+            results['errors'].append(f"Write failed: {e}")
+            results['success'] = False
+
+
+def import_character_sheets(sources, workers=1, chunk_size=IMPORT_CHUNK_SIZE, dry_run=False, progress=None,
+                            check_pools=True):
+    """
+    Validate and import many character sheets.
+
+    Args:
+        sources: Iterable of (label, text), e.g. from read_sheet_sources()
+        workers: Worker processes for validation
+        chunk_size: Sheets written per transaction
+        dry_run: If True, validate and look up characters without writing
+        progress: Optional callable(done) called after each chunk
+        check_pools: Whether to apply the character creation pool rules;
+            False for exported characters
+
+    Returns:
+        Dictionary of label -> results, in source order. Results hold
+        'success', 'character', 'errors', 'validation_errors',
+        'imported_traits', 'imported_specialties' and 'imported_powers'.
+    """
+    report = {}
+    chunk = []
+    done = 0
+
+    for label, sheet, errors in validate_sheets(sources, workers=workers, check_pools=check_pools):
+        results = report[label] = {
+            'success': True,
+            'character': None,
+            'errors': [],
+            'validation_errors': list(errors),
+            'imported_traits': 0,
+            'imported_specialties': 0,
+            'imported_powers': 0,
+        }
+        if sheet is not None and not errors:
+            ratings, power_ids, errors = _resolve_sheet(sheet)
+            results['validation_errors'].extend(errors)
+        if results['validation_errors']:
+            results['success'] = False
+            continue
+
+        chunk.append((label, sheet, ratings, power_ids))
+        if len(chunk) >= chunk_size:
+            _import_chunk(chunk, report, dry_run)
+            done += len(chunk)
+            chunk = []
+            if progress:
+                progress(done)
+
+    if chunk:
+        _import_chunk(chunk, report, dry_run)
+        done += len(chunk)
+        if progress:
+            progress(done)
+
+    return report
@@ -0,0 +1,405 @@
+"""
+In-Memory Trait Catalog
+
+Trait metadata (categories, traits and discipline powers) changes only
+when staff seed or edit it, yet nearly every trait lookup needs it. The
+catalog loads all three tables once, at server start, into immutable
+entries keyed by id and by lower-cased name, so metadata lookups are
+dictionary reads instead of SQL queries.
+
+The catalog is rebuilt only when its version stamp changes:
+
+- Saving or deleting a TraitCategory, Trait or DisciplinePower drops the
+  local catalog at once and writes a new stamp to ServerConfig.
+- Commands that write the tables in bulk (seed_traits, load_traits) call
+  bump_catalog_version() when they finish.
+- Those commands run in their own process, so the server polls the stored
+  stamp every CATALOG_VERSION_CHECK_INTERVAL seconds and drops its copy
+  when the stamp differs from the one it was built from.
+
+Usage:
+    from traits.catalog import get_trait
+
+    trait = get_trait("Strength")
+    if trait:
+        print(trait.category_code, trait.max_value)
+"""
+
+import threading
+import weakref
+from collections import namedtuple
+from types import MappingProxyType
+from uuid import uuid4
+
+from django.db import connection, transaction
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from evennia.utils import logger
+
+from .models import TraitCategory, Trait, DisciplinePower
+
+
+# ServerConfig key holding the current catalog version stamp
+CATALOG_VERSION_KEY = "trait_catalog_version"
+
+# Seconds between checks of the stored version stamp
+CATALOG_VERSION_CHECK_INTERVAL = 60
+
+# Splats whose available-trait lists are built with every catalog (as are
+# those of any other splat a trait is restricted to)
+AVAILABILITY_SPLATS = ('mortal', 'ghoul', 'vampire', 'thin-blood')
+
+
+CategoryEntry = namedtuple('CategoryEntry', 'id name code description sort_order')
+
+TraitEntry = namedtuple('TraitEntry', (
+    'id name category_id category_code description is_instanced has_specialties '
+    'splat_restriction min_value max_value sort_order is_active'
+))
+
+PowerEntry = namedtuple('PowerEntry', (
+    'id name discipline_id discipline_name level description amalgam_discipline_id '
+    'amalgam_level dice_pool cost duration sort_order is_active'
+))
+
+
+class TraitCatalog:
+    """
+    Immutable snapshot of all trait metadata.
+
+    Every mapping is read-only; entries are namedtuples. A catalog is never
+    changed after it is built, only replaced.
+
+    Besides the id and name indexes, the active traits available to each
+    splat are materialized in display order (available_traits) and as id
+    sets (available_ids), so availability is a lookup rather than a filter.
+    """
+
+    __slots__ = (
+        'version', 'built_at', 'categories', 'categories_by_code',
+        'traits', 'traits_by_name', 'powers', 'powers_by_name',
+        'active_traits', 'unrestricted_traits', 'available_traits', 'available_ids',
+    )
+
+    def __init__(self, version, categories, traits, powers):
+        self.version = version
+        self.built_at = timezone.now()
+        self.categories = MappingProxyType({entry.id: entry for entry in categories})
+        self.categories_by_code = MappingProxyType({entry.code.lower(): entry for entry in categories})
+        self.traits = MappingProxyType({entry.id: entry for entry in traits})
+        self.traits_by_name = MappingProxyType({entry.name.lower(): entry for entry in traits})
+        self.powers = MappingProxyType({entry.id: entry for entry in powers})
+        self.powers_by_name = MappingProxyType({entry.name.lower(): entry for entry in powers})
+
+        sort_orders = {entry.id: entry.sort_order for entry in categories}
+        active = sorted(
+            (entry for entry in traits if entry.is_active),
+            key=lambda entry: (sort_orders.get(entry.category_id, 0), entry.sort_order, entry.name)
+        )
+        splats = set(AVAILABILITY_SPLATS)
+        splats.update(entry.splat_restriction for entry in active if entry.splat_restriction)
+
+        self.active_traits = tuple(active)
+        self.unrestricted_traits = tuple(entry for entry in active if not entry.splat_restriction)
+        available = {
+            splat: tuple(entry for entry in active if entry.splat_restriction in (None, '', splat))
+            for splat in splats
+        }
+        self.available_traits = MappingProxyType(available)
+        self.available_ids = MappingProxyType({
+            splat: frozenset(entry.id for entry in entries) for splat, entries in available.items()
+        })
+
+    def available_for(self, splat=None):
+        """
+        Active traits available to a splat, in display order.
+
+        Args:
+            splat: Character type (e.g. 'vampire'), or None for every active trait
+
+        Returns:
+            tuple: TraitEntry objects
+        """
+        if splat is None:
+            return self.active_traits
+        return self.available_traits.get(splat, self.unrestricted_traits)
+
+
+# Current catalog, or None until built (or after invalidation)
+_catalog = None
+
+# Running stamp check timer (twisted LoopingCall), set by start_catalog_watcher()
+_watch_task = None
+
+# Per thread, and so per database connection: .write is a weak reference
+# to the stamp write queued for the open transaction (see _on_catalog_change)
+_pending = threading.local()
+
+
+def _stored_version():
+    """The version stamp stored in ServerConfig (None if never set)."""
+    from evennia.server.models import ServerConfig
+
+    return ServerConfig.objects.conf(CATALOG_VERSION_KEY)
+
+
+class _StampWrite:
+    """
+    A stamp write queued with transaction.on_commit.
+
+    Only Django's on_commit queue holds it strongly, so it is freed when
+    the transaction (or the savepoint it was queued in) rolls back, and
+    the weak reference in _pending goes dead with it.
+    """
+
+    __slots__ = ('__weakref__',)
+
+    def __call__(self):
+        _pending.write = None
+        bump_catalog_version()
+
+
+def _queued_stamp_write():
+    """The stamp write queued for this connection's open transaction, or None."""
+    ref = getattr(_pending, 'write', None)
+    return ref() if ref is not None else None
+
+
+def _has_uncommitted_changes():
+    """
+    Whether the current transaction has changed catalog models.
+
+    A catalog built from uncommitted rows must not outlive the transaction,
+    since a rollback sends no delete signals. A queued stamp write is the
+    marker: it runs on commit and is discarded on rollback.
+    """
+    return _queued_stamp_write() is not None and connection.in_atomic_block
+
+
+def build_catalog():
+    """
+    Load all trait metadata from the database and make it current.
+
+    Called from at_server_start; afterwards lookups rebuild the catalog
+    by themselves whenever it has been invalidated. Inside a transaction
+    that has changed catalog models the new catalog is returned but not
+    kept, so a rollback cannot leave it stale.
+
+    Returns:
+        TraitCatalog: The new catalog
+    """
+    global _catalog
+
+    version = _stored_version()
+
+    categories = [
+        CategoryEntry(*row) for row in TraitCategory.objects.values_list(
+            'id', 'name', 'code', 'description', 'sort_order'
+        )
+    ]
+    codes = {entry.id: entry.code for entry in categories}
+
+    traits = [
+        TraitEntry(
+            row[0], row[1], row[2], codes.get(row[2]), *row[3:]
+        ) for row in Trait.objects.values_list(
+            'id', 'name', 'category_id', 'description', 'is_instanced', 'has_specialties',
+            'splat_restriction', 'min_value', 'max_value', 'sort_order', 'is_active'
+        )
+    ]
+    trait_names = {entry.id: entry.name for entry in traits}
+
+    powers = [
+        PowerEntry(
+            row[0], row[1], row[2], trait_names.get(row[2]), *row[3:]
+        ) for row in DisciplinePower.objects.values_list(
+            'id', 'name', 'discipline_id', 'level', 'description', 'amalgam_discipline_id',
+            'amalgam_level', 'dice_pool', 'cost', 'duration', 'sort_order', 'is_active'
+        )
+    ]
+
+    catalog = TraitCatalog(version, categories, traits, powers)
+    if not _has_uncommitted_changes():
+        _catalog = catalog
+    return catalog
+
+
+def get_catalog():
+    """
+    Get the current trait catalog, building it if needed.
+
+    Returns:
+        TraitCatalog: Current catalog
+    """
+    catalog = _catalog
+    if catalog is None:
+        catalog = build_catalog()
+    return catalog
+
+
+def invalidate_catalog():
+    """Drop the local catalog; the next lookup rebuilds it."""
+    global _catalog
+    _catalog = None
+
+
+def bump_catalog_version():
+    """
+    Mark trait metadata as changed, here and in every other process.
+
+    Drops the local catalog and stores a new version stamp, which the
+    server picks up on its next stamp check.
+    """
+    from evennia.server.models import ServerConfig
+
+    invalidate_catalog()
+    ServerConfig.objects.conf(CATALOG_VERSION_KEY, uuid4().hex)
+
+
+def _on_catalog_change(sender, **kwargs):
+    """
+    Signal handler for saves and deletes of catalog models.
+
+    The local catalog is dropped immediately; the stored stamp is written
+    once per transaction, after it commits.
+    """
+    invalidate_catalog()
+    if _queued_stamp_write() is None:
+        write = _StampWrite()
+        _pending.write = weakref.ref(write)
+        transaction.on_commit(write)
+
+
+def connect_signals():
+    """Invalidate the catalog whenever a catalog model changes. Called from TraitsConfig.ready."""
+    for model in (TraitCategory, Trait, DisciplinePower):
+        post_save.connect(_on_catalog_change, sender=model, dispatch_uid=f"trait_catalog_save_{model.__name__}")
+        post_delete.connect(_on_catalog_change, sender=model, dispatch_uid=f"trait_catalog_delete_{model.__name__}")
+
+
+def check_catalog_version():
+    """
+    Drop the local catalog if the stored stamp has changed.
+
+    Picks up changes made by other processes, such as management commands.
+    """
+    catalog = _catalog
+    if catalog is None:
+        return
+    try:
+        if _stored_version() != catalog.version:
+            invalidate_catalog()
+    except Exception:
+        logger.log_trace("Could not check the trait catalog version.")
+
+
+def start_catalog_watcher():
+    """
+    Build the catalog and start the timer that checks its version stamp.
+
+    Called from at_server_start. Safe to call more than once.
+    """
+    global _watch_task
+
+    build_catalog()
+
+    if _watch_task is not None and _watch_task.running:
+        return
+
+    from twisted.internet.task import LoopingCall
+
+    _watch_task = LoopingCall(check_catalog_version)
+    _watch_task.start(CATALOG_VERSION_CHECK_INTERVAL, now=False)
+
+
+def stop_catalog_watcher():
+    """Stop the stamp check timer. Called from at_server_stop."""
+    global _watch_task
+
+    if _watch_task is not None and _watch_task.running:
+        _watch_task.stop()
+    _watch_task = None
+
+
+def get_trait(name):
+    """
+    Look up a trait by name (case-insensitive).
+
+    Args:
+        name: Trait name
+
+    Returns:
+        TraitEntry, or None if there is no such trait
+    """
+    if not name:
+        return None
+    return get_catalog().traits_by_name.get(name.strip().lower())
+
+
+def get_trait_by_id(trait_id):
+    """
+    Look up a trait by id.
+
+    Returns:
+        TraitEntry, or None if there is no such trait
+    """
+    return get_catalog().traits.get(trait_id)
+
+
+def get_category(code):
+    """
+    Look up a trait category by code (case-insensitive).
+
+    Returns:
+        CategoryEntry, or None if there is no such category
+    """
+    if not code:
+        return None
+    return get_catalog().categories_by_code.get(code.strip().lower())
+
+
+def get_power(name):
+    """
+    Look up a discipline power by name (case-insensitive).
+
+    Returns:
+        PowerEntry, or None if there is no such power
+    """
+    if not name:
+        return None
+    return get_catalog().powers_by_name.get(name.strip().lower())
+
+
+def get_available_traits(splat=None):
+    """
+    Active traits available to a splat, in display order.
+
+    Args:
+        splat: Character type (e.g. 'vampire'), or None for every active trait
+
+    Returns:
+        tuple: TraitEntry objects
+    """
+    return get_catalog().available_for(splat)
+
+
+def is_trait_available(trait, splat):
+    """
+    Whether a trait is active and open to a splat.
+
+    Args:
+        trait: TraitEntry, or a trait name (case-insensitive)
+        splat: Character type (e.g. 'vampire'), or None if unknown
+
+    Returns:
+        bool: True if a character of that splat may take the trait
+    """
+    catalog = get_catalog()
+    if not isinstance(trait, TraitEntry):
+        trait = catalog.traits_by_name.get(trait.strip().lower()) if trait else None
+    if trait is None:
+        return False
+    ids = catalog.available_ids.get(splat)
+    if ids is None:
+        return trait.is_active and not trait.splat_restriction
+    return trait.id in ids
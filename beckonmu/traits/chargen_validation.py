@@ -0,0 +1,331 @@
+"""
+Incremental Character Creation Validation
+
+Live validation for the web character creator, run entirely in memory:
+pool totals come from validate_v5_chargen_pools' checks and trait, specialty
+and power rules from the in-memory trait catalog, so validating a sheet
+makes no database queries. The catalog checks (check_sheet_traits,
+check_sheet_specialties, check_sheet_powers) are shared with the bulk
+importer.
+
+Rules are split into groups (attributes, skills, disciplines, ...). A
+full validation checks every group and returns a token; the client then
+sends only the fields that changed with that token, and just the groups
+those fields affect are checked again. Results for the other groups are
+reused from the token's stored state.
+
+Usage:
+    state = validate_chargen(sheet)
+    token = remember_validation(state, owner=user.id)
+
+    state = recall_validation(token, owner=user.id)
+    state = revalidate_chargen(state, {'strength': 3})
+"""
+
+import secrets
+from collections import OrderedDict
+
+from .catalog import get_trait, get_trait_by_id, get_power
+from .utils import CHARGEN_POOL_CHECKS, V5_ATTRIBUTES, V5_SKILLS, check_trait_rating, parse_trait_key
+
+
+# Every rule group, in the order errors are reported
+RULE_GROUPS = (
+    'attributes', 'skills', 'disciplines', 'advantages', 'flaws',
+    'traits', 'specialties', 'powers',
+)
+
+# Top-level sheet fields that aren't traits (see enhanced_import_character_from_json)
+NON_TRAIT_FIELDS = ('splat', 'name', 'concept', 'notes', 'approved', 'approved_by', 'xp', 'specialties')
+
+# Groups to check again when a field changes; other dict fields are 'traits'.
+# Every dict field is also read by the 'traits' group (check_sheet_traits).
+FIELD_GROUPS = {
+    'disciplines': ('disciplines', 'traits', 'powers'),
+    'predator_discipline': ('disciplines',),
+    'predator_type': ('disciplines',),
+    'clan': ('disciplines',),
+    'advantages': ('advantages', 'traits'),
+    'flaws': ('flaws', 'traits'),
+    'splat': ('traits', 'specialties'),
+    'specialties': ('specialties',),
+    'discipline_powers': ('powers',),
+}
+FIELD_GROUPS.update((name, ('attributes',)) for name in V5_ATTRIBUTES)
+FIELD_GROUPS.update((name, ('skills',)) for name in V5_SKILLS)
+
+# Validation states kept for tokens, oldest dropped first
+MAX_VALIDATION_TOKENS = 1000
+
+# token -> (owner, ChargenValidation)
+_tokens = OrderedDict()
+
+
+class ChargenValidation:
+    """
+    A sheet and its validation results, by rule group.
+
+    Treat as immutable: revalidate_chargen() returns a new state.
+
+    Attributes:
+        sheet (dict): The character data validated
+        errors (dict): Rule group -> list of error messages
+        counts (dict): Rule group -> number of items that passed
+    """
+
+    __slots__ = ('sheet', 'errors', 'counts')
+
+    def __init__(self, sheet, errors, counts):
+        self.sheet = sheet
+        self.errors = errors
+        self.counts = counts
+
+    @property
+    def valid(self):
+        """Whether every rule group passed."""
+        return not any(self.errors.values())
+
+    def all_errors(self):
+        """Every error message, in rule group order."""
+        return [error for group in RULE_GROUPS for error in self.errors[group]]
+
+
+def check_sheet_traits(sheet):
+    """
+    Check the rated traits in a sheet's dict fields (e.g. disciplines)
+    against the trait catalog.
+
+    Keys may name instanced traits (see traits.utils.parse_trait_key).
+
+    Returns:
+        Tuple of (traits, errors), where traits lists (TraitEntry,
+        instance name or None, rating) for each trait that passed
+    """
+    traits = []
+    errors = []
+    splat = sheet.get('splat', 'mortal')
+
+    for field, traits_dict in sheet.items():
+        if field in NON_TRAIT_FIELDS or not isinstance(traits_dict, dict):
+            continue
+        for trait_name, rating in traits_dict.items():
+            if not isinstance(rating, (int, float)):
+                continue
+            trait, instance_name = parse_trait_key(trait_name)
+            error = (check_trait_rating(trait, int(rating), splat, instance_name) if trait
+                     else f"Trait '{trait_name}' not found")
+            if error:
+                errors.append(error)
+            else:
+                traits.append((trait, instance_name, int(rating)))
+
+    return traits, errors
+
+
+def check_sheet_specialties(sheet):
+    """
+    Check a sheet's rated specialties ({trait: {specialty: rating}}).
+
+    Returns:
+        Tuple of (specialties, errors), where specialties lists
+        (TraitEntry, specialty, rating) for each specialty that passed
+    """
+    specialties = []
+    errors = []
+    splat = sheet.get('splat', 'mortal')
+
+    specialty_field = sheet.get('specialties')
+    if not isinstance(specialty_field, dict):
+        return specialties, errors
+
+    for trait_name, specialties_dict in specialty_field.items():
+        if not isinstance(specialties_dict, dict):
+            continue
+        trait = get_trait(trait_name)
+        for specialty, rating in specialties_dict.items():
+            if not isinstance(rating, (int, float)):
+                continue
+            error = check_trait_rating(trait, int(rating), splat) if trait else f"Trait '{trait_name}' not found"
+            if error:
+                errors.append(error)
+            else:
+                specialties.append((trait, specialty, int(rating)))
+
+    return specialties, errors
+
+
+def check_sheet_powers(sheet):
+    """
+    Check the discipline level (and Amalgam) requirements of a sheet's
+    chosen powers.
+
+    Returns:
+        Tuple of (powers, errors), where powers lists the PowerEntry of
+        each power that passed
+    """
+    powers = []
+    errors = []
+
+    power_names = sheet.get('discipline_powers')
+    if not isinstance(power_names, (list, tuple)):
+        return powers, errors
+
+    disciplines = sheet.get('disciplines')
+    ratings = {}
+    if isinstance(disciplines, dict):
+        ratings = {
+            name.lower(): int(rating) for name, rating in disciplines.items()
+            if isinstance(rating, (int, float))
+        }
+
+    for power_name in power_names:
+        power = get_power(power_name) if isinstance(power_name, str) else None
+        if power is None:
+            errors.append(f"Discipline power '{power_name}' not found")
+            continue
+
+        current = ratings.get(power.discipline_name.lower(), 0)
+        if current < power.level:
+            errors.append(
+                f"Cannot learn {power_name}: Requires {power.discipline_name} {power.level} (current: {current})"
+            )
+            continue
+
+        amalgam = get_trait_by_id(power.amalgam_discipline_id) if power.amalgam_discipline_id else None
+        if amalgam:
+            current = ratings.get(amalgam.name.lower(), 0)
+            if current < power.amalgam_level:
+                errors.append(
+                    f"Cannot learn {power_name}: Requires {amalgam.name} {power.amalgam_level} (current: {current})"
+                )
+                continue
+
+        powers.append(power)
+
+    return powers, errors
+
+
+def _check_traits(sheet):
+    """Rating rules for every trait in dict fields (e.g. disciplines)."""
+    traits, errors = check_sheet_traits(sheet)
+    return errors, len(traits)
+
+
+def _check_specialties(sheet):
+    """Rating rules for rated specialties ({trait: {specialty: rating}})."""
+    specialties, errors = check_sheet_specialties(sheet)
+    return errors, len(specialties)
+
+
+def _check_powers(sheet):
+    """Discipline level (and Amalgam) requirements for chosen powers."""
+    powers, errors = check_sheet_powers(sheet)
+    return errors, len(powers)
+
+
+def _check_group(group, sheet):
+    """Run one rule group. Returns (errors, number passed)."""
+    if group in CHARGEN_POOL_CHECKS:
+        return CHARGEN_POOL_CHECKS[group](sheet, clan=sheet.get('clan')), 0
+    if group == 'traits':
+        return _check_traits(sheet)
+    if group == 'specialties':
+        return _check_specialties(sheet)
+    return _check_powers(sheet)
+
+
+def validate_chargen(sheet):
+    """
+    Validate a whole character creation sheet.
+
+    Args:
+        sheet (dict): Character data from the web character creator
+
+    Returns:
+        ChargenValidation: Results for every rule group
+    """
+    sheet = dict(sheet)
+    errors = {}
+    counts = {}
+    for group in RULE_GROUPS:
+        errors[group], counts[group] = _check_group(group, sheet)
+    return ChargenValidation(sheet, errors, counts)
+
+
+def affected_groups(changes):
+    """
+    Rule groups that a set of changed fields can affect.
+
+    Args:
+        changes (dict): Changed top-level fields
+
+    Returns:
+        list: Rule groups, in RULE_GROUPS order
+    """
+    groups = set()
+    for field in changes:
+        groups.update(FIELD_GROUPS.get(field, ('traits',)))
+    return [group for group in RULE_GROUPS if group in groups]
+
+
+def revalidate_chargen(state, changes):
+    """
+    Apply changed fields to a validated sheet and re-check what they affect.
+
+    Args:
+        state (ChargenValidation): Previous validation
+        changes (dict): Top-level field -> new value (None removes the field).
+            Dict fields such as 'disciplines' are replaced whole.
+
+    Returns:
+        ChargenValidation: New state; the previous one is unchanged
+    """
+    sheet = dict(state.sheet)
+    for field, value in changes.items():
+        if value is None:
+            sheet.pop(field, None)
+        else:
+            sheet[field] = value
+
+    errors = dict(state.errors)
+    counts = dict(state.counts)
+    for group in affected_groups(changes):
+        errors[group], counts[group] = _check_group(group, sheet)
+    return ChargenValidation(sheet, errors, counts)
+
+
+def remember_validation(state, owner):
+    """
+    Store a validation state and get a token the client can send back.
+
+    Args:
+        state (ChargenValidation): State to keep
+        owner: Who may use the token (e.g. the user id)
+
+    Returns:
+        str: Validation token
+    """
+    token = secrets.token_urlsafe(16)
+    _tokens[token] = (owner, state)
+    while len(_tokens) > MAX_VALIDATION_TOKENS:
+        _tokens.popitem(last=False)
+    return token
+
+
+def recall_validation(token, owner):
+    """
+    Get the validation state for a token.
+
+    Args:
+        token (str): Token from remember_validation()
+        owner: Must match the owner the token was issued to
+
+    Returns:
+        ChargenValidation, or None if the token is unknown, expired or
+        belongs to someone else
+    """
+    entry = _tokens.get(token)
+    if entry is None or entry[0] != owner:
+        return None
+    _tokens.move_to_end(token)
+    return entry[1]
@@ -0,0 +1,61 @@
+"""
+Django management command to export every character as NDJSON.
+
+Writes one export_character_to_json sheet per line, gzip-compressed by
+default, streaming so memory use stays flat however many characters
+there are. Once decompressed, the output can be read back with
+`import_characters --restore`.
+
+Usage:
+    evennia export_characters <output file, or - for stdout> [--no-gzip] [--no-powers]
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand
+from traits.bulk_export import stream_characters_ndjson
+
+
+class Command(BaseCommand):
+    """Export all characters to a (gzipped) NDJSON file."""
+
+    help = "Export every character as NDJSON, gzip-compressed by default"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output',
+            help='File to write (e.g. characters.ndjson.gz), or - for stdout',
+        )
+        parser.add_argument(
+            '--no-gzip',
+            action='store_true',
+            help='Write plain NDJSON instead of gzip',
+        )
+        parser.add_argument(
+            '--no-powers',
+            action='store_true',
+            help='Leave discipline powers out of the export',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        chunks = stream_characters_ndjson(
+            include_powers=not options['no_powers'],
+            compress=not options['no_gzip'],
+        )
+
+        if options['output'] == '-':
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        written = 0
+        with open(options['output'], 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"[SUCCESS] Exported characters to {options['output']} ({written} bytes)"
+        ))
@@ -0,0 +1,92 @@
+"""
+Django management command to import many character sheets at once.
+
+Reads web character generator sheets from a directory of .json files or
+an NDJSON file (one sheet per line), validates them in parallel worker
+processes and writes the valid ones in chunked bulk transactions. Invalid
+sheets are reported without stopping the run. Use --restore for files
+written by export_characters: played characters no longer fit the
+character creation dot totals, so those checks are skipped.
+
+Usage:
+    evennia import_characters <directory or .ndjson file> [--workers 4] [--chunk 200] [--dry-run] [--restore]
+"""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from traits.bulk_import import IMPORT_CHUNK_SIZE, read_sheet_sources, import_character_sheets
+
+
+class Command(BaseCommand):
+    """Bulk import character sheets into the trait system."""
+
+    help = "Import character sheets from a directory of .json files or an NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Directory of .json sheets, or an NDJSON file with one sheet per line',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Worker processes used to validate sheets (default 1)',
+        )
+        parser.add_argument(
+            '--chunk',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help=f'Sheets written per transaction (default {IMPORT_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate sheets and look up characters without writing anything',
+        )
+        parser.add_argument(
+            '--restore',
+            action='store_true',
+            help='Sheets are exports of existing characters; skip the character creation pool rules',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'Path not found: {path}')
+        if options['workers'] < 1:
+            raise CommandError('--workers must be at least 1')
+        if options['chunk'] < 1:
+            raise CommandError('--chunk must be at least 1')
+
+        verb = 'Checked' if options['dry_run'] else 'Imported'
+        report = import_character_sheets(
+            read_sheet_sources(path),
+            workers=options['workers'],
+            chunk_size=options['chunk'],
+            dry_run=options['dry_run'],
+            progress=lambda done: self.stdout.write(f'{verb} {done} valid sheets'),
+            check_pools=not options['restore'],
+        )
+
+        imported = traits = 0
+        for label, results in report.items():
+            if not results['success']:
+                self.stdout.write(self.style.WARNING(f'Skipped {label}:'))
+                for error in results['validation_errors'] + results['errors']:
+                    self.stdout.write(f'  {error}')
+                continue
+            imported += 1
+            traits += results['imported_traits'] + results['imported_specialties']
+
+        failed = len(report) - imported
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f'\n[DRY RUN] {imported} of {len(report)} sheets would import, {failed} have errors'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'\n[SUCCESS] {imported} of {len(report)} sheets imported ({traits} traits), {failed} skipped'
+            ))
@@ -10,6 +10,7 @@ from evennia.utils import logger
 import json
 from pathlib import Path
 from traits.models import Trait, TraitCategory
+from traits.catalog import bump_catalog_version
 
 
 class Command(BaseCommand):
@@ -115,6 +116,9 @@ class Command(BaseCommand):
                     self.style.ERROR(f'Error loading {filename}: {e}')
                 )
 
+        # Tell the running server to reload its trait catalog
+        bump_catalog_version()
+
         self.stdout.write(
             self.style.SUCCESS(f'\nTotal: Loaded {total_loaded} traits')
         )
@@ -0,0 +1,128 @@
+"""
+Django management command to move characters onto the compact state.
+
+Converts each character's legacy db dictionaries (stats, vampire, pools,
+humanity_data, advantages, experience, effects, active_effects) into one
+CharacterState attribute (see world.character_state), a chunk of
+characters per transaction. A character is only converted if the state
+rebuilds every dictionary exactly; others are reported and left alone.
+
+Usage:
+    evennia migrate_character_state --all [--chunk 200] [--dry-run]
+    evennia migrate_character_state <name or #dbref> [...] [--revert]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from typeclasses.characters import Character
+from world.character_state import StateConversionError, convert_character, revert_character
+
+
+class Command(BaseCommand):
+    """Convert characters' legacy db dictionaries into the compact state."""
+
+    help = "Move characters' V5 db dictionaries into the compact character state"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'characters',
+            nargs='*',
+            help='Names or #dbrefs of characters to convert',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Convert every character',
+        )
+        parser.add_argument(
+            '--chunk',
+            type=int,
+            default=200,
+            help='Characters converted per transaction (default 200)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Check the conversion and report sizes without saving anything',
+        )
+        parser.add_argument(
+            '--revert',
+            action='store_true',
+            help='Move characters back to the legacy db dictionaries',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        chunk_size = options['chunk']
+        if chunk_size < 1:
+            raise CommandError('--chunk must be at least 1')
+        if options['revert'] and options['dry_run']:
+            raise CommandError('--dry-run only applies to conversion')
+
+        if options['all']:
+            queryset = Character.objects.all_family()
+        elif options['characters']:
+            queryset = self._find_characters(options['characters'])
+        else:
+            raise CommandError('Give character names or #dbrefs, or use --all')
+
+        queryset = queryset.order_by('id')
+        total = queryset.count()
+        if not total:
+            self.stdout.write(self.style.WARNING('No characters to convert.'))
+            return
+
+        done = converted = before = after = 0
+        skipped = []
+        last_id = 0
+        while True:
+            # Page by id so characters added mid-run can't shift the chunks
+            chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            with transaction.atomic():
+                for character in chunk:
+                    try:
+                        if options['revert']:
+                            revert_character(character)
+                        else:
+                            old_size, new_size = convert_character(character, dry_run=options['dry_run'])
+                            before += old_size
+                            after += new_size
+                    except StateConversionError as err:
+                        skipped.append(f'{character.key}: {err}')
+                        continue
+                    converted += 1
+
+            done += len(chunk)
+            self.stdout.write(f'Processed {done}/{total} characters')
+
+        for message in skipped:
+            self.stdout.write(self.style.WARNING(f'Skipped {message}'))
+
+        if options['revert']:
+            self.stdout.write(self.style.SUCCESS(
+                f'\n[SUCCESS] {converted} characters moved back to the legacy dictionaries'
+            ))
+            return
+        prefix = '[DRY RUN]' if options['dry_run'] else '[SUCCESS]'
+        verb = 'would convert' if options['dry_run'] else 'converted'
+        self.stdout.write(self.style.SUCCESS(
+            f'\n{prefix} {converted} characters {verb}, {len(skipped)} skipped; '
+            f'stored size {before} -> {after} bytes'
+        ))
+
+    def _find_characters(self, names):
+        """Characters matching the given names or #dbrefs."""
+        ids = []
+        for name in names:
+            if name.startswith('#') and name[1:].isdigit():
+                matches = Character.objects.all_family().filter(id=int(name[1:]))
+            else:
+                matches = Character.objects.all_family().filter(db_key__iexact=name)
+            if not matches:
+                raise CommandError(f"No character found matching '{name}'")
+            ids.extend(match.id for match in matches)
+        return Character.objects.all_family().filter(id__in=ids)
@@ -15,6 +15,7 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from traits.models import TraitCategory, Trait, DisciplinePower
+from traits.catalog import bump_catalog_version
 
 # Import trait constants from v5_data - single source of truth
 from world.v5_data import ATTRIBUTES, SKILLS, DISCIPLINES
@@ -63,6 +64,9 @@ class Command(BaseCommand):
             power_count = self._create_discipline_powers()
             self.stdout.write(self.style.SUCCESS(f'Created {power_count} discipline powers'))
 
+        # Tell the running server to reload its trait catalog
+        bump_catalog_version()
+
         self.stdout.write(self.style.SUCCESS('\n[SUCCESS] Trait seeding complete!'))
 
     def _create_categories(self):
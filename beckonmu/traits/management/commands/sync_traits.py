@@ -0,0 +1,103 @@
+"""
+Django management command to sync characters' db.stats into the trait tables.
+
+Creates missing CharacterTrait rows and updates changed ratings, a chunk
+of characters at a time (one read and one bulk write per chunk).
+
+Usage:
+    evennia sync_traits --all [--chunk 200]
+    evennia sync_traits <name or #dbref> [<name or #dbref> ...]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from typeclasses.characters import Character
+from traits.utils import sync_characters_to_new_system
+
+
+class Command(BaseCommand):
+    """Sync character db.stats data to the database trait system."""
+
+    help = "Sync characters' db.stats traits into CharacterTrait rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'characters',
+            nargs='*',
+            help='Names or #dbrefs of characters to sync',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Sync every character',
+        )
+        parser.add_argument(
+            '--chunk',
+            type=int,
+            default=200,
+            help='Characters synced per transaction (default 200)',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        chunk_size = options['chunk']
+        if chunk_size < 1:
+            raise CommandError('--chunk must be at least 1')
+
+        if options['all']:
+            queryset = Character.objects.all_family()
+        elif options['characters']:
+            queryset = self._find_characters(options['characters'])
+        else:
+            raise CommandError('Give character names or #dbrefs, or use --all')
+
+        queryset = queryset.order_by('id')
+        total = queryset.count()
+        if not total:
+            self.stdout.write(self.style.WARNING('No characters to sync.'))
+            return
+
+        done = created = updated = 0
+        failed = []
+        last_id = 0
+        while True:
+            # Page by id so characters added mid-run can't shift the chunks
+            chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            results = sync_characters_to_new_system(chunk)
+            for character in chunk:
+                result = results[character.id]
+                if not result['success']:
+                    failed.append(f"{character.key}: {result['error']}")
+                    continue
+                created += result['synced_traits'] + result['synced_specialties']
+                updated += result['updated_traits']
+                if options['verbosity'] >= 2:
+                    for error in result['errors']:
+                        self.stdout.write(f"  {character.key}: {error}")
+
+            done += len(chunk)
+            self.stdout.write(f'Synced {done}/{total} characters')
+
+        for message in failed:
+            self.stdout.write(self.style.WARNING(f'Skipped {message}'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n[SUCCESS] {done - len(failed)} characters synced: '
+            f'{created} traits created, {updated} updated'
+        ))
+
+    def _find_characters(self, names):
+        """Characters matching the given names or #dbrefs."""
+        ids = []
+        for name in names:
+            if name.startswith('#') and name[1:].isdigit():
+                matches = Character.objects.all_family().filter(id=int(name[1:]))
+            else:
+                matches = Character.objects.all_family().filter(db_key__iexact=name)
+            if not matches:
+                raise CommandError(f"No character found matching '{name}'")
+            ids.extend(match.id for match in matches)
+        return Character.objects.all_family().filter(id__in=ids)
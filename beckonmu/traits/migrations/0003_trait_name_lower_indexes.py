@@ -0,0 +1,30 @@
+# Migration adding case-insensitive name indexes for Trait and DisciplinePower,
+# used by name__lower lookups. CharacterTrait (character, trait, ...) and
+# CharacterPower (character, power) lookups use their unique_together indexes.
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("traits", "0002_characterbio_status_background"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trait",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"),
+                name="traits_trait_name_lower",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="disciplinepower",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"),
+                name="traits_power_name_lower",
+            ),
+        ),
+    ]
@@ -4,6 +4,7 @@ Provides comprehensive character sheet functionality for Vampire: The Masquerade
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.core.validators import MinValueValidator, MaxValueValidator
 from evennia.objects.models import ObjectDB
 
@@ -56,6 +57,9 @@ class Trait(models.Model):
         app_label = 'traits'
         ordering = ['category__sort_order', 'sort_order', 'name']
         unique_together = ['name', 'category']
+        indexes = [
+            models.Index(Lower('name'), name='traits_trait_name_lower'),
+        ]
 
     def __str__(self):
         return f"{self.category.name}: {self.name}"
@@ -66,6 +70,11 @@ class Trait(models.Model):
         return f"{self.category.name} - {self.name}"
 
 
+# Case-insensitive name lookups that can use the LOWER(name) indexes, e.g.
+# Trait.objects.filter(name__lower=name.lower()); __iexact can't use an index
+Trait._meta.get_field('name').register_lookup(Lower)
+
+
 class TraitValue(models.Model):
     """
     Defines valid values/ratings for specific traits.
@@ -118,6 +127,9 @@ class DisciplinePower(models.Model):
         app_label = 'traits'
         ordering = ['discipline', 'level', 'sort_order', 'name']
         unique_together = ['discipline', 'name']
+        indexes = [
+            models.Index(Lower('name'), name='traits_power_name_lower'),
+        ]
 
     def __str__(self):
         amalgam_str = f" (Amalgam: {self.amalgam_discipline.name} {self.amalgam_level})" if self.amalgam_discipline else ""
@@ -132,6 +144,9 @@ class DisciplinePower(models.Model):
         return req
 
 
+DisciplinePower._meta.get_field('name').register_lookup(Lower)
+
+
 class CharacterTrait(models.Model):
     """
     Links a Character to a Trait, storing their rating and specialty information.
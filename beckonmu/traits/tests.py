@@ -6,15 +6,45 @@ Tests the core trait manipulation API:
 - Validating trait assignments
 - Handling specialties and instanced traits
 - Error cases and edge conditions
+- The in-memory trait catalog
+- Per-splat available-trait lists
+- Bulk syncing of db.stats into CharacterTrait rows
+- Database character sheet rendering
+- Conditional GETs of the trait catalog APIs
+- Incremental in-memory chargen validation
+- Bulk character sheet import
+- Streaming NDJSON character export
+- Query plans of the hot trait queries (SQLite)
 """
 
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.core.management import call_command
+from unittest import skipUnless
+from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
 from evennia.objects.models import ObjectDB
-from traits.models import TraitCategory, Trait, CharacterTrait
+from traits import catalog
+from traits import chargen_validation
+from traits.bulk_export import stream_characters_ndjson
+from traits.bulk_import import read_sheet_sources, import_character_sheets
+from traits.api import TraitsAPI
+from traits.chargen_validation import validate_chargen, revalidate_chargen
+from traits.models import TraitCategory, Trait, CharacterTrait, DisciplinePower, CharacterPower, CharacterBio
 from traits.utils import (
+    get_trait_definition,
     get_character_trait_value,
+    sync_character_to_new_system,
+    export_character_to_json,
+    get_available_traits_for_character,
+    format_character_sheet_database,
     set_character_trait_value,
     validate_trait_for_character,
+    check_trait_rating,
 )
 
 
@@ -293,3 +323,906 @@ class TraitModelTestCase(TestCase):
         """Clean up test data."""
         Trait.objects.all().delete()
         TraitCategory.objects.all().delete()
+
+
+class TraitCatalogTestCase(TestCase):
+    """Test cases for the in-memory trait catalog."""
+
+    def setUp(self):
+        """Set up test fixtures without signals, as a bulk load would."""
+        TraitCategory.objects.bulk_create([
+            TraitCategory(name="Test Disciplines", code="test_discs", sort_order=3),
+        ])
+        self.category = TraitCategory.objects.get(code="test_discs")
+        Trait.objects.bulk_create([
+            Trait(name="Auspex", category=self.category, min_value=0, max_value=5),
+        ])
+        self.auspex = Trait.objects.get(name="Auspex")
+        DisciplinePower.objects.bulk_create([
+            DisciplinePower(name="Heightened Senses", discipline=self.auspex, level=1,
+                            description="Sharpened senses."),
+        ])
+        catalog.build_catalog()
+
+    def tearDown(self):
+        """Drop the catalog built from this test's rows."""
+        catalog.invalidate_catalog()
+
+    def test_lookups_do_not_query(self):
+        """Test catalog lookups are served from memory."""
+        with self.assertNumQueries(0):
+            trait = catalog.get_trait("  AUSPEX ")
+            self.assertEqual(trait.id, self.auspex.id)
+            self.assertEqual(trait.category_code, "test_discs")
+            self.assertIs(catalog.get_trait_by_id(self.auspex.id), trait)
+            self.assertEqual(catalog.get_category("Test_Discs").name, "Test Disciplines")
+            power = catalog.get_power("heightened senses")
+            self.assertEqual((power.discipline_name, power.level), ("Auspex", 1))
+            self.assertIsNone(catalog.get_trait("Obfuscate"))
+            self.assertEqual(get_trait_definition("auspex")['max_value'], 5)
+
+    def test_catalog_is_immutable(self):
+        """Test catalog entries and mappings cannot be changed in place."""
+        current = catalog.get_catalog()
+        with self.assertRaises(TypeError):
+            current.traits_by_name['obfuscate'] = None
+        with self.assertRaises(AttributeError):
+            current.traits_by_name['auspex'].max_value = 10
+
+    def test_save_invalidates_catalog(self):
+        """Test saving a catalog model makes later lookups see the change."""
+        Trait.objects.create(name="Obfuscate", category=self.category)
+        self.auspex.max_value = 10
+        self.auspex.save()
+
+        self.assertIsNotNone(catalog.get_trait("Obfuscate"))
+        self.assertEqual(catalog.get_trait("Auspex").max_value, 10)
+
+    def test_uncommitted_changes_not_kept(self):
+        """Test a catalog built before commit is dropped, and the commit writes one stamp."""
+        with patch.object(catalog, 'bump_catalog_version', wraps=catalog.bump_catalog_version) as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                Trait.objects.create(name="Obfuscate", category=self.category)
+                Trait.objects.create(name="Dominate", category=self.category)
+                self.assertIsNot(catalog.get_catalog(), catalog.get_catalog())
+        bump.assert_called_once_with()
+
+        self.assertIs(catalog.get_catalog(), catalog.get_catalog())
+        self.assertIsNotNone(catalog.get_trait("Dominate"))
+
+    def test_rolled_back_changes_forgotten(self):
+        """Test a rolled-back change doesn't hold up caching, here or in other threads."""
+        import threading
+        from django.db import transaction
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            Trait.objects.create(name="Obfuscate", category=self.category)
+            self.assertTrue(catalog._has_uncommitted_changes())
+
+            other_thread = []
+            thread = threading.Thread(target=lambda: other_thread.append(catalog._has_uncommitted_changes()))
+            thread.start()
+            thread.join()
+            self.assertEqual(other_thread, [False])
+            raise RuntimeError("roll back")
+
+        self.assertFalse(catalog._has_uncommitted_changes())
+        self.assertIs(catalog.get_catalog(), catalog.get_catalog())
+        self.assertIsNone(catalog.get_trait("Obfuscate"))
+
+    def test_stored_version_change_invalidates_catalog(self):
+        """Test a new stamp from another process drops the local catalog."""
+        from evennia.server.models import ServerConfig
+
+        current = catalog.get_catalog()
+        catalog.check_catalog_version()
+        self.assertIs(catalog.get_catalog(), current)
+
+        ServerConfig.objects.conf(catalog.CATALOG_VERSION_KEY, "changed-elsewhere")
+        catalog.check_catalog_version()
+        self.assertIsNot(catalog.get_catalog(), current)
+
+
+class AvailableTraitsTestCase(TestCase):
+    """Test cases for the per-splat available-trait lists."""
+
+    def setUp(self):
+        """Set up test fixtures without signals, as a bulk load would."""
+        TraitCategory.objects.bulk_create([
+            TraitCategory(name="Attributes", code="attributes", sort_order=1),
+            TraitCategory(name="Disciplines", code="disciplines", sort_order=3),
+        ])
+        attributes = TraitCategory.objects.get(code="attributes")
+        disciplines = TraitCategory.objects.get(code="disciplines")
+        Trait.objects.bulk_create([
+            Trait(name="Auspex", category=disciplines, splat_restriction="vampire"),
+            Trait(name="Thin-Blood Alchemy", category=disciplines, splat_restriction="thin-blood"),
+            Trait(name="Wits", category=attributes, sort_order=2),
+            Trait(name="Strength", category=attributes, sort_order=1),
+            Trait(name="Retired", category=attributes, is_active=False),
+        ])
+        catalog.build_catalog()
+        self.character = ObjectDB.objects.create(
+            db_key="SplatCharacter", db_typeclass_path="typeclasses.characters.Character"
+        )
+
+    def tearDown(self):
+        """Drop the catalog built from this test's rows."""
+        catalog.invalidate_catalog()
+
+    def _names(self, traits):
+        return [trait.name for trait in traits]
+
+    def test_lists_per_splat(self):
+        """Test each splat gets its active traits in display order, without queries."""
+        with self.assertNumQueries(0):
+            self.assertEqual(self._names(catalog.get_available_traits('vampire')), ['Strength', 'Wits', 'Auspex'])
+            self.assertEqual(self._names(catalog.get_available_traits('mortal')), ['Strength', 'Wits'])
+            self.assertEqual(self._names(catalog.get_available_traits('werewolf')), ['Strength', 'Wits'])
+            self.assertEqual(len(catalog.get_available_traits()), 4)
+
+            self.assertTrue(catalog.is_trait_available('auspex', 'vampire'))
+            self.assertFalse(catalog.is_trait_available('Auspex', 'ghoul'))
+            self.assertTrue(catalog.is_trait_available('Thin-Blood Alchemy', 'thin-blood'))
+            self.assertFalse(catalog.is_trait_available('Retired', 'mortal'))
+            self.assertTrue(catalog.is_trait_available('Wits', 'werewolf'))
+            self.assertTrue(catalog.is_trait_available(catalog.get_trait('Auspex'), 'vampire'))
+
+    def test_rating_checks_use_availability(self):
+        """Test trait rating checks reject restricted and retired traits by the same lookup."""
+        with self.assertNumQueries(0):
+            self.assertEqual(check_trait_rating(catalog.get_trait('Auspex'), 1, 'vampire'), "")
+            self.assertEqual(check_trait_rating(catalog.get_trait('Auspex'), 1, 'ghoul'),
+                             "Auspex is only available to vampire characters")
+            self.assertEqual(check_trait_rating(catalog.get_trait('Retired'), 1, 'mortal'),
+                             "Retired is no longer available")
+
+    def test_lists_refresh_on_catalog_change(self):
+        """Test the lists follow catalog changes."""
+        Trait.objects.filter(name="Auspex").update(splat_restriction=None)
+        catalog.bump_catalog_version()
+        self.assertIn('Auspex', self._names(catalog.get_available_traits('mortal')))
+
+    def test_character_available_traits(self):
+        """Test a character's list follows their splat, and the API serves it."""
+        from evennia.utils import create
+
+        self.character.db.stats = {'splat': 'vampire'}
+        self.assertEqual(
+            self._names(get_available_traits_for_character(self.character)), ['Strength', 'Wits', 'Auspex']
+        )
+
+        account = create.create_account("SplatPlayer", "splat@example.com", "testpassword")
+        account.is_staff = True
+        account.save()
+        self.client.force_login(account)
+        url = f'/api/traits/character/{self.character.id}/available-traits/'
+        response = self.client.get(url)
+        self.assertEqual([trait['name'] for trait in response.json()['available_traits']],
+                         ['Strength', 'Wits', 'Auspex'])
+        self.assertEqual(response.json()['available_traits'][2]['category_name'], "Disciplines")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+
+class TraitSyncTestCase(TestCase):
+    """Test cases for syncing db.stats into the trait tables."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        attributes = TraitCategory.objects.create(name="Attributes", code="attributes")
+        skills = TraitCategory.objects.create(name="Skills", code="skills")
+        self.strength = Trait.objects.create(name="Strength", category=attributes)
+        self.brawl = Trait.objects.create(name="Brawl", category=skills, has_specialties=True)
+        self.animal_ken = Trait.objects.create(name="Animal Ken", category=skills)
+
+        self.characters = [
+            ObjectDB.objects.create(
+                db_key=f"SyncCharacter{i}",
+                db_typeclass_path="typeclasses.characters.Character"
+            )
+            for i in range(2)
+        ]
+        for character in self.characters:
+            character.db.stats = {
+                'attributes': {'physical': {'strength': 3}},
+                'skills': {'physical': {'brawl': 2}, 'social': {'animal_ken': 1}},
+                'disciplines': {'auspex': {'level': 2, 'powers': []}},
+                'specialties': {'brawl': {'Grappling': 1}},
+                'approved': True,
+            }
+
+    def _ratings(self, character):
+        return {
+            (row.trait.name, row.specialty): row.rating
+            for row in CharacterTrait.objects.filter(character=character)
+        }
+
+    def test_sync_creates_and_updates(self):
+        """Test sync creates missing rows, then updates changed ratings only."""
+        character = self.characters[0]
+        results = sync_character_to_new_system(character)
+
+        self.assertTrue(results['success'])
+        self.assertEqual(results['synced_traits'], 3)
+        self.assertEqual(results['synced_specialties'], 1)
+        self.assertEqual(results['errors'], ["Trait 'auspex' not found in new system"])
+        self.assertEqual(self._ratings(character), {
+            ('Strength', None): 3, ('Brawl', None): 2,
+            ('Animal Ken', None): 1, ('Brawl', 'Grappling'): 1,
+        })
+
+        character.db.stats['attributes']['physical']['strength'] = 4
+        results = sync_character_to_new_system(character)
+        self.assertEqual((results['synced_traits'], results['updated_traits']), (0, 1))
+        self.assertEqual(self._ratings(character)[('Strength', None)], 4)
+        self.assertEqual(CharacterTrait.objects.filter(character=character).count(), 4)
+
+    def test_sync_without_stats(self):
+        """Test a character without stats reports an error."""
+        character = self.characters[0]
+        character.db.stats = None
+        results = sync_character_to_new_system(character)
+        self.assertFalse(results['success'])
+
+    def test_sync_traits_command(self):
+        """Test the sync_traits command syncs every character in chunks."""
+        out = StringIO()
+        call_command('sync_traits', '--all', '--chunk', '1', stdout=out)
+
+        self.assertIn("Synced 2/2 characters", out.getvalue())
+        for character in self.characters:
+            self.assertEqual(CharacterTrait.objects.filter(character=character).count(), 4)
+
+
+class CharacterSheetDatabaseTestCase(TestCase):
+    """Test cases for the database-backed character sheet."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.character = ObjectDB.objects.create(
+            db_key="SheetCharacter",
+            db_typeclass_path="typeclasses.characters.Character"
+        )
+        self.disciplines = TraitCategory.objects.create(name="Disciplines", code="disciplines", sort_order=9)
+        auspex = Trait.objects.create(name="Auspex", category=self.disciplines)
+        CharacterTrait.objects.create(character=self.character, trait=auspex, rating=2)
+        for level, name in ((2, "Premonition"), (1, "Heightened Senses")):
+            power = DisciplinePower.objects.create(
+                name=name, discipline=auspex, level=level, description=name
+            )
+            CharacterPower.objects.create(character=self.character, power=power)
+
+    def _add_categories(self, count):
+        """Add categories, each with one rated trait, before Disciplines."""
+        start = TraitCategory.objects.filter(code__startswith="cat_").count()
+        for i in range(start, start + count):
+            category = TraitCategory.objects.create(name=f"Category {i}", code=f"cat_{i}", sort_order=i)
+            trait = Trait.objects.create(name=f"Trait {i}", category=category)
+            CharacterTrait.objects.create(character=self.character, trait=trait, rating=1)
+
+    def test_sheet_groups_and_orders(self):
+        """Test traits are grouped by category in order, then powers by level."""
+        self._add_categories(2)
+        sheet = format_character_sheet_database(self.character)
+
+        self.assertLess(sheet.index("Category 0:"), sheet.index("Category 1:"))
+        self.assertLess(sheet.index("Category 1:"), sheet.index("Disciplines:"))
+        self.assertIn("Auspex", sheet)
+        self.assertLess(sheet.index("Heightened Senses (Level 1)"), sheet.index("Premonition (Level 2)"))
+
+    def test_constant_query_count(self):
+        """Test the sheet takes two queries however many categories exist."""
+        self._add_categories(1)
+        with self.assertNumQueries(2):
+            format_character_sheet_database(self.character)
+
+        self._add_categories(6)
+        with self.assertNumQueries(2):
+            sheet = format_character_sheet_database(self.character)
+        self.assertEqual(sheet.count("|wCategory "), 7)
+
+
+class TraitCatalogAPITestCase(TestCase):
+    """Test cases for the cached trait catalog JSON endpoints."""
+
+    def setUp(self):
+        """Set up test fixtures without signals, as a bulk load would."""
+        from evennia.utils import create
+
+        TraitCategory.objects.bulk_create([
+            TraitCategory(name="Disciplines", code="disciplines", sort_order=3),
+            TraitCategory(name="Skills", code="skills", sort_order=2),
+        ])
+        disciplines = TraitCategory.objects.get(code="disciplines")
+        skills = TraitCategory.objects.get(code="skills")
+        Trait.objects.bulk_create([
+            Trait(name="Auspex", category=disciplines),
+            Trait(name="Oblivion", category=disciplines, splat_restriction="vampire"),
+            Trait(name="Brawl", category=skills),
+        ])
+        auspex = Trait.objects.get(name="Auspex")
+        DisciplinePower.objects.bulk_create([
+            DisciplinePower(name="Premonition", discipline=auspex, level=2, description="Visions."),
+            DisciplinePower(name="Heightened Senses", discipline=auspex, level=1, description="Senses."),
+        ])
+        catalog.build_catalog()
+
+        self.account = create.create_account("CatalogReader", "reader@example.com", "testpassword")
+        self.client.force_login(self.account)
+
+    def tearDown(self):
+        """Drop the catalog built from this test's rows."""
+        catalog.invalidate_catalog()
+
+    def test_requires_login(self):
+        """Test anonymous requests are refused."""
+        self.client.logout()
+        self.assertEqual(self.client.get('/api/traits/').status_code, 401)
+
+    def test_filters_and_order(self):
+        """Test filtered slices match the original query semantics."""
+        traits = self.client.get('/api/traits/', {'splat': 'vampire'}).json()['traits']
+        self.assertEqual([trait['name'] for trait in traits], ["Brawl", "Auspex", "Oblivion"])
+
+        traits = self.client.get('/api/traits/', {'category': 'disciplines'}).json()['traits']
+        self.assertEqual([trait['name'] for trait in traits], ["Auspex"])
+
+        powers = self.client.get('/api/traits/discipline-powers/', {'discipline': 'AUSPEX'}).json()['powers']
+        self.assertEqual([power['name'] for power in powers], ["Heightened Senses", "Premonition"])
+        self.assertEqual(powers[1]['requirements_text'], "Auspex 2")
+
+        response = self.client.get('/api/traits/discipline-powers/', {'level': 'two'})
+        self.assertEqual(response.status_code, 400)
+
+        categories = self.client.get('/api/traits/categories/').json()['categories']
+        self.assertEqual([category['code'] for category in categories], ["skills", "disciplines"])
+
+    def test_payload_serialized_once(self):
+        """Test each filter combination is serialized once per catalog."""
+        with patch.object(TraitsAPI, 'build', wraps=TraitsAPI.build) as build:
+            first = self.client.get('/api/traits/', {'category': 'skills'})
+            second = self.client.get('/api/traits/', {'category': 'skills'})
+            self.client.get('/api/traits/', {'category': 'disciplines'})
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(first.content, second.content)
+
+    def test_conditional_get(self):
+        """Test revalidation returns 304 until the catalog changes."""
+        response = self.client.get('/api/traits/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        response = self.client.get('/api/traits/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        brawl = Trait.objects.get(name="Brawl")
+        brawl.description = "Fisticuffs."
+        brawl.save()
+
+        response = self.client.get('/api/traits/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+def make_chargen_sheet():
+    """A sheet that meets every chargen pool rule."""
+    sheet = {name: 1 for name in ('strength', 'dexterity', 'stamina', 'charisma', 'manipulation',
+                                  'composure', 'intelligence', 'wits', 'resolve')}
+    sheet.update(strength=4, dexterity=3, stamina=3, charisma=3, manipulation=2,
+                 composure=2, intelligence=3, wits=2, resolve=2)
+    sheet.update(athletics=3, brawl=3, stealth=3, insight=3, persuasion=3,
+                 occult=3, awareness=3, investigation=3, medicine=3)
+    sheet.update({
+        'splat': 'vampire',
+        'disciplines': {'Auspex': 2, 'Obfuscate': 1},
+        'discipline_powers': ['Heightened Senses'],
+        'advantages': {'Resources': {'value': 3}, 'Herd': {'value': 4}},
+        'flaws': {'Prey Exclusion': {'value': 2}},
+    })
+    return sheet
+
+
+def make_chargen_catalog():
+    """Create discipline fixtures without signals, as a bulk load would, and build the catalog."""
+    TraitCategory.objects.bulk_create([
+        TraitCategory(name="Disciplines", code="disciplines", sort_order=3),
+    ])
+    disciplines = TraitCategory.objects.get(code="disciplines")
+    Trait.objects.bulk_create([
+        Trait(name="Auspex", category=disciplines, splat_restriction="vampire"),
+        Trait(name="Obfuscate", category=disciplines, splat_restriction="vampire"),
+    ])
+    auspex = Trait.objects.get(name="Auspex")
+    DisciplinePower.objects.bulk_create([
+        DisciplinePower(name="Heightened Senses", discipline=auspex, level=1, description="Senses."),
+        DisciplinePower(name="Premonition", discipline=auspex, level=2, description="Visions."),
+        DisciplinePower(name="Sense the Unseen", discipline=auspex, level=3, description="Unseen."),
+    ])
+    catalog.build_catalog()
+
+
+class ChargenValidationTestCase(TestCase):
+    """Test cases for incremental chargen validation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        make_chargen_catalog()
+        chargen_validation._tokens.clear()
+
+    def tearDown(self):
+        """Drop the catalog built from this test's rows."""
+        catalog.invalidate_catalog()
+        chargen_validation._tokens.clear()
+
+    def test_valid_sheet_without_queries(self):
+        """Test a complete, valid sheet passes with no database queries."""
+        with self.assertNumQueries(0):
+            state = validate_chargen(make_chargen_sheet())
+        self.assertTrue(state.valid, state.all_errors())
+        self.assertEqual(state.counts['traits'], 2)
+        self.assertEqual(state.counts['powers'], 1)
+
+    def test_catalog_rules(self):
+        """Test trait bounds, splat restrictions and power requirements."""
+        sheet = make_chargen_sheet()
+        sheet.update(splat='mortal', discipline_powers=['Sense the Unseen', 'Unknown Power'])
+        errors = validate_chargen(sheet).all_errors()
+
+        self.assertIn("Auspex is only available to vampire characters", errors)
+        self.assertIn("Cannot learn Sense the Unseen: Requires Auspex 3 (current: 2)", errors)
+        self.assertIn("Discipline power 'Unknown Power' not found", errors)
+
+    def test_revalidate_checks_only_affected_groups(self):
+        """Test a change re-runs just the rule groups it affects."""
+        state = validate_chargen(make_chargen_sheet())
+
+        with patch.object(chargen_validation, '_check_powers') as check_powers, \
+                patch.object(chargen_validation, '_check_traits') as check_traits:
+            new_state = revalidate_chargen(state, {'strength': 5})
+            check_powers.assert_not_called()
+            check_traits.assert_not_called()
+
+        self.assertEqual(
+            new_state.all_errors(),
+            ["Attributes: Must spend exactly 15 additional dots (currently 16)"]
+        )
+        self.assertTrue(state.valid)
+
+        new_state = revalidate_chargen(new_state, {'strength': 4, 'disciplines': {'Auspex': 3, 'Obfuscate': 1}})
+        self.assertTrue(any(error.startswith("Disciplines:") for error in new_state.all_errors()))
+        self.assertFalse(any(error.startswith("Attributes:") for error in new_state.all_errors()))
+
+    def test_revalidate_matches_full_validation(self):
+        """Test a delta on any field gives the same errors as validating the whole sheet."""
+        samples = {
+            'disciplines': [{'Bogus': 7}, {'Auspex': 3, 'Obfuscate': 1}],
+            'predator_discipline': ['Auspex'],
+            'predator_type': ['Bogus'],
+            'clan': ['Brujah'],
+            'advantages': [{'Bogus': 7}, {'Resources': 9}],
+            'flaws': [{'Bogus': 7}],
+            'splat': ['ghoul'],
+            'specialties': [{'Bogus': {'Ghosts': 1}}, {'Auspex': {'Ghosts': 9}}],
+            'discipline_powers': [['Bogus', 'Premonition'], ['Sense the Unseen']],
+        }
+        state = validate_chargen(make_chargen_sheet())
+        for field in chargen_validation.FIELD_GROUPS:
+            for value in samples.get(field, [9]) + [None]:
+                with self.subTest(field=field, value=value):
+                    delta = revalidate_chargen(state, {field: value})
+                    self.assertEqual(delta.errors, validate_chargen(delta.sheet).errors)
+
+    def test_api_token_round_trip(self):
+        """Test the endpoint validates a sheet, then deltas against its token."""
+        from evennia.utils import create
+
+        account = create.create_account("ChargenValidator", "validator@example.com", "testpassword")
+        self.client.force_login(account)
+
+        response = self.client.post('/api/traits/character/validate/', make_chargen_sheet(),
+                                    content_type='application/json')
+        self.assertTrue(response.json()['valid'])
+        token = response.json()['token']
+
+        response = self.client.post('/api/traits/character/validate/',
+                                    {'token': token, 'changes': {'flaws': None}},
+                                    content_type='application/json')
+        self.assertEqual(response.json()['checked'], ['flaws', 'traits'])
+        self.assertTrue(response.json()['valid'])
+
+        response = self.client.post('/api/traits/character/validate/',
+                                    {'token': 'stale', 'changes': {}},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+
+
+class BulkImportTestCase(TestCase):
+    """Test cases for bulk character sheet import."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        make_chargen_catalog()
+        self.characters = [
+            ObjectDB.objects.create(
+                db_key=f"ImportCharacter{i}",
+                db_typeclass_path="typeclasses.characters.Character"
+            )
+            for i in range(3)
+        ]
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name)
+
+    def tearDown(self):
+        """Remove sheet files and the catalog."""
+        self.tempdir.cleanup()
+        catalog.invalidate_catalog()
+
+    def _sheet(self, character, **changes):
+        sheet = make_chargen_sheet()
+        sheet.update(character=character, name=f"{character} Full Name", **changes)
+        return sheet
+
+    def test_ndjson_import_reports_per_sheet(self):
+        """Test valid sheets are written and bad ones reported without stopping."""
+        lines = [
+            json.dumps(self._sheet("importcharacter0")),
+            "{not json",
+            json.dumps(self._sheet("ImportCharacter1", strength=5)),
+            json.dumps(self._sheet("Nobody")),
+            "",
+            json.dumps(self._sheet(f"#{self.characters[2].id}", discipline_powers=['Sense the Unseen'])),
+            json.dumps(self._sheet("ImportCharacter1")),
+        ]
+        sheet_file = self.path / "chronicle.ndjson"
+        sheet_file.write_text("\n".join(lines), encoding='utf-8')
+
+        report = import_character_sheets(read_sheet_sources(sheet_file), chunk_size=2)
+
+        self.assertEqual(list(report), [f"chronicle.ndjson:{n}" for n in (1, 2, 3, 4, 6, 7)])
+        self.assertEqual(
+            [label for label, results in report.items() if results['success']],
+            ["chronicle.ndjson:1", "chronicle.ndjson:7"]
+        )
+        self.assertTrue(report["chronicle.ndjson:2"]['validation_errors'][0].startswith("Invalid JSON"))
+        self.assertEqual(report["chronicle.ndjson:4"]['errors'], ["No character found matching 'Nobody'"])
+        self.assertEqual(
+            report["chronicle.ndjson:6"]['validation_errors'],
+            ["Cannot learn Sense the Unseen: Requires Auspex 3 (current: 2)"]
+        )
+
+        first = self.characters[0]
+        self.assertEqual(report["chronicle.ndjson:1"]['character'], "ImportCharacter0")
+        self.assertEqual(report["chronicle.ndjson:1"]['imported_traits'], 2)
+        self.assertEqual(
+            {row.trait.name: row.rating for row in CharacterTrait.objects.filter(character=first)},
+            {'Auspex': 2, 'Obfuscate': 1}
+        )
+        self.assertEqual(
+            list(CharacterPower.objects.filter(character=first).values_list('power__name', flat=True)),
+            ['Heightened Senses']
+        )
+        self.assertEqual(CharacterBio.objects.get(character=first).full_name, "importcharacter0 Full Name")
+        self.assertEqual(first.db.stats['disciplines']['auspex'], 2)
+        self.assertFalse(CharacterTrait.objects.filter(character=self.characters[2]).exists())
+
+    def test_reimport_updates_in_place(self):
+        """Test importing over existing rows updates them rather than duplicating."""
+        (self.path / "a.json").write_text(json.dumps(self._sheet("ImportCharacter0")), encoding='utf-8')
+        import_character_sheets(read_sheet_sources(self.path))
+
+        sheet = self._sheet("ImportCharacter0", disciplines={'Auspex': 1, 'Obfuscate': 2}, concept="Spy")
+        (self.path / "a.json").write_text(json.dumps(sheet), encoding='utf-8')
+        report = import_character_sheets(read_sheet_sources(self.path))
+
+        self.assertTrue(report["a.json"]['success'])
+        self.assertEqual(report["a.json"]['imported_powers'], 0)
+        first = self.characters[0]
+        self.assertEqual(
+            {row.trait.name: row.rating for row in CharacterTrait.objects.filter(character=first)},
+            {'Auspex': 1, 'Obfuscate': 2}
+        )
+        self.assertEqual(CharacterPower.objects.filter(character=first).count(), 1)
+        self.assertEqual(CharacterBio.objects.get(character=first).concept, "Spy")
+
+    def test_same_character_twice_in_chunk(self):
+        """Test two sheets for one character are applied in order, without failing the chunk."""
+        first = self.characters[0]
+        for existing_bio in (False, True):
+            for name, sheet in (
+                ("a.json", self._sheet("ImportCharacter0", concept="Clerk")),
+                ("b.json", self._sheet(f"#{first.id}", disciplines={'Auspex': 1, 'Obfuscate': 2}, concept="Spy")),
+                ("c.json", self._sheet("ImportCharacter1")),
+            ):
+                (self.path / name).write_text(json.dumps(sheet), encoding='utf-8')
+            self.assertEqual(CharacterBio.objects.filter(character=first).exists(), existing_bio)
+
+            report = import_character_sheets(read_sheet_sources(self.path))
+
+            self.assertTrue(all(results['success'] for results in report.values()), report)
+            self.assertEqual(
+                sorted((row.trait.name, row.rating) for row in CharacterTrait.objects.filter(character=first)),
+                [('Auspex', 1), ('Obfuscate', 2)]
+            )
+            self.assertEqual(CharacterPower.objects.filter(character=first).count(), 1)
+            self.assertEqual(CharacterBio.objects.get(character=first).concept, "Spy")
+            self.assertEqual(CharacterTrait.objects.filter(character=self.characters[1]).count(), 2)
+
+    def test_same_checks_as_chargen(self):
+        """Test sheets are held to the character creator's rules, Amalgam included."""
+        auspex = Trait.objects.get(name="Auspex")
+        obfuscate = Trait.objects.get(name="Obfuscate")
+        DisciplinePower.objects.create(
+            name="Unseen Sight", discipline=auspex, level=1, amalgam_discipline=obfuscate, amalgam_level=2
+        )
+        sheet = self._sheet("ImportCharacter0", discipline_powers=['Heightened Senses', 'Unseen Sight'])
+        (self.path / "a.json").write_text(json.dumps(sheet), encoding='utf-8')
+
+        report = import_character_sheets(read_sheet_sources(self.path))
+        self.assertEqual(report["a.json"]['validation_errors'], validate_chargen(sheet).all_errors())
+        self.assertEqual(
+            report["a.json"]['validation_errors'],
+            ["Cannot learn Unseen Sight: Requires Obfuscate 2 (current: 1)"]
+        )
+
+    def test_instanced_traits(self):
+        """Test instanced traits import from the exported key format."""
+        backgrounds = TraitCategory.objects.create(name="Backgrounds", code="backgrounds")
+        Trait.objects.create(name="Contacts", category=backgrounds, is_instanced=True)
+
+        sheet = self._sheet("ImportCharacter0", backgrounds={'Contacts_city_hall': 2, 'Contacts: The Docks': 1})
+        (self.path / "a.json").write_text(json.dumps(sheet), encoding='utf-8')
+        report = import_character_sheets(read_sheet_sources(self.path))
+        self.assertTrue(report["a.json"]['success'], report["a.json"])
+        self.assertEqual(
+            set(CharacterTrait.objects.filter(trait__name="Contacts").values_list('instance_name', 'rating')),
+            {('city hall', 2), ('The Docks', 1)}
+        )
+
+        # Re-importing updates the instance rather than adding another
+        sheet['backgrounds'] = {'Contacts_city_hall': 3}
+        (self.path / "a.json").write_text(json.dumps(sheet), encoding='utf-8')
+        import_character_sheets(read_sheet_sources(self.path))
+        self.assertEqual(
+            CharacterTrait.objects.get(trait__name="Contacts", instance_name="city hall").rating, 3
+        )
+
+        sheet['backgrounds'] = {'Contacts': 2}
+        (self.path / "a.json").write_text(json.dumps(sheet), encoding='utf-8')
+        report = import_character_sheets(read_sheet_sources(self.path))
+        self.assertEqual(
+            report["a.json"]['validation_errors'],
+            ["Contacts requires an instance name (e.g., 'Allies: Police')"]
+        )
+
+    def test_import_characters_command(self):
+        """Test the command validates in worker processes and honors --dry-run."""
+        for i, character in enumerate(self.characters):
+            (self.path / f"{i}.json").write_text(json.dumps(self._sheet(character.key)), encoding='utf-8')
+        (self.path / "bad.json").write_text("[]", encoding='utf-8')
+
+        out = StringIO()
+        call_command('import_characters', str(self.path), '--workers', '2', '--dry-run', stdout=out)
+        self.assertIn("3 of 4 sheets would import", out.getvalue())
+        self.assertIn("Skipped bad.json:", out.getvalue())
+        self.assertFalse(CharacterTrait.objects.exists())
+
+        out = StringIO()
+        call_command('import_characters', str(self.path), '--workers', '2', '--chunk', '2', stdout=out)
+        self.assertIn("Imported 2 valid sheets", out.getvalue())
+        self.assertIn("3 of 4 sheets imported (6 traits), 1 skipped", out.getvalue())
+        self.assertEqual(CharacterTrait.objects.count(), 6)
+
+
+class BulkExportTestCase(TestCase):
+    """Test cases for streaming character export."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        attributes = TraitCategory.objects.create(name="Attributes", code="attributes")
+        backgrounds = TraitCategory.objects.create(name="Backgrounds", code="backgrounds")
+        disciplines = TraitCategory.objects.create(name="Disciplines", code="disciplines")
+        skills = TraitCategory.objects.create(name="Skills", code="skills")
+        strength = Trait.objects.create(name="Strength", category=attributes, has_specialties=True)
+        contacts = Trait.objects.create(name="Contacts", category=backgrounds, is_instanced=True)
+        auspex = Trait.objects.create(name="Auspex", category=disciplines)
+        Trait.objects.create(name="Brawl", category=skills)
+        power = DisciplinePower.objects.create(name="Heightened Senses", discipline=auspex, level=1)
+
+        self.characters = [
+            ObjectDB.objects.create(
+                db_key=f"ExportCharacter{i}",
+                db_typeclass_path="typeclasses.characters.Character"
+            )
+            for i in range(3)
+        ]
+        first = self.characters[0]
+        CharacterTrait.objects.create(character=first, trait=strength, rating=3)
+        CharacterTrait.objects.create(character=first, trait=strength, specialty="Lifting", rating=1)
+        CharacterTrait.objects.create(character=first, trait=contacts, instance_name="City Hall", rating=2)
+        CharacterTrait.objects.create(character=first, trait=auspex, rating=1)
+        CharacterPower.objects.create(character=first, power=power)
+        CharacterBio.objects.create(character=first, full_name="Export Zero", splat="vampire", concept="Clerk")
+        first.db.stats = {'skills': {'physical': {'brawl': 2}}, 'notes': {'a': 1}, 'attributes': {'strength': 9}}
+
+    def _read(self, compress=True, **kwargs):
+        data = b''.join(stream_characters_ndjson(compress=compress, **kwargs))
+        if compress:
+            data = gzip.decompress(data)
+        return [json.loads(line) for line in data.decode('utf-8').splitlines()]
+
+    def test_export_character_to_json(self):
+        """Test a single export groups traits, specialties, instances, powers and stats."""
+        self.assertEqual(export_character_to_json(self.characters[0]), {
+            'character': 'ExportCharacter0',
+            'character_id': f"#{self.characters[0].id}",
+            'name': 'Export Zero',
+            'splat': 'vampire',
+            'concept': 'Clerk',
+            'xp': 0,
+            'attributes': {'Strength': 3},
+            'backgrounds': {'Contacts_city_hall': 2},
+            'disciplines': {'Auspex': 1},
+            'specialties': {'Strength': {'Lifting': 1}},
+            'discipline_powers': ['Heightened Senses'],
+            'skills': {'brawl': 2},
+        })
+        # Without a bio or trait rows everything comes from the defaults and
+        # db.stats, flattened out of its physical/social/mental groups
+        export_data = export_character_to_json(self.characters[1])
+        self.assertEqual((export_data['name'], export_data['splat']), ('ExportCharacter1', 'mortal'))
+        self.assertEqual(export_data['attributes'], {
+            name: rating
+            for group in self.characters[1].db.stats['attributes'].values()
+            for name, rating in group.items()
+        })
+
+    def test_export_imports_back(self):
+        """Test an exported character restores through the bulk importer."""
+        first = self.characters[0]
+
+        def saved():
+            rows = CharacterTrait.objects.filter(character=first)
+            # Instance names travel lower-cased in the Contacts_city_hall keys
+            return (
+                {(row.trait.name, row.instance_name and row.instance_name.lower(), row.specialty, row.rating)
+                 for row in rows},
+                set(CharacterPower.objects.filter(character=first).values_list('power__name', flat=True)),
+            )
+
+        expected_traits, expected_powers = saved()
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "characters.ndjson"
+            path.write_bytes(b''.join(stream_characters_ndjson(
+                ObjectDB.objects.filter(id=first.id), compress=False
+            )))
+            CharacterTrait.objects.filter(character=first).delete()
+            CharacterPower.objects.filter(character=first).delete()
+
+            # Played characters don't fit the creation dot totals
+            report = import_character_sheets(read_sheet_sources(path))
+            self.assertFalse(report[f"{path.name}:1"]['success'])
+            report = import_character_sheets(read_sheet_sources(path), check_pools=False)
+
+        self.assertTrue(report[f"{path.name}:1"]['success'], report)
+        # The db.stats skill comes back as a trait row
+        self.assertEqual(saved(), (expected_traits | {('Brawl', None, None, 2)}, expected_powers))
+        self.assertEqual(CharacterBio.objects.get(character=first).full_name, 'Export Zero')
+
+    def test_shared_keys_restore_by_dbref(self):
+        """Test characters sharing a key restore to themselves, and the key is the fallback."""
+        twin = self.characters[1]
+        twin.db_key = 'ExportCharacter0'
+        twin.save()
+        twin.db.stats = {}
+        CharacterTrait.objects.create(
+            character=twin, trait=Trait.objects.get(name='Strength'), rating=2
+        )
+
+        sheets = [json.loads(line) for line in b''.join(stream_characters_ndjson(
+            ObjectDB.objects.filter(id__in=[self.characters[0].id, twin.id]).order_by('id'), compress=False
+        )).splitlines()]
+        # As if exported from another database: the #dbref names someone else
+        moved = dict(sheets[0], character='ExportCharacter2', character_id=f"#{twin.id}")
+        CharacterTrait.objects.all().delete()
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "characters.ndjson"
+            path.write_text("\n".join(json.dumps(sheet) for sheet in sheets + [moved]), encoding='utf-8')
+            report = import_character_sheets(read_sheet_sources(path), check_pools=False)
+
+        self.assertTrue(all(results['success'] for results in report.values()), report)
+        strength = dict(CharacterTrait.objects.filter(
+            trait__name='Strength', specialty__isnull=True
+        ).values_list('character_id', 'rating'))
+        self.assertEqual(strength, {self.characters[0].id: 3, twin.id: 2, self.characters[2].id: 3})
+
+    def test_stream_matches_single_exports(self):
+        """Test the stream holds one line per character, in a fixed number of queries."""
+        with self.assertNumQueries(5):
+            sheets = self._read()
+
+        self.assertEqual(sheets, [export_character_to_json(character) for character in self.characters])
+        self.assertEqual(self._read(compress=False, include_powers=False)[0].get('discipline_powers'), None)
+
+    def test_export_characters_command(self):
+        """Test the command writes a gzipped NDJSON file."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            output = Path(tempdir) / "characters.ndjson.gz"
+            out = StringIO()
+            call_command('export_characters', str(output), stdout=out)
+            lines = gzip.decompress(output.read_bytes()).splitlines()
+
+        self.assertIn("[SUCCESS]", out.getvalue())
+        self.assertEqual([json.loads(line)['name'] for line in lines],
+                         ['Export Zero', 'ExportCharacter1', 'ExportCharacter2'])
+
+    def test_bulk_export_api_staff_only(self):
+        """Test only staff can stream the export."""
+        from evennia.utils import create
+
+        account = create.create_account("ExportPlayer", "export@example.com", "testpassword")
+        self.client.force_login(account)
+        response = self.client.get('/api/traits/characters/export/')
+        self.assertEqual(response.status_code, 403)
+
+        account.is_staff = True
+        account.save()
+        response = self.client.get('/api/traits/characters/export/?gzip=false')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 3)
+
+
+@skipUnless(connection.vendor == 'sqlite', "EXPLAIN QUERY PLAN is SQLite-specific")
+class TraitQueryPlanTestCase(TestCase):
+    """Test the hot trait queries are index lookups, not full table scans."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        disciplines = TraitCategory.objects.create(name="Disciplines", code="disciplines")
+        self.auspex = Trait.objects.create(name="Auspex", category=disciplines)
+        self.power = DisciplinePower.objects.create(name="Heightened Senses", discipline=self.auspex, level=1)
+        self.character = ObjectDB.objects.create(
+            db_key="PlanCharacter", db_typeclass_path="typeclasses.characters.Character"
+        )
+
+    def assertNoTableScan(self, queryset):
+        """Assert no step of the query's plan scans a whole table."""
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            steps = [row[-1] for row in cursor.fetchall()]
+        scans = [step for step in steps if step.startswith('SCAN')]
+        self.assertFalse(scans, f"Full scan in plan for:\n{sql}\n" + "\n".join(steps))
+
+    def test_character_trait_queries(self):
+        """Test trait lookups by character and trait id or name."""
+        self.assertNoTableScan(CharacterTrait.objects.filter(
+            character_id=self.character.id, trait_id=self.auspex.id,
+            instance_name__isnull=True, specialty__isnull=True,
+        ).values_list('rating'))
+        self.assertNoTableScan(CharacterTrait.objects.filter(
+            character__in=[self.character], trait__name__lower__in=['auspex', 'strength'],
+            instance_name__isnull=True, specialty__isnull=True,
+        ).values_list('character_id', 'trait__name', 'rating'))
+        self.assertNoTableScan(
+            CharacterTrait.objects.filter(character=self.character).select_related('trait__category')
+        )
+
+    def test_character_power_queries(self):
+        """Test power lookups by character and power."""
+        self.assertNoTableScan(CharacterPower.objects.filter(character=self.character, power=self.power))
+        self.assertNoTableScan(
+            CharacterPower.objects.filter(character=self.character).select_related('power__discipline')
+        )
+
+    def test_case_insensitive_name_queries(self):
+        """Test name__lower lookups use the LOWER(name) indexes."""
+        self.assertNoTableScan(Trait.objects.filter(name__lower='auspex'))
+        self.assertNoTableScan(DisciplinePower.objects.filter(name__lower='heightened senses'))
+        self.assertEqual(DisciplinePower.objects.get(name__lower='heightened senses'), self.power)
@@ -10,6 +10,7 @@ from .api import (
     CharacterValidationAPI,
     CharacterImportAPI,
     CharacterExportAPI,
+    CharacterBulkExportAPI,
     CharacterAvailableTraitsAPI,
     CharacterCreateAPI,
     PendingCharactersAPI,
@@ -33,6 +34,7 @@ urlpatterns = [
     path('character/create/', CharacterCreateAPI.as_view(), name='character_create'),
     path('character/import/', CharacterImportAPI.as_view(), name='character_import'),
     path('character/<int:character_id>/export/', CharacterExportAPI.as_view(), name='character_export'),
+    path('characters/export/', CharacterBulkExportAPI.as_view(), name='character_bulk_export'),
     path('character/<int:character_id>/available-traits/', CharacterAvailableTraitsAPI.as_view(), name='character_available_traits'),
 
     # Character approval endpoints
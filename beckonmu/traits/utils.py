@@ -7,6 +7,7 @@ and enhancing the JSON import system for web-based character creation.
 """
 
 from .models import TraitCategory, Trait, DisciplinePower, CharacterTrait, CharacterPower, CharacterBio
+from .catalog import get_trait, get_available_traits, is_trait_available
 # Import compatibility layer from v5_data
 try:
     from world.v5_data import (
@@ -39,12 +40,22 @@ except ImportError:
     def get_trait_category(trait_name):
         return None
 
+from collections.abc import Mapping
+from itertools import groupby
 from evennia.objects.models import ObjectDB
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 import json
 import copy
 
 
+# Rows per INSERT/UPDATE when syncing characters to the new trait system
+SYNC_BATCH_SIZE = 500
+
+# Characters whose data is read together when exporting
+EXPORT_BATCH_SIZE = 200
+
+
 # V5 Character Creation Rules -- must match frontend validation
 # Source: character_creation.html lines 319-345 (attributes), 404-431 (skills), 557-558 (disciplines)
 V5_CHARGEN_RULES = {
@@ -79,29 +90,11 @@ V5_SKILLS = [
 ]
 
 
-def validate_v5_chargen_pools(json_data, clan=None):
-    """
-    Validate V5 character creation pool totals against chargen rules.
-
-    Checks that total dots spent on attributes, skills, disciplines,
-    advantages, and flaws match the allowed totals from V5 chargen rules.
-    Does NOT validate priority distribution (which category gets 7/5/3).
-
-    Args:
-        json_data: Dictionary containing character data from the frontend.
-                   Attributes and skills are flat keys (e.g., 'strength': 3).
-                   Disciplines are in json_data['disciplines'] dict.
-                   Advantages are in json_data['advantages'] dict with {value, instance?, specialty?}.
-                   Flaws are in json_data['flaws'] dict with {value, instance?, specialty?}.
-        clan: Optional clan name for in-clan discipline validation.
-
-    Returns:
-        List of validation error strings (empty if valid).
-    """
+def _check_attribute_pool(json_data, clan=None):
+    """Attributes: exactly 15 dots above the base of 1 each. See validate_v5_chargen_pools."""
     errors = []
     rules = V5_CHARGEN_RULES
 
-    # --- Attribute pool validation ---
     # Attributes are flat keys in json_data with base of 1 each
     attribute_total = 0
     for attr_name in V5_ATTRIBUTES:
@@ -117,7 +110,14 @@ def validate_v5_chargen_pools(json_data, clan=None):
             f"(currently {additional_dots})"
         )
 
-    # --- Skill pool validation ---
+    return errors
+
+
+def _check_skill_pool(json_data, clan=None):
+    """Skills: exactly 27 dots. See validate_v5_chargen_pools."""
+    errors = []
+    rules = V5_CHARGEN_RULES
+
     # Skills are flat keys in json_data with base of 0
     skill_total = 0
     for skill_name in V5_SKILLS:
@@ -130,7 +130,14 @@ def validate_v5_chargen_pools(json_data, clan=None):
             f"Skills: Must spend exactly {rules['skill_total']} dots (currently {skill_total})"
         )
 
-    # --- Discipline pool validation ---
+    return errors
+
+
+def _check_discipline_pool(json_data, clan=None):
+    """Disciplines: 3 dots (plus any predator bonus), in-clan as 2 + 1. See validate_v5_chargen_pools."""
+    errors = []
+    rules = V5_CHARGEN_RULES
+
     disciplines = json_data.get('disciplines', {})
     discipline_total = 0
     if isinstance(disciplines, dict):
@@ -199,7 +206,14 @@ def validate_v5_chargen_pools(json_data, clan=None):
                     "and 1 dot in another"
                 )
 
-    # --- Advantage pool validation ---
+    return errors
+
+
+def _check_advantage_pool(json_data, clan=None):
+    """Advantages: exactly 7 points. See validate_v5_chargen_pools."""
+    errors = []
+    rules = V5_CHARGEN_RULES
+
     advantages = json_data.get('advantages', {})
     advantage_total = 0
     if isinstance(advantages, dict):
@@ -217,7 +231,14 @@ def validate_v5_chargen_pools(json_data, clan=None):
             f"(currently {advantage_total})"
         )
 
-    # --- Flaw pool validation ---
+    return errors
+
+
+def _check_flaw_pool(json_data, clan=None):
+    """Flaws: at most 2 points. See validate_v5_chargen_pools."""
+    errors = []
+    rules = V5_CHARGEN_RULES
+
     flaws = json_data.get('flaws', {})
     flaw_total = 0
     if isinstance(flaws, dict):
@@ -237,9 +258,44 @@ def validate_v5_chargen_pools(json_data, clan=None):
     return errors
 
 
+# Pool checks by rule group, in reporting order
+CHARGEN_POOL_CHECKS = {
+    'attributes': _check_attribute_pool,
+    'skills': _check_skill_pool,
+    'disciplines': _check_discipline_pool,
+    'advantages': _check_advantage_pool,
+    'flaws': _check_flaw_pool,
+}
+
+
+def validate_v5_chargen_pools(json_data, clan=None):
+    """
+    Validate V5 character creation pool totals against chargen rules.
+
+    Checks that total dots spent on attributes, skills, disciplines,
+    advantages, and flaws match the allowed totals from V5 chargen rules.
+    Does NOT validate priority distribution (which category gets 7/5/3).
+
+    Args:
+        json_data: Dictionary containing character data from the frontend.
+                   Attributes and skills are flat keys (e.g., 'strength': 3).
+                   Disciplines are in json_data['disciplines'] dict.
+                   Advantages are in json_data['advantages'] dict with {value, instance?, specialty?}.
+                   Flaws are in json_data['flaws'] dict with {value, instance?, specialty?}.
+        clan: Optional clan name for in-clan discipline validation.
+
+    Returns:
+        List of validation error strings (empty if valid).
+    """
+    errors = []
+    for check in CHARGEN_POOL_CHECKS.values():
+        errors.extend(check(json_data, clan))
+    return errors
+
+
 def get_trait_definition(trait_name):
     """
-    Get trait definition from the database, with fallback to world/data.py.
+    Get trait definition from the trait catalog, with fallback to world/data.py.
 
     Args:
         trait_name: Name of the trait to look up
@@ -247,22 +303,22 @@ def get_trait_definition(trait_name):
     Returns:
         Dictionary with trait information, or None if not found
     """
-    try:
-        trait = Trait.objects.get(name__iexact=trait_name)
-        return {
-            'name': trait.name,
-            'category': trait.category.code,
-            'description': trait.description,
-            'min_value': trait.min_value,
-            'max_value': trait.max_value,
-            'has_specialties': trait.has_specialties,
-            'is_instanced': trait.is_instanced,
-            'splat_restriction': trait.splat_restriction,
-        }
-    except Trait.DoesNotExist:
+    trait = get_trait(trait_name)
+    if trait is None:
         # Fallback to existing world/data.py system
         return get_trait_list(trait_name)
 
+    return {
+        'name': trait.name,
+        'category': trait.category_code,
+        'description': trait.description,
+        'min_value': trait.min_value,
+        'max_value': trait.max_value,
+        'has_specialties': trait.has_specialties,
+        'is_instanced': trait.is_instanced,
+        'splat_restriction': trait.splat_restriction,
+    }
+
 
 def get_character_trait_value(character, trait_name, instance_name=None, specialty=None):
     """
@@ -278,19 +334,92 @@ def get_character_trait_value(character, trait_name, instance_name=None, special
         Integer rating, or 0 if not found
     """
     # First check if character has the trait in the new system
-    try:
-        trait = Trait.objects.get(name__iexact=trait_name)
-        char_trait = CharacterTrait.objects.get(
+    trait = get_trait(trait_name)
+    if trait is not None:
+        rating = CharacterTrait.objects.filter(
             character=character,
-            trait=trait,
+            trait_id=trait.id,
             instance_name=instance_name,
             specialty=specialty
-        )
-        return char_trait.rating
-    except (Trait.DoesNotExist, CharacterTrait.DoesNotExist):
-        pass
+        ).values_list('rating', flat=True).first()
+        if rating is not None:
+            return rating
+
+    return _get_stats_trait_value(character, trait_name, instance_name, specialty)
+
+
+def get_character_trait_values(character, trait_names):
+    """
+    Get several of a character's (non-instanced, non-specialty) trait values
+    with a single database query.
 
-    # Fallback to existing db.stats system
+    Equivalent to calling get_character_trait_value() for each name, but
+    fetches every rating from the new system at once. Traits the character
+    does not have in the new system fall back to db.stats as usual.
+
+    Args:
+        character: Character object
+        trait_names: Iterable of trait names (case-insensitive)
+
+    Returns:
+        Dict mapping each requested name (as given) to its integer rating
+    """
+    return get_trait_values_for_characters([character], trait_names)[character.id]
+
+
+def get_trait_values_for_characters(characters, trait_names):
+    """
+    Get the same trait values for many characters with a single query.
+
+    Used for group and contested rolls, where every participant needs the
+    same traits. Behaves like get_character_trait_values() per character.
+
+    Args:
+        characters: Iterable of Character objects
+        trait_names: Iterable of trait names (case-insensitive)
+
+    Returns:
+        Dict mapping character id to a dict of {trait name (as given): rating}
+    """
+    characters = list(characters)
+    trait_names = list(trait_names)
+    if not characters or not trait_names:
+        return {character.id: {} for character in characters}
+
+    ratings = {}
+    for character_id, name, rating in CharacterTrait.objects.filter(
+        trait__name__lower__in={trait_name.lower() for trait_name in trait_names},
+        character__in=characters,
+        instance_name__isnull=True,
+        specialty__isnull=True
+    ).values_list('character_id', 'trait__name', 'rating'):
+        ratings[(character_id, name.lower())] = rating
+
+    values = {}
+    for character in characters:
+        character_values = {}
+        for trait_name in trait_names:
+            rating = ratings.get((character.id, trait_name.lower()))
+            if rating is None:
+                rating = _get_stats_trait_value(character, trait_name)
+            character_values[trait_name] = rating
+        values[character.id] = character_values
+    return values
+
+
+def _get_stats_trait_value(character, trait_name, instance_name=None, specialty=None):
+    """
+    Look up a trait value in the legacy db.stats system.
+
+    Args:
+        character: Character object
+        trait_name: Name of the trait
+        instance_name: Instance name for instanced traits (optional)
+        specialty: Specialty name for traits with specialties (optional)
+
+    Returns:
+        Integer rating, or 0 if not found
+    """
     if not hasattr(character, 'db') or not character.db.stats:
         return 0
 
@@ -337,12 +466,13 @@ def set_character_trait_value(character, trait_name, rating, instance_name=None,
 
     stats = character.db.stats
 
-    # Try to update the new system first
-    try:
-        trait = Trait.objects.get(name__iexact=trait_name)
+    # Try to update the new system first (a trait that doesn't exist
+    # there is okay)
+    trait = get_trait(trait_name)
+    if trait is not None:
         char_trait, created = CharacterTrait.objects.get_or_create(
             character=character,
-            trait=trait,
+            trait_id=trait.id,
             instance_name=instance_name,
             specialty=specialty,
             defaults={'rating': rating}
@@ -350,10 +480,57 @@ def set_character_trait_value(character, trait_name, rating, instance_name=None,
         if not created:
             char_trait.rating = rating
             char_trait.save()
-    except Trait.DoesNotExist:
-        pass  # Trait doesn't exist in new system, that's okay
 
     # Always update the existing db.stats system for backwards compatibility
+    _set_stats_value(stats, trait_name, rating, instance_name, specialty)
+
+    return True
+
+
+def instanced_trait_key(trait_name, instance_name):
+    """
+    The sheet key for one instance of an instanced trait, as exported.
+
+    Example:
+        >>> instanced_trait_key("Contacts", "City Hall")
+        'Contacts_city_hall'
+    """
+    return f"{trait_name}_{instance_name.lower().replace(' ', '_')}"
+
+
+def parse_trait_key(key):
+    """
+    Find the trait (and instance) a sheet key names.
+
+    Accepts trait names ('Animal Ken' or 'animal_ken'), instanced traits
+    written as instanced_trait_key() writes them ('Contacts_city_hall')
+    and the 'Contacts: City Hall' form.
+
+    Returns:
+        Tuple of (TraitEntry or None, instance name or None)
+    """
+    trait = get_trait(key) or get_trait(key.replace('_', ' '))
+    if trait is not None:
+        return trait, None
+
+    if ':' in key:
+        trait_name, instance_name = key.split(':', 1)
+        trait = get_trait(trait_name)
+        if trait is not None and instance_name.strip():
+            return trait, instance_name.strip()
+
+    # The longest instanced trait name the key starts with
+    parts = key.split('_')
+    for i in range(len(parts) - 1, 0, -1):
+        trait_name = '_'.join(parts[:i])
+        trait = get_trait(trait_name) or get_trait(trait_name.replace('_', ' '))
+        if trait is not None and trait.is_instanced:
+            return trait, ' '.join(parts[i:])
+    return None, None
+
+
+def _set_stats_value(stats, trait_name, rating, instance_name=None, specialty=None):
+    """Store a rating in a db.stats dictionary (see set_character_trait_value)."""
     category = get_trait_category(trait_name)
     if category and category in stats:
         if specialty:
@@ -371,100 +548,192 @@ def set_character_trait_value(character, trait_name, rating, instance_name=None,
             # Standard trait
             stats[category][trait_name.lower()] = rating
 
-    return True
+
+# db.stats keys that don't hold trait ratings
+_SYNC_SKIP_KEYS = ('specialties', 'xp', 'notes', 'approved_by', 'approved')
+
+# Nested db.stats groups (e.g. stats['attributes']['physical']['strength'])
+_SYNC_GROUPS = ('physical', 'social', 'mental')
+
+
+def _find_sync_trait(trait_name, category_code=None):
+    """
+    Find the catalog trait for a db.stats key.
+
+    Keys such as 'animal_ken' also match the trait 'Animal Ken'. With a
+    category code, only a trait in that category matches.
+    """
+    trait = get_trait(trait_name) or get_trait(trait_name.replace('_', ' '))
+    if trait is not None and category_code is not None and trait.category_code != category_code:
+        return None
+    return trait
+
+
+def _iter_stats_ratings(stats):
+    """
+    Yield (category_code, trait_name, rating) for every trait rating in db.stats.
+
+    Handles both the flat layout (stats['skills']['brawl'] = 2) and the
+    nested character layout (stats['skills']['physical']['brawl'] = 2,
+    stats['disciplines']['auspex'] = {'level': 2, ...}).
+    """
+    for category_name, traits_dict in stats.items():
+        if category_name in _SYNC_SKIP_KEYS or not isinstance(traits_dict, Mapping):
+            continue
+
+        for trait_name, rating in traits_dict.items():
+            if isinstance(rating, (int, float)):
+                yield category_name, trait_name, rating
+            elif isinstance(rating, Mapping):
+                if trait_name in _SYNC_GROUPS:
+                    for grouped_name, grouped_rating in rating.items():
+                        if isinstance(grouped_rating, (int, float)):
+                            yield category_name, grouped_name, grouped_rating
+                elif isinstance(rating.get('level'), (int, float)):
+                    yield category_name, trait_name, rating['level']
+
+
+def _iter_stats_specialties(stats):
+    """Yield (trait_name, specialty_name, rating) for rated specialties in db.stats."""
+    for trait_name, specialties_dict in (stats.get('specialties') or {}).items():
+        if isinstance(specialties_dict, Mapping):
+            for specialty_name, rating in specialties_dict.items():
+                if isinstance(rating, (int, float)):
+                    yield trait_name, specialty_name, rating
+
+
+def sync_characters_to_new_system(characters):
+    """
+    Sync many characters' db.stats data to the new trait system at once.
+
+    Existing CharacterTrait rows for all the characters are read in one
+    query and diffed against db.stats; new rows are written with one
+    bulk_create and changed ratings with one bulk_update, in a single
+    transaction. Trait definitions come from the in-memory trait catalog.
+
+    Args:
+        characters: Character objects to sync
+
+    Returns:
+        Dictionary of character id -> sync results (see
+        sync_character_to_new_system)
+    """
+    characters = list(characters)
+    all_results = {}
+    wanted = {}  # (character_id, trait_id, instance_name, specialty) -> rating
+
+    for character in characters:
+        stats = character.db.stats if hasattr(character, 'db') else None
+        if not stats:
+            all_results[character.id] = {'success': False, 'error': 'Character has no stats to sync'}
+            continue
+
+        results = all_results[character.id] = {
+            'success': True,
+            'synced_traits': 0,
+            'synced_specialties': 0,
+            'synced_powers': 0,
+            'updated_traits': 0,
+            'errors': []
+        }
+
+        # Basic traits (attributes, skills, etc.)
+        for category_name, trait_name, rating in _iter_stats_ratings(stats):
+            trait = _find_sync_trait(trait_name, category_name)
+            if trait is None:
+                results['errors'].append(f"Trait '{trait_name}' not found in new system")
+                continue
+            wanted[(character.id, trait.id, None, None)] = int(rating)
+
+        # Specialties
+        for trait_name, specialty_name, rating in _iter_stats_specialties(stats):
+            trait = _find_sync_trait(trait_name)
+            if trait is None:
+                results['errors'].append(f"Trait '{trait_name}' for specialty not found")
+                continue
+            wanted[(character.id, trait.id, None, specialty_name)] = int(rating)
+
+    if not wanted:
+        return all_results
+
+    existing = {}
+    for char_trait in CharacterTrait.objects.filter(
+        character_id__in={key[0] for key in wanted},
+        trait_id__in={key[1] for key in wanted},
+    ):
+        key = (char_trait.character_id, char_trait.trait_id, char_trait.instance_name, char_trait.specialty)
+        existing.setdefault(key, char_trait)
+
+    to_create = []
+    to_update = []
+    now = timezone.now()
+    for key, rating in wanted.items():
+        character_id, trait_id, instance_name, specialty = key
+        results = all_results[character_id]
+        char_trait = existing.get(key)
+        if char_trait is None:
+            to_create.append(CharacterTrait(
+                character_id=character_id,
+                trait_id=trait_id,
+                instance_name=instance_name,
+                specialty=specialty,
+                rating=rating,
+            ))
+            results['synced_specialties' if specialty else 'synced_traits'] += 1
+        elif char_trait.rating != rating:
+            char_trait.rating = rating
+            char_trait.updated_at = now
+            to_update.append(char_trait)
+            results['updated_traits'] += 1
+
+    with transaction.atomic():
+        CharacterTrait.objects.bulk_create(to_create, batch_size=SYNC_BATCH_SIZE)
+        CharacterTrait.objects.bulk_update(to_update, ['rating', 'updated_at'], batch_size=SYNC_BATCH_SIZE)
+
+    return all_results
 
 
 def sync_character_to_new_system(character):
     """
     Sync a character's existing db.stats data to the new trait system.
 
+    Missing CharacterTrait rows are created and ratings that differ from
+    db.stats are updated (see sync_characters_to_new_system).
+
     Args:
         character: Character object to sync
 
     Returns:
         Dictionary with sync results
     """
-    if not hasattr(character, 'db') or not character.db.stats:
-        return {'success': False, 'error': 'Character has no stats to sync'}
-
-    stats = character.db.stats
-    results = {
-        'success': True,
-        'synced_traits': 0,
-        'synced_specialties': 0,
-        'synced_powers': 0,
-        'errors': []
-    }
+    return sync_characters_to_new_system([character])[character.id]
 
-    # Sync basic traits (attributes, skills, etc.)
-    for category_name, traits_dict in stats.items():
-        if category_name in ['specialties', 'xp', 'notes', 'approved_by', 'approved']:
-            continue  # Skip special categories
 
-        if isinstance(traits_dict, dict):
-            for trait_name, rating in traits_dict.items():
-                if isinstance(rating, (int, float)):
-                    try:
-                        trait = Trait.objects.get(name__iexact=trait_name, category__code=category_name)
-                        char_trait, created = CharacterTrait.objects.get_or_create(
-                            character=character,
-                            trait=trait,
-                            defaults={'rating': int(rating)}
-                        )
-                        if created:
-                            results['synced_traits'] += 1
-                    except Trait.DoesNotExist:
-                        results['errors'].append(f"Trait '{trait_name}' not found in new system")
-
-    # Sync specialties
-    if 'specialties' in stats:
-        for trait_name, specialties_dict in stats['specialties'].items():
-            if isinstance(specialties_dict, dict):
-                for specialty_name, rating in specialties_dict.items():
-                    if isinstance(rating, (int, float)):
-                        try:
-                            trait = Trait.objects.get(name__iexact=trait_name)
-                            char_trait, created = CharacterTrait.objects.get_or_create(
-                                character=character,
-                                trait=trait,
-                                specialty=specialty_name,
-                                defaults={'rating': int(rating)}
-                            )
-                            if created:
-                                results['synced_specialties'] += 1
-                        except Trait.DoesNotExist:
-                            results['errors'].append(f"Trait '{trait_name}' for specialty not found")
+def get_character_splat(character):
+    """
+    Get a character's splat from db.stats.
 
-    return results
+    Returns:
+        Splat string (default 'mortal'), or None if the character has no stats
+    """
+    if hasattr(character, 'db') and character.db.stats:
+        return character.db.stats.get('splat', 'mortal')
+    return None
 
 
 def get_available_traits_for_character(character):
     """
     Get all available traits for a character based on their splat.
 
+    The lists are precomputed per splat in the trait catalog.
+
     Args:
         character: Character object
 
     Returns:
-        QuerySet of available Trait objects
+        Tuple of catalog TraitEntry objects, in display order
     """
-    # Get character's splat
-    splat = None
-    if hasattr(character, 'db') and character.db.stats:
-        splat = character.db.stats.get('splat', 'mortal')
-
-    # Filter traits based on splat restrictions
-    available_traits = Trait.objects.filter(is_active=True)
-
-    if splat:
-        # Include traits with no restriction or matching splat restriction
-        available_traits = available_traits.filter(
-            models.Q(splat_restriction__isnull=True) |
-            models.Q(splat_restriction='') |
-            models.Q(splat_restriction=splat)
-        )
-
-    return available_traits.order_by('category__sort_order', 'sort_order', 'name')
+    return get_available_traits(get_character_splat(character))
 
 
 def get_character_discipline_powers(character):
@@ -522,26 +791,24 @@ def format_character_sheet_database(character):
     """
     output = f"|w=== {character.key}'s Character Sheet (Database View) ===|n\n"
 
-    # Get character traits organized by category
-    char_traits = CharacterTrait.objects.filter(character=character).select_related('trait__category')
-
-    categories = TraitCategory.objects.all().order_by('sort_order')
+    # One query for all traits, grouped by category in Python
+    char_traits = CharacterTrait.objects.filter(character=character).select_related(
+        'trait__category'
+    ).order_by('trait__category__sort_order', 'trait__category__name', 'trait__sort_order')
 
-    for category in categories:
-        category_traits = char_traits.filter(trait__category=category)
-        if category_traits.exists():
-            output += f"\n|w{category.name}:|n\n"
-            for char_trait in category_traits.order_by('trait__sort_order'):
-                display_name = char_trait.display_name
-                dots = "•" * char_trait.rating if char_trait.rating > 0 else "○"
-                output += f"  {display_name:<20} {dots} ({char_trait.rating})\n"
+    for category, category_traits in groupby(char_traits, key=lambda char_trait: char_trait.trait.category):
+        output += f"\n|w{category.name}:|n\n"
+        for char_trait in category_traits:
+            display_name = char_trait.display_name
+            dots = "•" * char_trait.rating if char_trait.rating > 0 else "○"
+            output += f"  {display_name:<20} {dots} ({char_trait.rating})\n"
 
     # Show discipline powers
-    powers = get_character_discipline_powers(character)
-    if powers.exists():
+    powers = list(get_character_discipline_powers(character).order_by('power__discipline__name', 'power__level'))
+    if powers:
         output += f"\n|wDiscipline Powers:|n\n"
         current_discipline = None
-        for char_power in powers.order_by('power__discipline__name', 'power__level'):
+        for char_power in powers:
             if char_power.power.discipline != current_discipline:
                 current_discipline = char_power.power.discipline
                 output += f"\n  |c{current_discipline.name}:|n\n"
@@ -564,9 +831,8 @@ def validate_trait_for_character(character, trait_name, rating, instance_name=No
     Returns:
         Tuple (is_valid: bool, error_message: str)
     """
-    try:
-        trait = Trait.objects.get(name__iexact=trait_name)
-    except Trait.DoesNotExist:
+    trait = get_trait(trait_name)
+    if trait is None:
         # Fall back to old system validation
         trait_info = get_trait_list(trait_name)
         if not trait_info:
@@ -574,30 +840,48 @@ def validate_trait_for_character(character, trait_name, rating, instance_name=No
         # Use old system validation logic here
         return True, ""
 
+    character_splat = None
+    if trait.splat_restriction and hasattr(character, 'db') and character.db.stats:
+        character_splat = character.db.stats.get('splat', 'mortal')
+
+    error = check_trait_rating(trait, rating, character_splat, instance_name)
+    return not error, error
+
+
+def check_trait_rating(trait, rating, splat, instance_name=None):
+    """
+    Check a rating against a trait's rules, without touching the database.
+
+    Args:
+        trait: Catalog TraitEntry (see traits.catalog.get_trait)
+        rating: Desired rating
+        splat: Character type (e.g. 'vampire'), or None if unknown
+        instance_name: Instance name for instanced traits (optional)
+
+    Returns:
+        Error message, or "" if the rating is allowed
+    """
     # Check rating bounds
     if rating < trait.min_value:
-        return False, f"Rating {rating} is below minimum {trait.min_value} for {trait.name}"
+        return f"Rating {rating} is below minimum {trait.min_value} for {trait.name}"
 
     if rating > trait.max_value:
-        return False, f"Rating {rating} exceeds maximum {trait.max_value} for {trait.name}"
-
-    # Check splat restrictions
-    if trait.splat_restriction:
-        character_splat = None
-        if hasattr(character, 'db') and character.db.stats:
-            character_splat = character.db.stats.get('splat', 'mortal')
+        return f"Rating {rating} exceeds maximum {trait.max_value} for {trait.name}"
 
-        if character_splat != trait.splat_restriction:
-            return False, f"{trait.name} is only available to {trait.splat_restriction} characters"
+    # Check the trait is active and open to the splat
+    if not is_trait_available(trait, splat):
+        if not trait.is_active:
+            return f"{trait.name} is no longer available"
+        return f"{trait.name} is only available to {trait.splat_restriction} characters"
 
     # Check instanced trait requirements
     if trait.is_instanced and not instance_name:
-        return False, f"{trait.name} requires an instance name (e.g., 'Allies: Police')"
+        return f"{trait.name} requires an instance name (e.g., 'Allies: Police')"
 
     if not trait.is_instanced and instance_name:
-        return False, f"{trait.name} is not an instanced trait"
+        return f"{trait.name} is not an instanced trait"
 
-    return True, ""
+    return ""
 
 
 def enhanced_import_character_from_json(character, json_data, validate_only=False):
@@ -687,7 +971,7 @@ def enhanced_import_character_from_json(character, json_data, validate_only=Fals
     if 'discipline_powers' in json_data:
         for power_name in json_data['discipline_powers']:
             try:
-                power = DisciplinePower.objects.get(name__iexact=power_name)
+                power = DisciplinePower.objects.get(name__lower=power_name.lower())
                 can_learn, reason = can_learn_discipline_power(character, power)
 
                 if not can_learn:
@@ -732,68 +1016,120 @@ def export_character_to_json(character, include_powers=True):
     Returns:
         Dictionary containing character data in JSON-compatible format
     """
-    export_data = {
-        'name': character.key,
-        'splat': 'mortal',
-        'concept': '',
-        'xp': 0
-    }
-
-    # Get character bio if it exists
-    try:
-        bio = character.vtm_bio
-        export_data['name'] = bio.full_name or character.key
-        export_data['splat'] = bio.splat
-        export_data['concept'] = bio.concept
-    except AttributeError:
-        pass
-
-    # Export traits from both systems
-    char_traits = CharacterTrait.objects.filter(character=character)
-
-    # Group by category
-    categories = {}
-    specialties = {}
+    return next(export_characters_to_json([(character.id, character.key)], include_powers))
 
-    for char_trait in char_traits:
-        category_code = char_trait.trait.category.code
 
-        if char_trait.specialty:
-            # Handle specialties
-            if char_trait.trait.name not in specialties:
-                specialties[char_trait.trait.name] = {}
-            specialties[char_trait.trait.name][char_trait.specialty] = char_trait.rating
-        else:
-            # Handle regular traits
-            if category_code not in categories:
-                categories[category_code] = {}
+def export_characters_to_json(characters, include_powers=True):
+    """
+    Export many characters, reading their data a few queries at a time.
 
-            trait_key = char_trait.trait.name
-            if char_trait.instance_name:
-                trait_key = f"{trait_key}_{char_trait.instance_name.lower().replace(' ', '_')}"
+    Bios, traits, powers and db.stats for each batch of EXPORT_BATCH_SIZE
+    characters are read with one query apiece, as plain values rather than
+    model instances, so memory use doesn't grow with the number exported.
 
-            categories[category_code][trait_key] = char_trait.rating
+    Args:
+        characters: Iterable of (character id, key) tuples
+        include_powers: Whether to include discipline powers
 
-    # Add categories to export data
-    export_data.update(categories)
+    Yields:
+        Dictionaries as returned by export_character_to_json, in order
+    """
+    batch = []
+    for character in characters:
+        batch.append(character)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield from _export_batch(batch, include_powers)
+            batch = []
+    if batch:
+        yield from _export_batch(batch, include_powers)
+
+
+def _export_batch(characters, include_powers):
+    """Export one batch of (character id, key) tuples."""
+    from evennia.typeclasses.attributes import Attribute
+    from evennia.utils.dbserialize import from_pickle
+    from world.character_state import STATE_ATTRIBUTE, CharacterState
+
+    ids = [character_id for character_id, key in characters]
+
+    bios = {
+        row[0]: row[1:] for row in CharacterBio.objects.filter(character_id__in=ids).values_list(
+            'character_id', 'full_name', 'splat', 'concept'
+        )
+    }
 
-    # Add specialties if any
-    if specialties:
-        export_data['specialties'] = specialties
+    traits = {}
+    for row in CharacterTrait.objects.filter(character_id__in=ids).values_list(
+        'character_id', 'trait__name', 'trait__category__code', 'instance_name', 'specialty', 'rating'
+    ):
+        traits.setdefault(row[0], []).append(row[1:])
 
-    # Add discipline powers if requested
+    powers = {}
     if include_powers:
-        powers = CharacterPower.objects.filter(character=character)
-        if powers.exists():
-            export_data['discipline_powers'] = [cp.power.name for cp in powers]
-
-    # Fall back to old system for any missing data
-    if hasattr(character, 'db') and character.db.stats:
-        stats = character.db.stats
-        for category, traits_dict in stats.items():
-            if category in ['approved', 'approved_by', 'notes']:
-                continue
-            if category not in export_data and isinstance(traits_dict, dict):
-                export_data[category] = traits_dict.copy()
+        for character_id, power_name in CharacterPower.objects.filter(character_id__in=ids).values_list(
+            'character_id', 'power__name'
+        ):
+            powers.setdefault(character_id, []).append(power_name)
+
+    # Characters on the compact state keep their stats inside it
+    stats = {}
+    for character_id, attr_key, value in Attribute.objects.filter(
+        objectdb__id__in=ids, db_key__in=('stats', STATE_ATTRIBUTE), db_category__isnull=True
+    ).values_list('objectdb__id', 'db_key', 'db_value'):
+        if attr_key == STATE_ATTRIBUTE:
+            stats[character_id] = CharacterState.loads(value).get_section('stats')
+        else:
+            stats.setdefault(character_id, from_pickle(value))
+
+    for character_id, key in characters:
+        export_data = {
+            'character': key,
+            'character_id': f"#{character_id}",
+            'name': key,
+            'splat': 'mortal',
+            'concept': '',
+            'xp': 0
+        }
 
-    return export_data
+        bio = bios.get(character_id)
+        if bio:
+            full_name, export_data['splat'], export_data['concept'] = bio
+            export_data['name'] = full_name or key
+
+        # Group by category
+        categories = {}
+        specialties = {}
+
+        for trait_name, category_code, instance_name, specialty, rating in traits.get(character_id, ()):
+            if specialty:
+                # Handle specialties
+                specialties.setdefault(trait_name, {})[specialty] = rating
+            else:
+                # Handle regular traits
+                trait_key = instanced_trait_key(trait_name, instance_name) if instance_name else trait_name
+                categories.setdefault(category_code, {})[trait_key] = rating
+
+        # Add categories to export data
+        export_data.update(categories)
+
+        # Add specialties if any
+        if specialties:
+            export_data['specialties'] = specialties
+
+        # Add discipline powers if requested
+        if powers.get(character_id):
+            export_data['discipline_powers'] = powers[character_id]
+
+        # Fall back to old system for any missing data, flattened to
+        # {trait: rating} so the importer can read it back
+        character_stats = stats.get(character_id)
+        if isinstance(character_stats, Mapping):
+            fallback = {}
+            for category, trait_name, rating in _iter_stats_ratings(character_stats):
+                if category not in export_data:
+                    fallback.setdefault(category, {})[trait_name] = rating
+            export_data.update(fallback)
+            if 'specialties' not in export_data and isinstance(character_stats.get('specialties'), Mapping):
+                export_data['specialties'] = dict(character_stats['specialties'])
+
+        yield export_data
@@ -8,8 +8,14 @@ creation commands.
 
 """
 
+from contextlib import contextmanager
+
+from django.db import transaction
 from evennia.objects.objects import DefaultCharacter
 
+from world.character_state import DELETED, STATE_ATTRIBUTE, CharacterBatch, CharacterState, StateDbHolder
+from world.vitals import Vitals
+
 from .objects import ObjectParent
 
 
@@ -26,6 +32,10 @@ class Character(ObjectParent, DefaultCharacter):
     - char.db.experience: XP tracking
     - char.db.effects: Active discipline effects and conditions
 
+    These are stored together in one compact CharacterState (see
+    world.character_state) and served to char.db as views, so reading and
+    writing them works as it always has. get_state() gives typed access.
+
     See mygame/typeclasses/objects.py for a list of
     properties and methods available on all Object child classes like this.
 
@@ -38,6 +48,9 @@ class Character(ObjectParent, DefaultCharacter):
         """
         super().at_object_creation()
 
+        # The V5 dictionaries below are stored in the compact state
+        self.save_state(CharacterState())
+
         # Initialize stats structure (attributes, skills, disciplines, specialties)
         self.db.stats = {
             "attributes": {
@@ -142,6 +155,120 @@ class Character(ObjectParent, DefaultCharacter):
             "approval_job_id": None
         }
 
+    def _get_db(self):
+        """
+        Attribute handler, serving the V5 dictionaries from the character
+        state (see world.character_state.StateDbHolder).
+        """
+        try:
+            return self._state_db_holder
+        except AttributeError:
+            self._state_db_holder = StateDbHolder(self)
+            return self._state_db_holder
+
+    db = property(_get_db, DefaultCharacter.db.fset, DefaultCharacter.db.fdel)
+
+    def get_state(self):
+        """
+        Get the character's compact V5 state.
+
+        The decoded state is cached until the stored value changes.
+
+        Returns:
+            CharacterState, or None if the character still keeps the
+            legacy db dictionaries (see migrate_character_state)
+        """
+        batch = self.get_batch()
+        if batch is not None and batch.state is not None:
+            return batch.state
+        attr = self.attributes.get(STATE_ATTRIBUTE, return_obj=True)
+        if attr is None:
+            return None
+        data = attr.db_value
+        cached = getattr(self, '_state_cache', None)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        state = CharacterState.loads(data)
+        self._state_cache = (data, state)
+        return state
+
+    def save_state(self, state):
+        """
+        Store the character's compact V5 state.
+
+        Inside batch(), the state is only written when the batch ends.
+
+        Args:
+            state (CharacterState): The state to save
+        """
+        batch = self.get_batch()
+        if batch is not None:
+            batch.state = state
+            return
+        attr = self.attributes.get(STATE_ATTRIBUTE, return_obj=True)
+        if attr is None:
+            self.attributes.add(STATE_ATTRIBUTE, state.dumps())
+            attr = self.attributes.get(STATE_ATTRIBUTE, return_obj=True)
+        else:
+            # One UPDATE, as an in-place edit of an Attribute's dict makes
+            # (attributes.add would save the row twice)
+            attr.value = state.dumps()
+        self._state_cache = (attr.db_value, state)
+
+    def get_batch(self):
+        """The CharacterBatch collecting this character's writes, if any."""
+        return getattr(self, '_write_batch', None)
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect changes to the character's data and write them once.
+
+        Inside the block, changes to db.stats, db.pools, db.vampire and the
+        other V5 dictionaries, and assignments to any db attribute (such
+        as db.hunger), are kept in memory. On exit each touched Attribute
+        is saved once, all in one transaction. Batches nest; the outermost
+        one writes. If the block raises, its changes are discarded.
+
+        Example:
+            >>> with character.batch():
+            >>>     character.db.pools['superficial_damage'] += 2
+            >>>     character.db.pools['current_health'] -= 2
+            >>>     character.db.vampire['hunger'] += 1
+        """
+        if self.get_batch() is not None:
+            yield
+            return
+
+        batch = self._write_batch = CharacterBatch()
+        try:
+            yield
+        except BaseException:
+            # Forget the in-memory state so it is reloaded as stored
+            self._state_cache = None
+            raise
+        finally:
+            self._write_batch = None
+
+        with transaction.atomic():
+            for key, value in batch.attributes.items():
+                if value is DELETED:
+                    self.attributes.remove(key)
+                else:
+                    self.attributes.add(key, value)
+            if batch.state is not None:
+                self.save_state(batch.state)
+
+    def at_object_delete(self):
+        """
+        Called just before the character is deleted.
+        Drops the cached trait snapshot so it can't outlive the character.
+        """
+        from commands.v5.utils.trait_utils import drop_trait_snapshot
+
+        drop_trait_snapshot(self)
+        return super().at_object_delete()
+
     def migrate_vampire_data(self):
         """Migrate old character data to new vampire structure.
 
@@ -167,32 +294,23 @@ class Character(ObjectParent, DefaultCharacter):
             self.db.vampire['hunger'] = self.db.hunger
 
     @property
-    def hunger(self):
-        """Property for easy hunger access.
-
-        Prioritizes vampire dict but falls back to legacy location if vampire dict
-        is missing. Syncs values if they differ.
-        """
-        if self.db.vampire:
-            # Check if legacy hunger exists and differs from vampire dict
-            legacy_hunger = getattr(self.db, 'hunger', None)
-            vampire_hunger = self.db.vampire.get('hunger', 1)
-
-            # If legacy hunger is set and differs, sync to vampire dict
-            if legacy_hunger is not None and legacy_hunger != vampire_hunger:
-                self.db.vampire['hunger'] = legacy_hunger
-                return legacy_hunger
+    def vitals(self):
+        """Hunger, Humanity, Health and Willpower (see world.vitals)."""
+        try:
+            return self._vitals
+        except AttributeError:
+            self._vitals = Vitals(self)
+            return self._vitals
 
-            return vampire_hunger
-        return getattr(self.db, 'hunger', 1)
+    @property
+    def hunger(self):
+        """Property for easy hunger access (0-5)."""
+        return self.vitals.hunger
 
     @hunger.setter
     def hunger(self, value):
-        """Set hunger level."""
-        value = max(0, min(5, value))  # Clamp 0-5
-        if self.db.vampire:
-            self.db.vampire['hunger'] = value
-        self.db.hunger = value  # Keep legacy location synced
+        """Set hunger level, clamped to 0-5."""
+        self.vitals.hunger = value
 
     def get_display_shortdesc(self, looker=None, **kwargs):
         if self.db.shortdesc:
@@ -247,8 +365,7 @@ class Character(ObjectParent, DefaultCharacter):
         if looker.check_permstring("Builder"):
             if self.db.vampire and self.db.vampire.get("clan"):
                 clan = self.db.vampire["clan"]
-                hunger = self.db.vampire.get("hunger", 0)
-                name = f"{name} ({clan}, H:{hunger})"
+                name = f"{name} ({clan}, H:{self.vitals.hunger})"
 
         return name
 
@@ -268,25 +385,27 @@ class Character(ObjectParent, DefaultCharacter):
         Recalculate derived stats (health, willpower) after attribute changes.
         Call this whenever attributes are modified.
         """
-        old_health = self.db.pools["health"]
-        old_willpower = self.db.pools["willpower"]
-
-        new_health = self.calculate_health()
-        new_willpower = self.calculate_willpower()
-
-        # Update maximums
-        self.db.pools["health"] = new_health
-        self.db.pools["willpower"] = new_willpower
-
-        # Adjust current values proportionally
-        if old_health > 0:
-            health_ratio = self.db.pools["current_health"] / old_health
-            self.db.pools["current_health"] = int(new_health * health_ratio)
-        else:
-            self.db.pools["current_health"] = new_health
+        # One write for all the pool changes
+        with self.batch():
+            old_health = self.db.pools["health"]
+            old_willpower = self.db.pools["willpower"]
+
+            new_health = self.calculate_health()
+            new_willpower = self.calculate_willpower()
+
+            # Update maximums
+            self.db.pools["health"] = new_health
+            self.db.pools["willpower"] = new_willpower
+
+            # Adjust current values proportionally
+            if old_health > 0:
+                health_ratio = self.db.pools["current_health"] / old_health
+                self.db.pools["current_health"] = int(new_health * health_ratio)
+            else:
+                self.db.pools["current_health"] = new_health
 
-        if old_willpower > 0:
-            willpower_ratio = self.db.pools["current_willpower"] / old_willpower
-            self.db.pools["current_willpower"] = int(new_willpower * willpower_ratio)
-        else:
-            self.db.pools["current_willpower"] = new_willpower
+            if old_willpower > 0:
+                willpower_ratio = self.db.pools["current_willpower"] / old_willpower
+                self.db.pools["current_willpower"] = int(new_willpower * willpower_ratio)
+            else:
+                self.db.pools["current_willpower"] = new_willpower
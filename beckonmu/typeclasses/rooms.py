@@ -9,6 +9,7 @@ from evennia.typeclasses.attributes import AttributeProperty
 from evennia.objects.objects import DefaultRoom
 from evennia.utils.ansi import ANSIString
 from evennia.utils.evtable import EvTable
+from evennia.utils.utils import make_iter
 from .objects import ObjectParent
 
 from web.builder.trigger_engine import execute_triggers
@@ -23,6 +24,11 @@ class Room(ObjectParent, DefaultRoom):
 
     See examples/object.py for a list of
     properties and methods available on all Objects.
+
+    The parts of the room display that rarely change (title, exit table,
+    footer) are rendered once and reused while the room name, client
+    width and exits stay the same (see get_static_appearance); occupants
+    are rendered on every look.
     """
 
     exits_per_row = AttributeProperty(3)
@@ -86,9 +92,7 @@ class Room(ObjectParent, DefaultRoom):
         Returns a list of DefaultCharacters that should be displayed in the room for the given viewer.
         """
         characters = [
-            char
-            for char in self.contents
-            if char.has_account and char.access(looker, "view")
+            char for char in self.get_occupants() if char.access(looker, "view")
         ]
         if not characters:
             return ""
@@ -132,7 +136,7 @@ class Room(ObjectParent, DefaultRoom):
         """
         Returns a list of DefaultExits that should be displayed in the room for the given viewer.
         """
-        exits = [exit for exit in self.contents if exit.destination]
+        exits = [exit for exit in self.get_exits() if exit.destination]
 
         if not exits:
             return ""
@@ -251,26 +255,115 @@ class Room(ObjectParent, DefaultRoom):
         # Default access for non-sandbox or other access types
         return super().access(accessing_obj, access_type, default, **kwargs)
 
-    def return_appearance(self, looker, **kwargs):
+    def get_occupants(self):
         """
-        This is the hook for returning the appearance of the room.
+        Get the puppeted characters in the room.
+
+        Returns:
+            list: Characters with a connected account, in arrival order
         """
-        header = self.get_display_header(looker, **kwargs)
+        return [
+            char
+            for char in self.contents_get(content_type="character")
+            if char.has_account
+        ]
 
-        name = self.get_display_name(looker, **kwargs)
+    def get_exits(self):
+        """
+        Get the exits leading out of the room.
 
-        title = ANSIString(f"|Y[|n {name} |Y]|n").center(
-            looker.get_min_client_width(), self.styles["title"]["fill_char"]
+        Returns:
+            list: Exits, in creation order
+        """
+        return self.contents_get(content_type="exit")
+
+    def get_items(self):
+        """
+        Get the objects in the room that are neither characters nor exits.
+
+        Returns:
+            list: Objects, in arrival order
+        """
+        return self.contents_get(content_type="object")
+
+    def msg_contents(self, text=None, exclude=None, from_obj=None, mapping=None, **kwargs):
+        """
+        Emit a message to everything in the room.
+
+        Exits can't hear anything, so they are left out rather than having
+        the message parsed and sent to each of them.
+        """
+        exclude = set(make_iter(exclude)) if exclude else set()
+        exclude.update(self.get_exits())
+        return super().msg_contents(
+            text, exclude=exclude, from_obj=from_obj, mapping=mapping, **kwargs
         )
 
-        desc = self.get_display_desc(looker, **kwargs)
+    def get_exit_signature(self, looker):
+        """
+        What the exit table is drawn from, as a hashable tuple.
 
-        character_section = self.get_display_characters(looker, **kwargs)
+        Exit names come through get_display_name, so monikers, display
+        tags and the looker's OOC view are covered, and the destinations
+        are included so @link and @unlink show up on the next look.
+        """
+        return (self.exits_per_row,) + tuple(
+            (exit.id, exit.db_destination_id, exit.get_display_name(looker))
+            for exit in self.get_exits()
+        )
+
+    def get_static_appearance(self, looker, **kwargs):
+        """
+        Get the title, exit section and footer of the room display.
+
+        These are cached per client width and rendered again when the room
+        name or the exit signature (see get_exit_signature) changes.
+
+        Returns:
+            tuple: (title, exit_section, footer)
+        """
+        if kwargs:
+            # Custom look options may change any part; don't cache them
+            return self._render_static_appearance(looker, **kwargs)
+
+        name = self.get_display_name(looker)
+        width = looker.get_min_client_width()
+        signature = (name, self.get_exit_signature(looker))
+        cache = getattr(self, "_appearance_cache", None)
+        if cache is None:
+            cache = self._appearance_cache = {}
+        cached = cache.get(width)
+        if cached is None or cached[0] != signature:
+            cached = cache[width] = (signature, self._render_static_appearance(looker, name=name))
+        return cached[1]
+
+    def _render_static_appearance(self, looker, name=None, **kwargs):
+        """Render the parts get_static_appearance caches."""
+        if name is None:
+            name = self.get_display_name(looker, **kwargs)
+
+        title = ANSIString(f"|Y[|n {name} |Y]|n").center(
+            looker.get_min_client_width(), self.styles["title"]["fill_char"]
+        )
 
         exit_section = self.get_display_exits(looker, **kwargs)
 
         footer = self.get_display_footer(looker, **kwargs)
 
+        return title, exit_section, footer
+
+    def return_appearance(self, looker, **kwargs):
+        """
+        This is the hook for returning the appearance of the room.
+        """
+        header = self.get_display_header(looker, **kwargs)
+
+        title, exit_section, footer = self.get_static_appearance(looker, **kwargs)
+
+        desc = self.get_display_desc(looker, **kwargs)
+
+        character_section = self.get_display_characters(looker, **kwargs)
+
         return ANSIString("\n\n").join(
             s
             for s in [header, title, desc, character_section, exit_section, footer]
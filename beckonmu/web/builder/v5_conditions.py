@@ -98,6 +98,18 @@ CONDITION_TYPES = {
             "value": {"type": "number", "min": 0, "max": 5, "required": True},
         },
     },
+    "room_occupancy": {
+        "label": "Characters Present",
+        "description": "Check how many player characters are in the room",
+        "parameters": {
+            "operator": {
+                "type": "select",
+                "options": ["eq", "lt", "lte", "gt", "gte"],
+                "required": True,
+            },
+            "value": {"type": "number", "min": 0, "required": True},
+        },
+    },
     "probability": {
         "label": "Random Chance",
         "description": "Random chance for trigger to fire (percentage)",
@@ -151,6 +163,11 @@ def check_condition(
                 room, parameters.get("operator"), parameters.get("value")
             )
 
+        elif condition_type == "room_occupancy":
+            return _check_room_occupancy(
+                room, parameters.get("operator"), parameters.get("value")
+            )
+
         elif condition_type == "probability":
             return _check_probability(parameters.get("chance", 100))
 
@@ -202,11 +219,12 @@ def _check_character_hunger(character, operator: str, value: int) -> bool:
 
     # Get hunger from character traits
     try:
-        from traits.models import CharacterTrait, Trait
+        from traits.catalog import get_trait
+        from traits.models import CharacterTrait
 
-        hunger_trait = Trait.objects.get(name="Hunger")
+        hunger_trait = get_trait("Hunger")
         char_hunger = CharacterTrait.objects.get(
-            character_id=character.id, trait=hunger_trait
+            character_id=character.id, trait_id=hunger_trait.id
         )
         hunger_value = char_hunger.rating
     except Exception:
@@ -247,6 +265,14 @@ def _check_room_danger(room, operator: str, value: int) -> bool:
     return _compare(danger, operator, value)
 
 
+def _check_room_occupancy(room, operator: str, value: int) -> bool:
+    """Check how many player characters are in the room."""
+    if not room or not hasattr(room, "get_occupants"):
+        return False
+
+    return _compare(len(room.get_occupants()), operator, value)
+
+
 def _check_probability(chance: int) -> bool:
     """Random chance check."""
     import random
@@ -0,0 +1,115 @@
+"""
+Character State Microbenchmark
+
+Measures what storing a character's V5 data costs before and after the
+compact character state: the stored size, the serialization work behind
+one Health write, and decoding everything when the character loads.
+"Before" is the eight legacy db dictionaries, each pickled into its own
+Attribute; "after" is one CharacterState. Database round trips are the
+same one UPDATE either way and are not included.
+
+Run from `evennia shell`:
+
+    >>> from world.state_benchmark import run_benchmark
+    >>> run_benchmark()
+"""
+
+import pickle
+import timeit
+from typing import Dict
+
+from evennia.utils.dbserialize import from_pickle, to_pickle
+
+from .character_state import CharacterState
+
+
+def _sample_sections(history):
+    """Legacy dictionaries of a played character with `history` XP entries."""
+    return {
+        'stats': {
+            'attributes': {
+                'physical': {'strength': 3, 'dexterity': 2, 'stamina': 3},
+                'social': {'charisma': 2, 'manipulation': 2, 'composure': 3},
+                'mental': {'intelligence': 4, 'wits': 3, 'resolve': 3},
+            },
+            'skills': {'brawl': 3, 'occult': 2, 'investigation': 2, 'stealth': 1, 'insight': 2},
+            'disciplines': {'auspex': {'level': 2, 'powers': ['Heightened Senses', 'Sense the Unseen']}},
+            'specialties': {'occult': ['Ghosts']},
+        },
+        'vampire': {
+            'clan': 'Tremere', 'generation': 12, 'blood_potency': 1, 'hunger': 2, 'humanity': 7,
+            'predator_type': 'Consensualist', 'bane': 'Blood Bond', 'sire': 'Unknown',
+        },
+        'pools': {'health': 6, 'willpower': 5, 'current_health': 6, 'current_willpower': 5,
+                  'superficial_damage': 0, 'aggravated_damage': 0},
+        'humanity_data': {'convictions': ['Never harm a child'], 'touchstones': ['Maria'], 'stains': 0},
+        'advantages': {'backgrounds': {'herd': 2, 'resources': 3}, 'merits': {'Beautiful': 2}, 'flaws': {}},
+        'experience': {
+            'total_earned': history, 'current': 5,
+            'history': [
+                {'type': 'earned', 'amount': 1, 'reason': f'Session {i}', 'approved_by': 'Staff'}
+                for i in range(history)
+            ],
+        },
+        'effects': [],
+        'active_effects': [{'name': 'Heightened Senses', 'expires': 1700000000.5}],
+    }
+
+
+def _store(value):
+    """Serialize a value the way an Attribute stores it."""
+    return pickle.dumps(to_pickle(value), pickle.HIGHEST_PROTOCOL)
+
+
+def run_benchmark(history: int = 300, number: int = 2000) -> Dict[str, float]:
+    """
+    Compare the legacy dictionaries with the compact state.
+
+    Args:
+        history: XP log entries on the sample character
+        number: Operations timed for each measurement
+
+    Returns:
+        Dictionary of results:
+            - 'before_bytes' / 'after_bytes' (int): Stored size
+            - 'before_write' / 'after_write' (float): Microseconds to
+              serialize one current_health change
+            - 'before_load' / 'after_load' (float): Microseconds to decode
+              all of the character's V5 data
+    """
+    sections = _sample_sections(history)
+    state = CharacterState.from_legacy(sections)
+    legacy_blobs = [_store(value) for value in sections.values()]
+    state_blob = _store(state.dumps())
+
+    pools = sections['pools']
+
+    def legacy_write():
+        pools['current_health'] = 5 - pools['current_health']
+        _store(pools)
+
+    def state_write():
+        value = state.get_section('pools')
+        value['current_health'] = 5 - value['current_health']
+        state.set_section('pools', value)
+        _store(state.dumps())
+
+    def per_op(func):
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        return seconds / number * 1_000_000
+
+    results = {
+        'before_bytes': sum(len(blob) for blob in legacy_blobs),
+        'after_bytes': len(state_blob),
+        'before_write': per_op(legacy_write),
+        'after_write': per_op(state_write),
+        'before_load': per_op(lambda: [from_pickle(pickle.loads(blob)) for blob in legacy_blobs]),
+        'after_load': per_op(lambda: CharacterState.loads(pickle.loads(state_blob))),
+    }
+
+    print(f"Character state benchmark: {history} XP log entries")
+    print(f"  Stored size:   {results['before_bytes']} -> {results['after_bytes']} bytes")
+    print(f"  Health write:  {results['before_write']:.1f} -> {results['after_write']:.1f} us")
+    print(f"  Full decode:   {results['before_load']:.1f} -> {results['after_load']:.1f} us")
+
+    return results
@@ -14,9 +14,9 @@ This skeleton defines the API and basic structure only.
 See V5_REFERENCE_DATABASE.md for complete dice mechanics.
 """
 
-import random
 from typing import Dict, List, Tuple, Optional
 
+from dice.core import DiceTally, roll_dice, roll_rouse_die
 from world.v5_data import BLOOD_POTENCY, DISCIPLINES, RESONANCES, FRENZY_TRIGGERS
 from world.ansi_theme import (
     DICE_CRITICAL, DICE_SUCCESS, DICE_FAILURE,
@@ -50,19 +50,19 @@ class DiceResult:
         self.hunger_dice = hunger_dice
         self.difficulty = difficulty
 
+        # Single pass over the dice, shared with every other roller
+        tally = DiceTally(normal_dice, hunger_dice)
+
         # Calculate successes (6+ on any die)
-        self.normal_successes = sum(1 for d in normal_dice if d >= 6)
-        self.hunger_successes = sum(1 for d in hunger_dice if d >= 6)
-        self.successes = self.normal_successes + self.hunger_successes
+        self.normal_successes = tally.regular_successes
+        self.hunger_successes = tally.hunger_successes
+        self.successes = tally.successes
 
         # Calculate criticals (pairs of 10s)
-        normal_tens = sum(1 for d in normal_dice if d == 10)
-        hunger_tens = sum(1 for d in hunger_dice if d == 10)
-        total_tens = normal_tens + hunger_tens
-        self.criticals = total_tens // 2  # Each pair = 1 critical (+2 successes)
+        self.criticals = tally.tens // 2  # Each pair = 1 critical (+2 successes)
 
         # Messy Critical: At least one pair includes a Hunger die
-        self.is_messy = (self.criticals > 0) and (hunger_tens > 0)
+        self.is_messy = (self.criticals > 0) and (tally.hunger_tens > 0)
 
         # Bestial Failure: Total failure (0 successes) with Hunger dice present
         self.is_bestial = (self.successes == 0) and (len(hunger_dice) > 0)
@@ -112,11 +112,9 @@ def roll_pool(
     # Determine how many dice are Hunger dice
     # Hunger dice replace normal dice, up to the pool size
     num_hunger_dice = min(hunger, pool)
-    num_normal_dice = pool - num_hunger_dice
 
     # Roll dice
-    normal_dice = [random.randint(1, 10) for _ in range(num_normal_dice)]
-    hunger_dice = [random.randint(1, 10) for _ in range(num_hunger_dice)]
+    normal_dice, hunger_dice = roll_dice(pool, num_hunger_dice)
 
     # Create and return result
     return DiceResult(normal_dice, hunger_dice, difficulty)
@@ -138,8 +136,7 @@ def rouse_check(character) -> Tuple[bool, int, int]:
     Returns:
         Tuple[bool, int, int]: (success, die_result, rerolls_available)
     """
-    die_result = random.randint(1, 10)
-    success = die_result >= 6
+    die_result, success = roll_rouse_die()
 
     rerolls_available = 0
     if not success:
@@ -162,8 +159,7 @@ def rouse_reroll(character) -> Tuple[bool, int]:
     Returns:
         Tuple[bool, int]: (success, die_result)
     """
-    die_result = random.randint(1, 10)
-    success = die_result >= 6
+    die_result, success = roll_rouse_die()
     return success, die_result
 
 
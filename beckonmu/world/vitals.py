@@ -0,0 +1,200 @@
+"""
+Character Vitals
+
+One place to read and change a character's Hunger, Humanity, Stains,
+Health and Willpower. Values live in the typed fields of the compact
+character state (see world.character_state), so reading one doesn't
+rebuild any dictionary, and there is only one Hunger: for characters on
+the state, db.hunger, db.vampire['hunger'] and character.hunger are all
+the same value.
+
+Every change sends the vital_changed signal, so displays and caches can
+update when a value changes instead of polling for it:
+
+    from world.vitals import vital_changed
+
+    def on_vital_changed(sender, character, vital, old, new, **kwargs):
+        ...
+
+    vital_changed.connect(on_vital_changed)
+
+Writes through the legacy dictionaries (db.pools['current_health'] -= 1)
+send it too.
+
+Usage:
+    character.vitals.hunger
+    character.vitals.set('hunger', 3)
+    character.vitals.adjust('current_willpower', -1)
+"""
+
+from collections.abc import Mapping
+
+from django.dispatch import Signal
+
+from .character_state import MISSING
+
+
+# Sent after a vital changes, with character, vital, old and new. Inside
+# character.batch() it is sent straight away, before the batch is saved.
+vital_changed = Signal()
+
+# Vital -> (db section, default, minimum, maximum or None)
+VITALS = {
+    'hunger': ('vampire', 1, 0, 5),
+    'humanity': ('vampire', 7, 0, 10),
+    'stains': ('humanity_data', 0, 0, 10),
+    'health': ('pools', 3, 0, None),
+    'current_health': ('pools', 3, 0, None),
+    'superficial_damage': ('pools', 0, 0, None),
+    'aggravated_damage': ('pools', 0, 0, None),
+    'willpower': ('pools', 3, 0, None),
+    'current_willpower': ('pools', 3, 0, None),
+}
+
+# db section -> vitals stored in it
+SECTION_VITALS = {}
+for _name, (_section, *_) in VITALS.items():
+    SECTION_VITALS.setdefault(_section, []).append(_name)
+
+
+def get_vitals(obj):
+    """
+    The Vitals of a Character, or None for other objects.
+
+    Args:
+        obj: Any object
+
+    Returns:
+        Vitals or None
+    """
+    if getattr(type(obj), 'vitals', None) is None:
+        return None
+    return obj.vitals
+
+
+def section_vitals(state, section):
+    """The vitals stored in one section of a state, as {name: value}."""
+    return {name: getattr(state, name) for name in SECTION_VITALS.get(section, ())}
+
+
+def notify_changes(character, before, after):
+    """
+    Send vital_changed for each vital that differs between two
+    section_vitals() results.
+    """
+    for name, old in before.items():
+        old, new = _value(name, old), _value(name, after[name])
+        if new != old:
+            _send(character, name, old, new)
+
+
+def _value(name, value):
+    """A stored vital, with the default standing in for a missing one."""
+    if value is MISSING or value is None:
+        return VITALS[name][1]
+    return value
+
+
+def _send(character, name, old, new):
+    vital_changed.send(sender=type(character), character=character, vital=name, old=old, new=new)
+
+
+class Vitals:
+    """
+    A character's vitals.
+
+    Use character.vitals rather than creating one.
+    """
+
+    __slots__ = ('character',)
+
+    def __init__(self, character):
+        self.character = character
+
+    def get(self, name):
+        """
+        Get a vital.
+
+        Args:
+            name: One of VITALS
+
+        Returns:
+            int: The value, or the vital's default if unset
+        """
+        section = VITALS[name][0]
+        state = self.character.get_state()
+        if state is not None:
+            return _value(name, getattr(state, name))
+
+        # Not yet on the state: the legacy dictionaries, where the old
+        # db.hunger (kept in step by set()) overrides db.vampire['hunger']
+        if name == 'hunger' and self.character.db.hunger is not None:
+            return self.character.db.hunger
+        data = getattr(self.character.db, section)
+        value = data.get(name) if isinstance(data, Mapping) else None
+        return _value(name, value)
+
+    def set(self, name, value):
+        """
+        Set a vital, clamped to its range.
+
+        Args:
+            name: One of VITALS
+            value (int): New value
+
+        Returns:
+            int: The value set
+        """
+        section, default, low, high = VITALS[name]
+        value = max(low, int(value))
+        if high is not None:
+            value = min(high, value)
+
+        old = self.get(name)
+        state = self.character.get_state()
+        if state is not None:
+            if section in state.extras:
+                setattr(state, name, value)
+                # A copy left among the section's untyped keys would shadow it
+                state.drop_extra(section, name)
+            else:
+                # Section missing (or not a dict): start it afresh
+                state.set_section(section, {name: value})
+            self.character.save_state(state)
+        else:
+            data = getattr(self.character.db, section)
+            if isinstance(data, Mapping):
+                data[name] = value
+            else:
+                setattr(self.character.db, section, {name: value})
+            if name == 'hunger' and self.character.attributes.has('hunger'):
+                self.character.db.hunger = value
+
+        if value != old:
+            _send(self.character, name, old, value)
+        return value
+
+    def adjust(self, name, amount):
+        """
+        Change a vital by an amount, clamped to its range.
+
+        Returns:
+            int: The new value
+        """
+        return self.set(name, self.get(name) + amount)
+
+    def all(self):
+        """All vitals, as {name: value}."""
+        return {name: self.get(name) for name in VITALS}
+
+
+def _vital_property(name):
+    return property(
+        lambda self: self.get(name),
+        lambda self, value: self.set(name, value),
+        doc=f"The character's {name.replace('_', ' ')}.",
+    )
+
+
+for _name in VITALS:
+    setattr(Vitals, _name, _vital_property(_name))